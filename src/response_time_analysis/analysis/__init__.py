@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
+from fractions import Fraction
 from itertools import takewhile
+from math import ceil, floor
+from os import cpu_count
 
-from ..model import Duration, Task, TaskSet
+from ..model import Duration, StepBound, SupplyModel, Task, TaskSet, Work
+from .budget import Budget as Budget
+from .budget import BudgetExhausted as BudgetExhausted
 
 
 @dataclass
@@ -14,11 +21,23 @@ class Solution:
     busy_window_bound: Duration | None
     search_space: tuple[tuple[Duration, Duration | None, Duration | None], ...] | None
     response_time_bound: Duration | None
+    # Whether the analysis was cut short by its budget, in which case the search
+    # space (if any) holds only the offsets solved so far.
+    budget_exhausted: bool = False
 
     @staticmethod
     def no_search_space_found(ts: TaskSet, tua: Task) -> Solution:
         return Solution(ts, tua, None, None, None)
 
+    @staticmethod
+    def exhausted(
+        ts: TaskSet,
+        tua: Task,
+        bw_bound: Duration | None = None,
+        sp: tuple[tuple[Duration, Duration | None, Duration | None], ...] | None = None,
+    ) -> Solution:
+        return Solution(ts, tua, bw_bound, sp, None, budget_exhausted=True)
+
     @staticmethod
     def from_search_space(
         ts: TaskSet,
@@ -48,3 +67,140 @@ def sparse_finite_search_space(
         if upper_bound is not None
         else None
     )
+
+
+def busy_window_horizon(
+    demand: StepBound,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    blocking: Work = 0,
+) -> Duration | None:
+    """A horizon for the least solution L of blocking + demand(L) <= supply(L).
+
+    If the long-term rate U of the demand is below the long-term supply rate R,
+    then for any L >= (blocking + B + S) / (R - U), where B is the burst of the
+    demand and S the supply deficit,
+
+        blocking + demand(L) <= blocking + U * L + B <= R * L - S <= supply(L),
+
+    so the least solution cannot exceed this bound. Conversely, if U > R, then for
+    any L > (D + E - blocking) / (U - R), where D is the deficit of the demand and
+    E the supply surplus,
+
+        blocking + demand(L) >= blocking + U * L - D > R * L + E >= supply(L),
+
+    so there is no solution beyond this bound. (The demand may still fall behind
+    the supply before its long-term rate shows, so a smaller solution may exist.)
+    If U == R, the same holds for any L if blocking > D + E, and otherwise no
+    bound follows from the rates; e.g., a fully utilized processor may or may not
+    idle eventually. Returns the smaller of the bound (if any) and the given
+    horizon.
+    """
+    rate = demand.long_term_rate()
+    return rate_based_horizon(
+        rate,
+        demand.burst(),
+        supply,
+        horizon,
+        blocking,
+        demand.deficit() if rate >= supply.long_term_rate() else None,
+    )
+
+
+def rate_based_horizon(
+    demand_rate: Fraction,
+    demand_burst: Fraction,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    blocking: Work = 0,
+    demand_deficit: Fraction | None = None,
+) -> Duration | None:
+    """Like busy_window_horizon(), but for a demand given only by its long-term
+    rate, burst, and deficit, e.g., when these are maintained incrementally. The
+    deficit is needed only if the demand rate is at least the supply rate; without
+    it, the given horizon is returned in that case."""
+    supply_rate = supply.long_term_rate()
+    if demand_rate < supply_rate:
+        slack = blocking + demand_burst + supply.supply_deficit()
+        bound = max(1, ceil(slack / (supply_rate - demand_rate)))
+    elif demand_deficit is None:
+        return horizon
+    else:
+        # no solution beyond the bound, and none at all (bound 0) if the demand
+        # exceeds the supply everywhere
+        excess = demand_deficit + supply.supply_surplus() - blocking
+        if demand_rate == supply_rate:
+            if excess >= 0:
+                return horizon
+            bound = 0
+        else:
+            bound = max(0, floor(excess / (demand_rate - supply_rate)))
+    return bound if horizon is None else min(horizon, bound)
+
+
+def solve_search_space(
+    ts: TaskSet,
+    tua: Task,
+    bw_bound: Duration,
+    points: Iterable[tuple[Duration, Duration | None, Duration | None]],
+) -> Solution:
+    """The solution for the given, lazily solved points of the search space. If the
+    budget is exhausted on the way, the solution records the points solved so far."""
+    solved: list[tuple[Duration, Duration | None, Duration | None]] = []
+    try:
+        # not solved.extend(points), which might drop the points solved so far
+        for point in points:
+            solved.append(point)  # noqa: PERF402
+    except BudgetExhausted:
+        return Solution.exhausted(ts, tua, bw_bound, tuple(solved))
+    return Solution.from_search_space(ts, tua, bw_bound, tuple(solved))
+
+
+# How often (in seconds) solve_in_chunks() checks the budget while it waits.
+BUDGET_POLL_INTERVAL = 0.01
+
+
+def solve_in_chunks(
+    executor: Executor,
+    solve_offsets: Callable[
+        ..., tuple[tuple[Duration, Duration | None, Duration | None], ...]
+    ],
+    args: tuple[object, ...],
+    offsets: tuple[Duration, ...],
+    chunk_size: int | None = None,
+    budget: Budget | None = None,
+) -> Iterator[tuple[Duration, Duration | None, Duration | None]]:
+    """Split the search space into contiguous chunks of chunk_size offsets, solve
+    each chunk with solve_offsets(*args, chunk) on the executor, and yield the
+    results in order. By default, the search space is split into four chunks per
+    CPU. For a process pool, solve_offsets and args must be picklable.
+
+    The budget (if any) is checked while waiting for each chunk. Once it is
+    exhausted, the pending chunks are cancelled (chunks that are already running
+    complete in the background) and BudgetExhausted is raised."""
+    if chunk_size is None:
+        chunk_size = ceil(len(offsets) / (4 * (cpu_count() or 1)))
+    chunk_size = max(1, chunk_size)
+    futures = [
+        executor.submit(solve_offsets, *args, offsets[i : i + chunk_size])
+        for i in range(0, len(offsets), chunk_size)
+    ]
+
+    def wait_for(
+        future: Future[tuple[tuple[Duration, Duration | None, Duration | None], ...]],
+    ) -> tuple[tuple[Duration, Duration | None, Duration | None], ...]:
+        if budget is None:
+            return future.result()
+        while True:
+            budget.check()
+            try:
+                return future.result(timeout=BUDGET_POLL_INTERVAL)
+            except FutureTimeoutError:  # not the builtin before Python 3.11
+                pass
+
+    try:
+        for future in futures:
+            yield from wait_for(future)
+    finally:
+        for future in futures:
+            _ = future.cancel()
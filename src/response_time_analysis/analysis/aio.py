@@ -0,0 +1,165 @@
+"""An asyncio facade for the analyses.
+
+AsyncAnalyzer runs analyses on a managed thread pool and awaits them without
+blocking the event loop. Each request may have its own timeout. Identical
+requests that are in flight at the same time are coalesced into a single
+computation, keyed on the fingerprints of the task set and the supply model,
+the policy, the task under analysis, and the horizon. A computation is cancelled
+(via its Budget, which the solvers check as they go) as soon as no request
+awaits it anymore.
+
+An AsyncAnalyzer must be used from a single event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from types import TracebackType
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from ..model import Duration, SupplyModel, Task, TaskSet
+from . import Budget, Solution, fifo
+from .batch import Job
+from .parallel import Policy, per_task_analysis
+
+if TYPE_CHECKING:
+    from typing import Self
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Computation(Generic[T]):
+    "A computation in flight and the number of requests awaiting it."
+
+    future: asyncio.Future[T]
+    budget: Budget
+    waiters: int = 0
+
+
+class AsyncAnalyzer:
+    """Runs analyses on a pool of at most max_workers threads (by default, as many
+    as ThreadPoolExecutor chooses) on behalf of asyncio tasks."""
+
+    def __init__(self, max_workers: int | None = None):
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers)
+        # the computations in flight for rta() and rta_all(), respectively
+        self._solutions: dict[Hashable, _Computation[Solution]] = {}
+        self._all_solutions: dict[Hashable, _Computation[tuple[Solution, ...]]] = {}
+
+    async def rta(
+        self,
+        all_tasks: TaskSet,
+        task_under_analysis: Task,
+        supply: SupplyModel,
+        policy: Policy,
+        horizon: Duration | None = None,
+        timeout: float | None = None,
+    ) -> Solution:
+        """Response-time analysis of the task under analysis under the given
+        scheduling policy, as by the policy's rta().
+
+        Raises TimeoutError if no solution is found within timeout seconds. The
+        solution of coalesced requests is shared, so it refers to the task set of
+        the request that started the computation."""
+
+        if policy == "fifo":
+            # the FIFO bound is attributed to the first task
+            def analyze(budget: Budget) -> Solution:
+                solution = fifo.rta(all_tasks, supply, horizon, budget)
+                return replace(solution, task_under_analysis=task_under_analysis)
+        else:
+            analysis = per_task_analysis(policy)
+
+            def analyze(budget: Budget) -> Solution:
+                return analysis(
+                    all_tasks, task_under_analysis, supply, horizon, budget=budget
+                )
+
+        key = (
+            policy,
+            all_tasks.fingerprint(),
+            all_tasks.index_of(task_under_analysis),
+            supply.fingerprint(),
+            horizon,
+        )
+        return await self._run(self._solutions, key, analyze, timeout)
+
+    async def rta_all(
+        self,
+        all_tasks: TaskSet,
+        supply: SupplyModel,
+        policy: Policy,
+        horizon: Duration | None = None,
+        timeout: float | None = None,
+    ) -> tuple[Solution, ...]:
+        """Response-time analysis of all tasks in the task set under the given
+        scheduling policy, as by the policy's rta_all().
+
+        Raises TimeoutError if the analysis does not complete within timeout
+        seconds. The solutions of coalesced requests are shared."""
+
+        job = Job(all_tasks, policy, supply, horizon)
+        key = (policy, all_tasks.fingerprint(), supply.fingerprint(), horizon)
+        return await self._run(self._all_solutions, key, job.run, timeout)
+
+    async def _run(
+        self,
+        in_flight: dict[Hashable, _Computation[T]],
+        key: Hashable,
+        analyze: Callable[[Budget], T],
+        timeout: float | None,
+    ) -> T:
+        computation = in_flight.get(key)
+        if computation is None:
+            budget = Budget()
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, analyze, budget
+            )
+            computation = _Computation(future, budget)
+            in_flight[key] = computation
+            future.add_done_callback(lambda _: _forget(in_flight, key, computation))
+
+        computation.waiters += 1
+        try:
+            # the shield keeps the computation running for the other requests
+            return await asyncio.wait_for(asyncio.shield(computation.future), timeout)
+        except asyncio.TimeoutError:  # not the builtin before Python 3.11
+            raise TimeoutError(f"no result within {timeout} seconds") from None
+        finally:
+            computation.waiters -= 1
+            if computation.waiters == 0 and not computation.future.done():
+                # Nobody awaits the computation anymore, so stop the solvers.
+                computation.budget.cancel()
+                _forget(in_flight, key, computation)
+
+    def close(self) -> None:
+        "Cancel all computations in flight and shut down the thread pool."
+        for in_flight in (self._solutions, self._all_solutions):
+            for computation in in_flight.values():
+                computation.budget.cancel()
+            in_flight.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _forget(
+    in_flight: dict[Hashable, _Computation[T]],
+    key: Hashable,
+    computation: _Computation[T],
+) -> None:
+    if in_flight.get(key) is computation:
+        del in_flight[key]
@@ -0,0 +1,203 @@
+"""Batch analysis of many task sets on a pool of worker processes.
+
+Jobs are shipped to the workers in chunks to amortize the cost of pickling,
+and only a bounded number of chunks is in flight at any time, so that jobs can
+be drawn lazily from unbounded generators with flat memory use. The results
+are yielded in the order of the jobs.
+
+For a single large task set, rta_all_shared() places the task set in shared
+memory once and sends the workers only a handle and the index of the task under
+analysis.
+"""
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from os import cpu_count
+from typing import TypeAlias
+
+from ..model import Duration, SupplyModel, TaskSet
+from ..model.packed import SharedTaskSet, SharedTaskSetHandle
+from . import Budget, Solution, edf, fifo, fp
+from .parallel import Policy, per_task_analysis
+
+
+@dataclass(frozen=True)
+class Job:
+    """The analysis of all tasks of a task set under a scheduling policy."""
+
+    taskset: TaskSet
+    policy: Policy
+    supply: SupplyModel
+    horizon: Duration | None = None
+
+    def run(self, budget: Budget | None = None) -> tuple[Solution, ...]:
+        """Analyze all tasks of the task set, in the order of the task set."""
+        if self.policy == "fp":
+            return fp.rta_all(self.taskset, self.supply, self.horizon, budget=budget)
+        if self.policy == "edf":
+            return edf.rta_all(self.taskset, self.supply, self.horizon, budget=budget)
+        if self.policy == "fifo":
+            return fifo.rta_all(self.taskset, self.supply, self.horizon, budget)
+        raise ValueError(f"unknown scheduling policy: {self.policy!r}")
+
+
+# a Job, or its fields as a (taskset, policy, supply[, horizon]) tuple
+JobLike: TypeAlias = (
+    Job
+    | tuple[TaskSet, Policy, SupplyModel]
+    | tuple[TaskSet, Policy, SupplyModel, Duration | None]
+)
+
+
+def _as_job(job: JobLike) -> Job:
+    if isinstance(job, Job):
+        return job
+    if len(job) == 3:
+        taskset, policy, supply = job
+        return Job(taskset, policy, supply)
+    taskset, policy, supply, horizon = job
+    return Job(taskset, policy, supply, horizon)
+
+
+def _run_chunk(chunk: list[Job]) -> list[tuple[Solution, ...]]:
+    return [job.run() for job in chunk]
+
+
+def rta_batch(
+    jobs: Iterable[JobLike],
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    max_chunks_in_flight: int | None = None,
+    progress: Callable[[int], None] | None = None,
+    executor: Executor | None = None,
+) -> Generator[tuple[Solution, ...], None, None]:
+    """Analyze each job on a pool of worker processes and yield the solutions
+    of all tasks of each job, in the order of the jobs.
+
+    Jobs may be given as Job instances or as (taskset, policy, supply[, horizon])
+    tuples. They are drawn lazily and sent to the workers in chunks of
+    chunk_size jobs, with at most max_chunks_in_flight chunks submitted but not
+    yet yielded (by default, twice max_workers or the number of CPUs). After each chunk,
+    progress (if given) is called with the number of jobs completed so far.
+
+    By default, a new ProcessPoolExecutor with max_workers processes is used
+    and shut down when the iterator is exhausted or closed. A given executor is
+    used as is and left running. An exception raised by an analysis is
+    re-raised when its job's results are reached. The solutions refer to the
+    copies of the task sets that were unpickled from the workers.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    if max_chunks_in_flight is None:
+        max_chunks_in_flight = 2 * (max_workers or cpu_count() or 1)
+    if max_chunks_in_flight < 1:
+        raise ValueError("max_chunks_in_flight must be positive")
+
+    job_iter = map(_as_job, jobs)
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers)
+    in_flight: deque[Future[list[tuple[Solution, ...]]]] = deque()
+    completed = 0
+
+    def submit_next_chunk() -> bool:
+        chunk = list(islice(job_iter, chunk_size))
+        if chunk:
+            in_flight.append(pool.submit(_run_chunk, chunk))
+        return bool(chunk)
+
+    try:
+        while len(in_flight) < max_chunks_in_flight and submit_next_chunk():
+            pass
+        while in_flight:
+            results = in_flight.popleft().result()
+            _ = submit_next_chunk()
+            completed += len(results)
+            if progress is not None:
+                progress(completed)
+            yield from results
+    finally:
+        for future in in_flight:
+            _ = future.cancel()
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+
+_SearchSpace = tuple[tuple[Duration, Duration | None, Duration | None], ...]
+
+
+def _run_shared(
+    handle: SharedTaskSetHandle,
+    index: int,
+    policy: Policy,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+) -> tuple[Duration | None, _SearchSpace | None, Duration | None]:
+    all_tasks = handle.attach()
+    analysis = per_task_analysis(policy)
+    sol = analysis(
+        all_tasks, all_tasks.tasks[index], supply, horizon, use_poet_search_space
+    )
+    # The caller still holds the task set, so only the results are sent back.
+    return sol.busy_window_bound, sol.search_space, sol.response_time_bound
+
+
+def rta_all_shared(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    policy: Policy,
+    horizon: Duration | None = None,
+    # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+    use_poet_search_space: bool = False,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> tuple[Solution, ...]:
+    """Response-time analysis of all tasks in the task set under the given
+    scheduling policy on a pool of worker processes, returned in the order of
+    the task set.
+
+    The task set is packed into shared memory once (see model.packed), and each
+    worker unpacks it once. The per-task analyses are sent only a handle to it
+    and the index of the task under analysis, and their solutions refer to the
+    given task set. The pool is chosen as in rta_batch().
+    """
+
+    assert not all_tasks.is_empty()
+
+    if policy == "fifo":
+        # The FIFO bound does not depend on the task under analysis.
+        return fifo.rta_all(all_tasks, supply, horizon)
+    # reject unknown policies before starting any workers
+    _ = per_task_analysis(policy)
+
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers)
+    try:
+        with SharedTaskSet(all_tasks) as shared:
+            futures = [
+                pool.submit(
+                    _run_shared,
+                    shared.handle,
+                    i,
+                    policy,
+                    supply,
+                    horizon,
+                    use_poet_search_space,
+                )
+                for i in range(len(all_tasks))
+            ]
+            try:
+                results = [f.result() for f in futures]
+            finally:
+                for future in futures:
+                    _ = future.cancel()
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+    return tuple(
+        Solution(all_tasks, tua, *result) for tua, result in zip(all_tasks, results)
+    )
@@ -0,0 +1,42 @@
+"""Cooperative time budgets and cancellation for the analyses.
+
+The solvers and the analyses check a Budget as they go and raise BudgetExhausted
+once it has expired or been cancelled. The analyses catch it and return a
+Solution marked as budget_exhausted that records the progress made so far.
+"""
+
+from threading import Event
+from time import monotonic
+
+
+class BudgetExhausted(Exception):
+    "Raised by Budget.check() once the budget has expired or been cancelled."
+
+
+class Budget:
+    """A time budget of the given number of seconds (None = unlimited), starting
+    now. It can also be cancelled at any time, e.g., from another thread."""
+
+    def __init__(self, seconds: float | None = None):
+        self.deadline: float | None = None if seconds is None else monotonic() + seconds
+        self._cancelled: Event = Event()
+
+    def cancel(self) -> None:
+        "Exhaust the budget immediately."
+        self._cancelled.set()
+
+    def remaining(self) -> float | None:
+        "The remaining time in seconds (None = unlimited), which is 0 once exhausted."
+        if self._cancelled.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - monotonic())
+
+    def exhausted(self) -> bool:
+        return self.remaining() == 0.0
+
+    def check(self) -> None:
+        "Raise BudgetExhausted if the budget has expired or been cancelled."
+        if self.exhausted():
+            raise BudgetExhausted()
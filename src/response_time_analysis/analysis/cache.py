@@ -0,0 +1,311 @@
+"""A persistent, size-bounded cache of analysis results in a local SQLite file.
+
+Results are keyed by a digest of the fingerprints of the task set and the supply
+model, the index of the task under analysis, the policy, the horizon, the POET
+flag, and the version of this library, so that results are not reused across
+releases. A hit reconstructs the stored Solution, including its search space,
+without running any solver.
+
+The database uses write-ahead logging, so that several processes can share the
+same file. It keeps a running count of the stored results, and when an insertion
+makes it exceed max_entries, the least recently used results are evicted.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import replace
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from os import PathLike
+from threading import Lock
+from time import monotonic, sleep, time_ns
+from types import TracebackType
+from typing import TYPE_CHECKING, TypeAlias, cast
+
+from ..model import Duration, SupplyModel, Task, TaskSet
+from . import Solution, edf, fifo, fp
+from .parallel import Policy, per_task_analysis
+
+if TYPE_CHECKING:
+    from typing import Self
+
+# How long (in seconds) connections wait for locks held by other processes.
+LOCK_TIMEOUT = 30
+
+# The JSON-decoded value of a stored solution: its busy-window bound, search space,
+# and response-time bound.
+StoredSolution: TypeAlias = tuple[
+    Duration | None,
+    list[tuple[Duration, Duration | None, Duration | None]] | None,
+    Duration | None,
+]
+
+
+def library_version() -> str:
+    "The installed version of this library, or 'unknown' if it is not installed."
+    try:
+        return version("response-time-analysis")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SolutionCache:
+    """A cache of solutions in the SQLite database at the given path, which is
+    created if necessary. Results are tagged with the given version (by default,
+    library_version())."""
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        max_entries: int = 100_000,
+        version: str | None = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries: int = max_entries
+        self.version: str = library_version() if version is None else version
+        self._lock: Lock = Lock()
+        self._db: sqlite3.Connection = sqlite3.connect(
+            path, timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        _enable_write_ahead_logging(self._db)
+        _ = self._db.execute(
+            """CREATE TABLE IF NOT EXISTS solutions (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used INTEGER NOT NULL
+            )"""
+        )
+        _ = self._db.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_by_use ON solutions (last_used)"
+        )
+        # the number of rows in solutions, maintained along with it
+        _ = self._db.execute(
+            """CREATE TABLE IF NOT EXISTS counts (
+                name TEXT PRIMARY KEY, value INTEGER NOT NULL
+            )"""
+        )
+        _ = self._db.execute(
+            "INSERT OR IGNORE INTO counts SELECT 'solutions', COUNT(*) FROM solutions"
+        )
+
+    def key(
+        self,
+        all_tasks: TaskSet,
+        task_under_analysis: Task,
+        supply: SupplyModel,
+        policy: Policy,
+        horizon: Duration | None = None,
+        use_poet_search_space: bool = False,
+    ) -> str:
+        "The canonical cache key of an analysis."
+        return sha256(
+            json.dumps(
+                [
+                    self.version,
+                    policy,
+                    all_tasks.fingerprint(),
+                    all_tasks.index_of(task_under_analysis),
+                    supply.fingerprint(),
+                    horizon,
+                    use_poet_search_space,
+                ]
+            ).encode()
+        ).hexdigest()
+
+    def get(
+        self, key: str, all_tasks: TaskSet, task_under_analysis: Task
+    ) -> Solution | None:
+        "The stored solution for the key, if any, attributed to the given task."
+        with self._lock:
+            row = cast(
+                "tuple[str] | None",
+                self._db.execute(
+                    "SELECT value FROM solutions WHERE key = ?", (key,)
+                ).fetchone(),
+            )
+            if row is None:
+                return None
+            _ = self._db.execute(
+                "UPDATE solutions SET last_used = ? WHERE key = ?", (time_ns(), key)
+            )
+        bw_bound, sp, rtb = cast(StoredSolution, json.loads(row[0]))
+        return Solution(
+            all_tasks,
+            task_under_analysis,
+            bw_bound,
+            tuple((A, F, R) for A, F, R in sp) if sp is not None else None,
+            rtb,
+        )
+
+    def put(self, key: str, solution: Solution) -> None:
+        """Store the solution under the key, evicting the least recently used
+        results if the cache is full. Solutions cut short by their budget are not
+        stored."""
+        if solution.budget_exhausted:
+            return
+        value = json.dumps(
+            [
+                solution.busy_window_bound,
+                solution.search_space,
+                solution.response_time_bound,
+            ]
+        )
+        now = time_ns()
+        with self._lock:
+            _ = self._db.execute("BEGIN IMMEDIATE")
+            try:
+                replaced = self._db.execute(
+                    "UPDATE solutions SET value = ?, last_used = ? WHERE key = ?",
+                    (value, now, key),
+                ).rowcount
+                if not replaced:
+                    _ = self._db.execute(
+                        "INSERT INTO solutions VALUES (?, ?, ?)", (key, value, now)
+                    )
+                    self._add_to_count(1)
+                    count = self._count()
+                    if count > self.max_entries:
+                        evicted = self._db.execute(
+                            """DELETE FROM solutions WHERE key IN (
+                                SELECT key FROM solutions ORDER BY last_used LIMIT ?
+                            )""",
+                            (count - self.max_entries,),
+                        ).rowcount
+                        self._add_to_count(-evicted)
+                _ = self._db.execute("COMMIT")
+            except BaseException:
+                _ = self._db.execute("ROLLBACK")
+                raise
+
+    def _count(self) -> int:
+        row = cast(
+            "tuple[int]",
+            self._db.execute(
+                "SELECT value FROM counts WHERE name = 'solutions'"
+            ).fetchone(),
+        )
+        return row[0]
+
+    def _add_to_count(self, delta: int) -> None:
+        _ = self._db.execute(
+            "UPDATE counts SET value = value + ? WHERE name = 'solutions'", (delta,)
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def clear(self) -> None:
+        with self._lock:
+            _ = self._db.execute("BEGIN IMMEDIATE")
+            try:
+                _ = self._db.execute("DELETE FROM solutions")
+                _ = self._db.execute(
+                    "UPDATE counts SET value = 0 WHERE name = 'solutions'"
+                )
+                _ = self._db.execute("COMMIT")
+            except BaseException:
+                _ = self._db.execute("ROLLBACK")
+                raise
+
+    def rta(
+        self,
+        all_tasks: TaskSet,
+        task_under_analysis: Task,
+        supply: SupplyModel,
+        policy: Policy,
+        horizon: Duration | None = None,
+        # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+        use_poet_search_space: bool = False,
+    ) -> Solution:
+        """Response-time analysis of the task under analysis under the given
+        scheduling policy, as by the policy's rta(), unless the solution is cached."""
+        key = self.key(
+            all_tasks,
+            task_under_analysis,
+            supply,
+            policy,
+            horizon,
+            use_poet_search_space,
+        )
+        cached = self.get(key, all_tasks, task_under_analysis)
+        if cached is not None:
+            return cached
+        if policy == "fifo":
+            if use_poet_search_space:
+                raise ValueError("POET search spaces are not supported for FIFO")
+            # the FIFO bound is attributed to the first task
+            solution = replace(
+                fifo.rta(all_tasks, supply, horizon),
+                task_under_analysis=task_under_analysis,
+            )
+        else:
+            solution = per_task_analysis(policy)(
+                all_tasks, task_under_analysis, supply, horizon, use_poet_search_space
+            )
+        self.put(key, solution)
+        return solution
+
+    def rta_all(
+        self,
+        all_tasks: TaskSet,
+        supply: SupplyModel,
+        policy: Policy,
+        horizon: Duration | None = None,
+        # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+        use_poet_search_space: bool = False,
+    ) -> tuple[Solution, ...]:
+        """Response-time analysis of all tasks in the task set under the given
+        scheduling policy, as by the policy's rta_all(), unless the solutions of
+        all tasks are cached."""
+        keys = [
+            self.key(all_tasks, t, supply, policy, horizon, use_poet_search_space)
+            for t in all_tasks
+        ]
+        cached = [self.get(key, all_tasks, t) for key, t in zip(keys, all_tasks)]
+        if all(solution is not None for solution in cached):
+            return tuple(s for s in cached if s is not None)
+
+        if policy == "fp":
+            computed = fp.rta_all(all_tasks, supply, horizon, use_poet_search_space)
+        elif policy == "edf":
+            computed = edf.rta_all(all_tasks, supply, horizon, use_poet_search_space)
+        else:
+            if use_poet_search_space:
+                raise ValueError("POET search spaces are not supported for FIFO")
+            computed = fifo.rta_all(all_tasks, supply, horizon)
+        for key, hit, solution in zip(keys, cached, computed):
+            if hit is None:
+                self.put(key, solution)
+        return computed
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _enable_write_ahead_logging(db: sqlite3.Connection) -> None:
+    """Switch the database to write-ahead logging. SQLite does not wait for other
+    connections' locks while switching, so concurrent first connections to a new
+    database are retried for up to LOCK_TIMEOUT seconds."""
+    deadline = monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            _ = db.execute("PRAGMA journal_mode=WAL")
+            return
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) or monotonic() > deadline:
+                raise
+            sleep(0.01)
@@ -1,51 +1,175 @@
 # pyright: reportConstantRedefinition=false
 
-from collections.abc import Iterator
-from itertools import dropwhile
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from fractions import Fraction
+from itertools import accumulate, dropwhile, takewhile
+from threading import Lock
+from typing import TypeAlias
 
 from response_time_analysis.iter import merge_sorted_unique
 from response_time_analysis.model import (
     EPSILON_TIME,
     ArrivalCurvePrefix,
-    Deadline,
+    CompiledTotal,
+    Demand,
     Duration,
     IdealProcessor,
+    StepBound,
     SupplyModel,
     Task,
     TaskSet,
     Work,
     deadline_of,
+    total,
 )
 
-from . import Solution, solve, sparse_finite_search_space
+from . import (
+    Budget,
+    BudgetExhausted,
+    Solution,
+    rate_based_horizon,
+    solve,
+    solve_in_chunks,
+    solve_search_space,
+    sparse_finite_search_space,
+)
 
 
 def busy_window_bound(
     all_tasks: TaskSet,
     supply: SupplyModel,
     horizon: Duration | None = None,
+    budget: Budget | None = None,
 ) -> Duration | None:
     "A bound on the length of the busy window of any job of the task under analysis."
-    return solve.inequality(lhs=all_tasks.rbf, rhs=supply, horizon=horizon)
+    return _busy_window_bound(all_tasks.rbf.compile(), supply, horizon, budget=budget)
+
+
+def _busy_window_bound(
+    trbf: "CompiledTotal | _IncrementalTotal",
+    supply: SupplyModel,
+    horizon: Duration | None,
+    blocking: Work = 0,
+    start: Duration = 1,
+    rate_and_burst: tuple[Fraction, Fraction] | None = None,
+    budget: Budget | None = None,
+) -> Duration | None:
+    """The least L >= start such that blocking + trbf(L) <= supply(L), if any. The
+    start must not exceed the least solution. The long-term rate and burst of trbf
+    are computed unless given, and its deficit if the rate reaches the supply rate."""
+    if rate_and_burst is None:
+        try:
+            rate_and_burst = (trbf.long_term_rate(), trbf.burst())
+        except OverflowError:
+            # The demand admits unboundedly many arrivals.
+            return None
+    rate, burst = rate_and_burst
+    deficit = trbf.deficit() if rate >= supply.long_term_rate() else None
+    horizon = rate_based_horizon(rate, burst, supply, horizon, blocking, deficit)
+    return solve.stepped_inequality(
+        lhs=(lambda L: blocking + trbf(L)) if blocking else trbf,
+        rhs=supply,
+        rhs_inverse=supply.supply_inverse,
+        lhs_steps=trbf.steps(),
+        horizon=horizon,
+        start=start,
+        budget=budget,
+    )
+
+
+@dataclass(frozen=True)
+class BlockingBoundFunction:
+    """The blocking bound of a task under analysis as a step function of the offset,
+    i.e., blocking_bound(all_tasks, task_under_analysis, offset).
+
+    The table of deadlines does not depend on the task under analysis and is shared
+    among all tasks of the same task set: deadlines holds the distinct deadlines of
+    all tasks that can release workload, in increasing order, and blocking[i] is the
+    maximum blocking due to any such task with a deadline of at least deadlines[i].
+    """
+
+    deadlines: tuple[int, ...]
+    blocking: tuple[Work, ...]
+    # the deadlines D such that the blocking bound changes at reference D
+    changes: tuple[int, ...]
+    # the deadline of the task under analysis
+    reference: int
+
+    def __call__(self, offset: Duration) -> Work:
+        idx = bisect_right(self.deadlines, offset + self.reference)
+        return self.blocking[idx] if idx < len(self.blocking) else 0
+
+    def steps(self) -> Iterator[Duration]:
+        """Yields all positive offsets o, in increasing order, such that
+        self(o) != self(o - 1)."""
+        idx = bisect_right(self.changes, self.reference)
+        return (dl - self.reference for dl in self.changes[idx:])
+
+
+BlockingTable: TypeAlias = tuple[tuple[int, ...], tuple[Work, ...], tuple[int, ...]]
+
+# The number of task sets whose blocking tables are retained. The cache holds a
+# reference to each task set, so that its id() cannot be reused while it is cached.
+BLOCKING_CACHE_SIZE = 64
+
+_blocking_tables: OrderedDict[int, tuple[TaskSet, BlockingTable]] = OrderedDict()
+_blocking_tables_lock = Lock()
+
+
+def _blocking_table(all_tasks: TaskSet) -> BlockingTable:
+    # Tasks that cannot release any workload cannot block.
+    per_deadline: dict[int, Work] = {}
+    for t in all_tasks.with_workload:
+        dl = deadline_of(t).value
+        b = t.execution.max_non_preemptive_segment - EPSILON_TIME
+        per_deadline[dl] = max(per_deadline.get(dl, b), b)
+    deadlines = sorted(per_deadline)
+
+    blocking = list(accumulate((per_deadline[dl] for dl in reversed(deadlines)), max))
+    blocking.reverse()
+    # at reference D = deadlines[i], the bound drops from blocking[i] to blocking[i + 1]
+    following = blocking[1:] + [0]
+    changes = tuple(
+        dl for dl, b, b_next in zip(deadlines, blocking, following) if b != b_next
+    )
+    return tuple(deadlines), tuple(blocking), changes
+
+
+def blocking_bound_function(
+    all_tasks: TaskSet, task_under_analysis: Task
+) -> BlockingBoundFunction:
+    """The blocking bound of the task under analysis as a function of the offset.
+
+    The underlying table is built once per task set and kept in an LRU cache of
+    BLOCKING_CACHE_SIZE task sets, which are identified by identity."""
+    key = id(all_tasks)
+    with _blocking_tables_lock:
+        entry = _blocking_tables.get(key)
+        if entry is not None and entry[0] is all_tasks:
+            _blocking_tables.move_to_end(key)
+    if entry is not None and entry[0] is all_tasks:
+        table = entry[1]
+    else:
+        # Concurrent misses may build the same table twice, which is harmless.
+        table = _blocking_table(all_tasks)
+        with _blocking_tables_lock:
+            _blocking_tables[key] = (all_tasks, table)
+            if len(_blocking_tables) > BLOCKING_CACHE_SIZE:
+                _ = _blocking_tables.popitem(last=False)
+    reference = deadline_of(task_under_analysis).value
+    return BlockingBoundFunction(*table, reference=reference)
 
 
-# This is a good candidate for an LRU cache.
 def blocking_bound(
     all_tasks: TaskSet, task_under_analysis: Task, offset: Duration
 ) -> Work:
     """A bound on the maximum priority-inversion blocking incurred by a job of the task
     under analysis if it arrives offset time units after the beginning of its busy window."""
-
-    reference = Deadline(offset + deadline_of(task_under_analysis).value)
-
-    return max(
-        (
-            t.execution.max_non_preemptive_segment - EPSILON_TIME
-            for t in all_tasks.with_deadline_greater_than_iter(reference)
-            if t.rbf(EPSILON_TIME) > 0
-        ),
-        default=0,
-    )
+    return blocking_bound_function(all_tasks, task_under_analysis)(offset)
 
 
 def blocking_bound_steps(
@@ -60,23 +184,7 @@ def blocking_bound_steps(
         o + D_u == D_k
     for some task k in all_tasks, where D_u is the deadline of the task under analysis.
     """
-    reference = deadline_of(task_under_analysis)
-
-    possible_offsets = (
-        deadline_of(t).value - reference.value
-        for t in all_tasks
-        if t != task_under_analysis
-    )
-
-    return (
-        offset
-        for offset in sorted(possible_offsets)
-        if offset > 0
-        and (
-            blocking_bound(all_tasks, task_under_analysis, offset - EPSILON_TIME)
-            != blocking_bound(all_tasks, task_under_analysis, offset)
-        )
-    )
+    return blocking_bound_function(all_tasks, task_under_analysis).steps()
 
 
 def points_of_interest(
@@ -165,49 +273,162 @@ def rta(
     horizon: Duration | None = None,
     # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
     use_poet_search_space: bool = False,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    budget: Budget | None = None,
 ) -> Solution:
-    "Response-time analysis for uniprocessor earliest-deadline first (EDF) scheduling."
+    """Response-time analysis for uniprocessor earliest-deadline first (EDF) scheduling.
+
+    If an executor is given, the search space is split into contiguous chunks of
+    chunk_size offsets that are solved on it (see solve_in_chunks()), which
+    yields the same solution. If the budget is exhausted, the analysis stops and
+    returns a solution marked as budget_exhausted.
+    """
 
     assert not all_tasks.is_empty()
 
-    # first, define the RTA inequality for a given offset
+    # first, try to obtain the search space of relevant offsets
+    try:
+        L = busy_window_bound(all_tasks, supply, horizon, budget)
+    except BudgetExhausted:
+        return Solution.exhausted(all_tasks, task_under_analysis)
+    if L is None:
+        return Solution.no_search_space_found(all_tasks, task_under_analysis)
+
+    if use_poet_search_space:
+        sp = poet_search_space(all_tasks, task_under_analysis, supply, L)
+    else:
+        sp = search_space(all_tasks, task_under_analysis, supply, horizon, L)
+    if sp is None:
+        return Solution.no_search_space_found(all_tasks, task_under_analysis)
+
+    # then, analyze each element of the search space
+    return _rta_within_busy_window(
+        all_tasks,
+        task_under_analysis,
+        supply,
+        horizon,
+        use_poet_search_space,
+        L,
+        sp,
+        blocking_bound_function(all_tasks, task_under_analysis),
+        executor,
+        chunk_size,
+        budget,
+    )
+
+
+def _rta_within_busy_window(
+    all_tasks: TaskSet,
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    L: Duration,
+    sp: Iterable[Duration],
+    blocking: Callable[[Duration], Work],
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    budget: Budget | None = None,
+) -> Solution:
+    """The per-offset part of the EDF RTA, given the busy-window bound L, the search
+    space, and the blocking bound as a function of the offset."""
+
+    # analyze each element of the search space
+    if executor is None:
+        points = map(
+            _offset_analysis(
+                all_tasks,
+                task_under_analysis,
+                supply,
+                horizon,
+                use_poet_search_space,
+                blocking,
+                budget,
+            ),
+            sp,
+        )
+    else:
+        points = solve_in_chunks(
+            executor,
+            _solve_offsets,
+            (all_tasks, task_under_analysis, supply, horizon, use_poet_search_space),
+            tuple(sp),
+            chunk_size,
+            budget,
+        )
+    return solve_search_space(all_tasks, task_under_analysis, L, points)
+
+
+def _offset_analysis(
+    all_tasks: TaskSet,
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    blocking: Callable[[Duration], Work],
+    budget: Budget | None = None,
+) -> Callable[[Duration], tuple[Duration, Duration | None, Duration | None]]:
+    """The RTA inequality to be solved for a given offset, given the blocking bound
+    as a function of the offset. The returned function warm-starts from its
+    previous call if the offset did not decrease and the blocking bound did not
+    change."""
+
+    other_tasks = [
+        (t.rbf, deadline_of(t).value) for t in all_tasks.excluding(task_under_analysis)
+    ]
+
+    # The solution F of the per-offset inequality is monotone in the offset A as
+    # long as the blocking bound does not change, so the solution for the
+    # previous offset (if it was smaller) is a safe starting point for the next.
+    # The blocking bound is non-increasing in A; when it drops, we start over.
+    last_A: Duration | None = None
+    last_F: Duration | None = None
+    last_bb: Work | None = None
+
     def rta_for_offset(
         A: Duration,
     ) -> tuple[Duration, Duration | None, Duration | None]:
-        bb = blocking_bound(all_tasks, task_under_analysis, A)
+        nonlocal last_A, last_F, last_bb
 
-        other_tasks = all_tasks.excluding(task_under_analysis)
+        bb = blocking(A)
 
         hep_reference = A + EPSILON_TIME + deadline_of(task_under_analysis).value
 
         def hep_bound(delta: Duration) -> Work:
-            return sum(
-                t.rbf(min(hep_reference - deadline_of(t).value, delta))
-                for t in other_tasks
-            )
+            return sum(rbf(min(hep_reference - dl, delta)) for rbf, dl in other_tasks)
 
         tua_work = task_under_analysis.rbf(A + EPSILON_TIME) - (
             task_under_analysis.cost.value
             - task_under_analysis.execution.run_to_completion_threshold
         )
 
+        start = bb + tua_work
+        if last_A is not None and last_A <= A and last_bb == bb and last_F is not None:
+            start = max(start, last_F)
+
         if use_poet_search_space:
             # POET requires A<=F, so force this here. In the longterm, this
             # special case should be eliminated as it matters only for points that
             # are in POET's over-approximated search space, but not in the actual search space.
-            F = solve.inequality(
+            F = solve.stepped_inequality(
                 lhs=lambda F: max(A, bb + tua_work + hep_bound(F)),
                 rhs=supply,
-                start=bb + tua_work,
+                rhs_inverse=supply.supply_inverse,
+                start=start,
                 horizon=horizon,
+                budget=budget,
             )
         else:
-            F = solve.inequality(
+            F = solve.stepped_inequality(
                 lhs=lambda F: bb + tua_work + hep_bound(F),
                 rhs=supply,
-                start=bb + tua_work,
+                rhs_inverse=supply.supply_inverse,
+                start=start,
                 horizon=horizon,
+                budget=budget,
             )
+        last_A, last_F, last_bb = A, F, bb
         if F is None:
             return (A, None, None)
 
@@ -217,27 +438,498 @@ def rta(
                 - task_under_analysis.execution.run_to_completion_threshold
             )
 
-        AR = solve.inequality(
+        AR = solve.stepped_inequality(
             lhs=needed_supply,
-            rhs=lambda AR: supply(AR),
+            rhs=supply,
+            rhs_inverse=supply.supply_inverse,
+            lhs_steps=(),
             start=needed_supply(A + F),
             horizon=horizon,
+            budget=budget,
         )
         return (A, F, max(0, AR - A, F - A)) if AR is not None else (A, F, None)
 
-    # second, try to obtain the search space of relevant offsets
-    L = busy_window_bound(all_tasks, supply, horizon)
+    return rta_for_offset
+
+
+def _solve_offsets(
+    all_tasks: TaskSet,
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    offsets: tuple[Duration, ...],
+) -> tuple[tuple[Duration, Duration | None, Duration | None], ...]:
+    "Solve a contiguous chunk of the search space, e.g., in a worker process."
+    rta_for_offset = _offset_analysis(
+        all_tasks,
+        task_under_analysis,
+        supply,
+        horizon,
+        use_poet_search_space,
+        blocking_bound_function(all_tasks, task_under_analysis),
+    )
+    return tuple(rta_for_offset(A) for A in offsets)
+
+
+def rta_all(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+    use_poet_search_space: bool = False,
+    budget: Budget | None = None,
+) -> tuple[Solution, ...]:
+    """Response-time analysis for uniprocessor earliest-deadline first (EDF)
+    scheduling of all tasks in the task set, returned in the order of the task set.
+
+    The results are the same as those of rta() for each task, but the busy-window
+    bound, which does not depend on the task under analysis, is computed only once.
+    Likewise, the RBF steps of all tasks are materialized once (merged per
+    deadline), and each task's search space is obtained by shifting them relative
+    to its deadline. If the budget is exhausted, the tasks not yet analyzed are
+    marked as budget_exhausted.
+    """
+
+    assert not all_tasks.is_empty()
+
+    try:
+        L = busy_window_bound(all_tasks, supply, horizon, budget)
+    except BudgetExhausted:
+        return tuple(Solution.exhausted(all_tasks, t) for t in all_tasks)
     if L is None:
-        return Solution.no_search_space_found(all_tasks, task_under_analysis)
+        return tuple(Solution.no_search_space_found(all_tasks, t) for t in all_tasks)
+    return _rta_all_within_busy_window(
+        all_tasks, supply, horizon, use_poet_search_space, L, budget
+    )
 
-    if use_poet_search_space:
-        sp = poet_search_space(all_tasks, task_under_analysis, supply, L)
-    else:
-        sp = search_space(all_tasks, task_under_analysis, supply, horizon, L)
-    if sp is None:
-        return Solution.no_search_space_found(all_tasks, task_under_analysis)
 
-    # finally, analyze each element of the search space
-    sp = tuple(rta_for_offset(A) for A in sp)
+def _rta_all_within_busy_window(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    L: Duration,
+    budget: Budget | None = None,
+) -> tuple[Solution, ...]:
+    "The per-task part of rta_all(), given the busy-window bound L."
+
+    deadlines = [deadline_of(t).value for t in all_tasks]
+
+    # Tasks with the same deadline are shifted by the same amount.
+    steps_by_deadline: dict[int, list[Duration]] = {}
+    if not use_poet_search_space:
+        max_shift = max(deadlines) - min(deadlines)
+        points: dict[int, set[Duration]] = {}
+        for t, dl in zip(all_tasks, deadlines):
+            points.setdefault(dl, set()).update(
+                takewhile(lambda pt: pt < L + max_shift, t.rbf.steps())
+            )
+        steps_by_deadline = {dl: sorted(pts) for dl, pts in points.items()}
+
+    def shifted_search_space(
+        tua_dl: int, blocking: BlockingBoundFunction
+    ) -> list[Duration]:
+        offsets: set[Duration] = set()
+        if not isinstance(supply, IdealProcessor):
+            offsets.update(takewhile(lambda A: A < L, blocking.steps()))
+        for dl, steps in steps_by_deadline.items():
+            shift = dl - tua_dl
+            lo = bisect_left(steps, -shift)
+            hi = bisect_left(steps, L - shift)
+            offsets.update(pt + shift for pt in steps[lo:hi])
+        return sorted(offsets)
+
+    solutions: list[Solution] = []
+    for tua, tua_dl in zip(all_tasks, deadlines):
+        blocking = blocking_bound_function(all_tasks, tua)
+        if use_poet_search_space:
+            sp = poet_search_space(all_tasks, tua, supply, L)
+        else:
+            sp = shifted_search_space(tua_dl, blocking)
+        solutions.append(
+            _rta_within_busy_window(
+                all_tasks,
+                tua,
+                supply,
+                horizon,
+                use_poet_search_space,
+                L,
+                sp,
+                blocking,
+                budget=budget,
+            )
+        )
+    return tuple(solutions)
+
+
+@dataclass(frozen=True)
+class DemandTestResult:
+    """The outcome of the processor-demand test of a task set.
+
+    If the task set is not schedulable, witness is an interval length at which the
+    total DBF plus blocking exceeds the supply, or None if the busy window cannot
+    be bounded."""
+
+    schedulable: bool
+    witness: Duration | None
+    # the busy-window bound (including blocking) up to which demand was checked
+    busy_window_bound: Duration | None
 
-    return Solution.from_search_space(all_tasks, task_under_analysis, L, sp)
+
+def qpa(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+) -> DemandTestResult:
+    """Processor-demand test for uniprocessor EDF scheduling by Quick
+    Processor-demand Analysis (QPA).
+
+    The task set is schedulable if, for every interval length delta up to the
+    length of the busy window (including blocking), the total DBF plus the blocking
+    due to tasks with deadlines beyond delta does not exceed supply(delta). Rather
+    than checking each step of the DBF, QPA walks backwards from the busy-window
+    bound and skips all interval lengths that the supply already covers. If the
+    long-term demand rate exceeds the supply rate, the total DBF eventually exceeds
+    the supply, so the task set is reported as not schedulable without a witness.
+    """
+    trbf = all_tasks.rbf.compile()
+    try:
+        rate_and_burst = (trbf.long_term_rate(), trbf.burst())
+    except OverflowError:
+        # The demand admits unboundedly many arrivals.
+        return DemandTestResult(False, None, None)
+    if rate_and_burst[0] > supply.long_term_rate():
+        return DemandTestResult(False, None, None)
+    deadlines, blocking, _ = _blocking_table(all_tasks)
+    L = _busy_window_bound(
+        trbf, supply, horizon, blocking[0] if blocking else 0, 1, rate_and_burst
+    )
+    if L is None:
+        return DemandTestResult(False, None, None)
+    witness = _demand_witness(all_tasks.dbf, supply, deadlines, blocking, 1, L)
+    return DemandTestResult(witness is None, witness, L)
+
+
+def _demand_witness(
+    dbf: Callable[[Duration], Demand],
+    supply: SupplyModel,
+    deadlines: tuple[int, ...],
+    blocking: tuple[Work, ...],
+    first: Duration,
+    last: Duration,
+) -> Duration | None:
+    """The largest interval length from first to last at which the total DBF plus
+    blocking exceeds the supply, if any, given the total DBF and the blocking table
+    of the task set.
+
+    Let h(delta) = dbf(delta) + blocking(delta). If h(t) <= supply(t), then
+    h(delta) <= supply(delta) also for all delta from supply_inverse(h(t)) to t
+    for which the blocking bound is the same as at t, since the DBF and the supply
+    are non-decreasing. QPA hence continues just below these interval lengths.
+    Where the DBF is zero, nothing can exceed the supply."""
+    t = last
+    while t >= first:
+        demand = dbf(t)
+        if demand == 0:
+            return None
+        idx = bisect_right(deadlines, t)
+        h = demand + (blocking[idx] if idx < len(blocking) else 0)
+        if h > supply(t):
+            return t
+        # The blocking bound is constant from the largest deadline not above t.
+        segment_start = deadlines[idx - 1] if idx > 0 else 0
+        t = max(supply.supply_inverse(h), segment_start) - EPSILON_TIME
+    return None
+
+
+class _IncrementalTotal:
+    """A total of step bounds that parts are added to and removed from without
+    starting over: the compiled total of a base set of parts, plus the parts added
+    and minus the parts removed since. compact() recompiles the base from the
+    current parts only once more than REBASE_THRESHOLD updates are pending, so that
+    the compiled table is reused across many updates."""
+
+    REBASE_THRESHOLD: int = 16
+
+    def __init__(self) -> None:
+        self._parts: list[StepBound] = []
+        self._base: CompiledTotal = total(()).compile()
+        self._added: list[StepBound] = []
+        self._removed: list[StepBound] = []
+
+    def add(self, part: StepBound) -> None:
+        self._parts.append(part)
+        self._added.append(part)
+
+    def remove(self, part: StepBound) -> None:
+        "Remove the given part, which is identified by identity."
+        _remove_identical(self._parts, part)
+        if any(p is part for p in self._added):
+            _remove_identical(self._added, part)
+        else:
+            self._removed.append(part)
+
+    def compact(self) -> None:
+        if len(self._added) + len(self._removed) > self.REBASE_THRESHOLD:
+            self._base = total(self._parts).compile()
+            self._added, self._removed = [], []
+
+    def __call__(self, delta: Duration) -> Work:
+        return (
+            self._base(delta)
+            + sum(p(delta) for p in self._added)
+            - sum(p(delta) for p in self._removed)
+        )
+
+    def long_term_rate(self) -> Fraction:
+        "The sum of the long-term rates of all parts."
+        return total(self._parts).long_term_rate()
+
+    def burst(self) -> Fraction:
+        "The sum of the bursts of all parts."
+        return total(self._parts).burst()
+
+    def deficit(self) -> Fraction:
+        "The sum of the deficits of all parts."
+        return total(self._parts).deficit()
+
+    def steps(self) -> Iterator[Duration]:
+        """The steps of the total, possibly along with redundant points at which
+        only the removed parts change."""
+        return merge_sorted_unique(
+            [self._base.steps(), *(p.steps() for p in self._added)]
+        )
+
+
+def _remove_identical(parts: list[StepBound], part: StepBound) -> None:
+    for i, p in enumerate(parts):
+        if p is part:
+            del parts[i]
+            return
+    raise ValueError("part not in total")
+
+
+def _blocking_table_with(
+    deadlines: tuple[int, ...], blocking: tuple[Work, ...], deadline: int, b: Work
+) -> tuple[tuple[int, ...], tuple[Work, ...]]:
+    """The deadlines and blocking bounds of a blocking table (see _blocking_table())
+    after adding a task with the given deadline and blocking."""
+    idx = bisect_left(deadlines, deadline)
+    if idx == len(deadlines) or deadlines[idx] != deadline:
+        beyond = blocking[idx] if idx < len(blocking) else 0
+        deadlines = deadlines[:idx] + (deadline,) + deadlines[idx:]
+        blocking = blocking[:idx] + (beyond,) + blocking[idx:]
+    # the blocking bound covers all tasks with deadlines at or beyond the reference
+    raised = tuple(max(x, b) for x in blocking[: idx + 1])
+    return deadlines, raised + blocking[idx + 1 :]
+
+
+class AdmissionController:
+    """An EDF task set that tasks are admitted to and removed from online.
+
+    A task is admitted only if the resulting task set satisfies the
+    processor-demand criterion: for every interval length delta up to the length
+    of the busy window (including blocking), the total DBF plus the blocking due to
+    tasks with longer deadlines does not exceed supply(delta).
+
+    The controller maintains the aggregate demand, so that a decision does not
+    start from scratch. It keeps the long-term rate and burst, the total RBF and
+    DBF, and the blocking table of the admitted tasks, and merges each admitted or
+    removed task into them. The total RBF and DBF are compiled step tables that
+    are recompiled only after a number of updates (see _IncrementalTotal), and the
+    blocking table is kept per deadline. To decide on a task, the controller
+    evaluates the totals plus the task, resumes the busy-window searches from the
+    previous bounds (the busy window cannot become shorter), and checks the
+    criterion by QPA (see qpa()) only for the interval lengths at which the task
+    adds demand or blocking, or that were not checked before. Removing a task never
+    invalidates the criterion; the busy-window bounds are recomputed when next needed.
+
+    The response-time bounds, as by rta_all(), are computed only on request and
+    retained until the task set changes.
+    """
+
+    def __init__(self, supply: SupplyModel, horizon: Duration | None = None):
+        self.supply: SupplyModel = supply
+        self.horizon: Duration | None = horizon
+        self.taskset: TaskSet = TaskSet(())
+        self._rate: Fraction = Fraction(0)
+        self._burst: Fraction = Fraction(0)
+        self._rbf: _IncrementalTotal = _IncrementalTotal()
+        self._dbf: _IncrementalTotal = _IncrementalTotal()
+        # The blocking of the tasks that can release workload, per deadline, and
+        # the resulting deadlines and blocking bounds (see _blocking_table()).
+        self._blocking_per_deadline: dict[int, Counter[Work]] = {}
+        self._blocking: tuple[tuple[int, ...], tuple[Work, ...]] = ((), ())
+        # The busy-window bounds without and with blocking, unless outdated by a
+        # removal.
+        self._bounds: tuple[Duration, Duration] | None = (1, 1)
+        # The criterion holds for all interval lengths up to this one.
+        self._checked: Duration = 0
+        self._solutions: tuple[Solution, ...] | None = None
+
+    def admit(self, task: Task) -> bool:
+        "Add the task to the task set if the result is schedulable. Returns whether so."
+        deadline = deadline_of(task).value
+        dbf = task.dbf
+        assert dbf is not None
+        try:
+            rate = self._rate + task.rbf.long_term_rate()
+            burst = self._burst + task.rbf.burst()
+        except OverflowError:
+            # The task admits unboundedly many arrivals.
+            return False
+        if rate > self.supply.long_term_rate():
+            return False
+
+        deadlines, blocking = self._blocking
+        b = task.execution.max_non_preemptive_segment - EPSILON_TIME
+        blocks = task.rbf(EPSILON_TIME) > 0
+        if blocks:
+            deadlines, blocking = _blocking_table_with(deadlines, blocking, deadline, b)
+        first = self._first_affected(deadline, b if blocks else 0)
+
+        self._rbf.add(task.rbf)
+        self._dbf.add(dbf)
+        bounds: tuple[Duration, Duration] | None = None
+        try:
+            bounds = self._check(rate, burst, deadlines, blocking, first)
+        finally:
+            if bounds is None:
+                self._rbf.remove(task.rbf)
+                self._dbf.remove(dbf)
+        if bounds is None:
+            return False
+
+        self._rbf.compact()
+        self._dbf.compact()
+        if blocks:
+            self._blocking_per_deadline.setdefault(deadline, Counter())[b] += 1
+            self._blocking = deadlines, blocking
+        self.taskset = TaskSet(self.taskset.tasks + (task,))
+        self._rate, self._burst = rate, burst
+        self._bounds = bounds
+        self._checked = max(self._checked, bounds[1])
+        self._solutions = None
+        return True
+
+    def _check(
+        self,
+        rate: Fraction,
+        burst: Fraction,
+        deadlines: tuple[int, ...],
+        blocking: tuple[Work, ...],
+        first: Duration,
+    ) -> tuple[Duration, Duration] | None:
+        """The busy-window bounds without and with blocking of the current totals,
+        given their rate and burst and the blocking table, if both exist and the
+        criterion holds from the first interval length on."""
+        start, start_blocked = (1, 1) if self._bounds is None else self._bounds
+        L = _busy_window_bound(
+            self._rbf, self.supply, self.horizon, 0, start, (rate, burst)
+        )
+        if L is None:
+            return None
+        L_blocked = _busy_window_bound(
+            self._rbf,
+            self.supply,
+            self.horizon,
+            blocking[0] if blocking else 0,
+            max(start_blocked, L),
+            (rate, burst),
+        )
+        if L_blocked is None:
+            return None
+        witness = _demand_witness(
+            self._dbf, self.supply, deadlines, blocking, first, L_blocked
+        )
+        return (L, L_blocked) if witness is None else None
+
+    def remove(self, task: Task) -> None:
+        "Remove the task from the task set. Raises ValueError if it is not admitted."
+        idx = self.taskset.index_of(task)
+        member = self.taskset.tasks[idx]
+        self.taskset = TaskSet(self.taskset.tasks[:idx] + self.taskset.tasks[idx + 1 :])
+        self._rate -= member.rbf.long_term_rate()
+        self._burst -= member.rbf.burst()
+        self._rbf.remove(member.rbf)
+        assert member.dbf is not None
+        self._dbf.remove(member.dbf)
+        self._rbf.compact()
+        self._dbf.compact()
+        if member.rbf(EPSILON_TIME) > 0:
+            deadline = deadline_of(member).value
+            b = member.execution.max_non_preemptive_segment - EPSILON_TIME
+            per_deadline = self._blocking_per_deadline[deadline]
+            per_deadline[b] -= 1
+            if per_deadline[b] == 0:
+                del per_deadline[b]
+                if not per_deadline:
+                    del self._blocking_per_deadline[deadline]
+                self._blocking = self._rebuild_blocking_table()
+        self._bounds = None
+        self._solutions = None
+
+    def _rebuild_blocking_table(self) -> tuple[tuple[int, ...], tuple[Work, ...]]:
+        "The deadlines and blocking bounds of the admitted tasks (see _blocking_table())."
+        deadlines = sorted(self._blocking_per_deadline)
+        per_deadline = (
+            max(self._blocking_per_deadline[dl]) for dl in reversed(deadlines)
+        )
+        blocking = list(accumulate(per_deadline, max))
+        blocking.reverse()
+        return tuple(deadlines), tuple(blocking)
+
+    @property
+    def busy_window_bound(self) -> Duration:
+        "The busy-window bound of the task set, as by busy_window_bound()."
+        if self._bounds is None:
+            _, blocking = self._blocking
+            rate_and_burst = (self._rate, self._burst)
+            L = _busy_window_bound(
+                self._rbf, self.supply, self.horizon, 0, 1, rate_and_burst
+            )
+            L_blocked = _busy_window_bound(
+                self._rbf,
+                self.supply,
+                self.horizon,
+                blocking[0] if blocking else 0,
+                L if L is not None else 1,
+                rate_and_burst,
+            )
+            # Both searches succeeded when the remaining tasks were admitted, and
+            # they cannot fail for fewer tasks.
+            assert L is not None and L_blocked is not None
+            self._bounds = (L, L_blocked)
+        return self._bounds[0]
+
+    def solutions(self) -> tuple[Solution, ...]:
+        "The solutions of all tasks, as by rta_all(), in the order of admission."
+        if self._solutions is None:
+            if self.taskset.is_empty():
+                self._solutions = ()
+            else:
+                self._solutions = _rta_all_within_busy_window(
+                    self.taskset,
+                    self.supply,
+                    self.horizon,
+                    False,
+                    self.busy_window_bound,
+                )
+        return self._solutions
+
+    def _first_affected(self, deadline: int, b: Work) -> Duration:
+        """The least interval length for which admitting a task with the given
+        deadline and blocking can change the demand or the blocking, or that has
+        not been checked before."""
+        first = min(deadline, self._checked + 1)
+        if b > 0:
+            # The task adds blocking to all interval lengths shorter than its
+            # deadline at which the blocking bound is below b.
+            deadlines, blocking = self._blocking
+            below = BlockingBoundFunction(deadlines, blocking, (), 0)
+            for delta in (0, *deadlines):
+                if below(delta) < b:
+                    first = min(first, delta)
+                    break
+        return first
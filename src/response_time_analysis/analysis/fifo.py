@@ -1,11 +1,23 @@
-from collections.abc import Iterator
+# pyright: reportConstantRedefinition=false
 
-from response_time_analysis.analysis import Solution, solve, sparse_finite_search_space
+from collections.abc import Iterator
+from dataclasses import replace
+
+from response_time_analysis.analysis import (
+    Budget,
+    BudgetExhausted,
+    Solution,
+    busy_window_horizon,
+    solve,
+    sparse_finite_search_space,
+)
 from response_time_analysis.model import (
     EPSILON_TIME,
+    CompiledTotal,
     Duration,
     SupplyModel,
     TaskSet,
+    Work,
 )
 
 
@@ -13,10 +25,31 @@ def busy_window_bound(
     all_tasks: TaskSet,
     supply: SupplyModel,
     horizon: Duration | None = None,
+    budget: Budget | None = None,
 ) -> Duration | None:
     "A bound on the length of the busy window of any job of the task under analysis."
-    trbf = all_tasks.rbf
-    return solve.inequality(lhs=trbf, rhs=supply, horizon=horizon)
+    return _busy_window_bound(all_tasks.rbf.compile(), supply, horizon, budget)
+
+
+def _busy_window_bound(
+    trbf: CompiledTotal,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    budget: Budget | None = None,
+) -> Duration | None:
+    try:
+        horizon = busy_window_horizon(trbf, supply, horizon)
+    except OverflowError:
+        # The demand admits unboundedly many arrivals.
+        return None
+    return solve.stepped_inequality(
+        lhs=trbf,
+        rhs=supply,
+        rhs_inverse=supply.supply_inverse,
+        lhs_steps=trbf.steps(),
+        horizon=horizon,
+        budget=budget,
+    )
 
 
 def points_of_interest(all_tasks: TaskSet) -> Iterator[Duration]:
@@ -37,34 +70,90 @@ def search_space(
     return sparse_finite_search_space(points_of_interest(all_tasks), L)
 
 
+def streaming_pass(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    budget: Budget | None = None,
+) -> tuple[Duration, list[tuple[Duration, Work]]] | None:
+    """Compile the merged step stream of the total RBF once into a table of running
+    cumulative workloads, to obtain both the busy-window bound L and each point A
+    of the search space together with the workload all_tasks.rbf(A + 1).
+
+    The busy-window bound is found like busy_window_bound(), which jumps ahead by
+    inverting the supply instead of visiting each step and gives up beyond the
+    horizon derived from the long-term rates. Only then are the steps below L read
+    back from the table. Returns None if no busy-window bound is found. The budget
+    (if any) is checked in every iteration and at every point.
+    """
+    trbf = all_tasks.rbf.compile()
+    L = _busy_window_bound(trbf, supply, horizon, budget)
+    if L is None:
+        return None
+
+    points: list[tuple[Duration, Work]] = []
+    for step, work in trbf.steps_with_values():
+        if step >= L:
+            break
+        if budget is not None:
+            budget.check()
+        points.append((step, work))
+    return L, points
+
+
 def rta(
     all_tasks: TaskSet,
     supply: SupplyModel,
     horizon: Duration | None = None,
+    budget: Budget | None = None,
 ) -> Solution:
-    "Response-time analysis for uniprocessor first-in-first-out (FIFO) scheduling."
+    """Response-time analysis for uniprocessor first-in-first-out (FIFO) scheduling.
+
+    The bound applies to all tasks; the solution is attributed to the first task.
+    If the budget is exhausted, the analysis stops and returns a solution marked
+    as budget_exhausted.
+    """
 
     assert not all_tasks.is_empty()
 
-    # first, define the RTA inequality for a given offset
-    def rta_for_offset(
-        A: Duration,
-    ) -> tuple[Duration, Duration | None, Duration | None]:
-        all_work = all_tasks.rbf(A + EPSILON_TIME)
-        F = solve.inequality(
-            lhs=lambda _F: all_work,
-            rhs=supply,
-            horizon=horizon,
-        )
-        return (A, F, F - A) if F is not None else (A, None, None)
-
-    # second, try to obtain the search space of relevant offsets
-    L = busy_window_bound(all_tasks, supply, horizon)
-    sp = search_space(all_tasks, supply, horizon, L)
-    if sp is None or L is None:
+    # first, bound the busy window and collect the search space in a single pass
+    try:
+        result = streaming_pass(all_tasks, supply, horizon, budget)
+    except BudgetExhausted:
+        return Solution.exhausted(all_tasks, all_tasks.tasks[0])
+    if result is None:
         return Solution.no_search_space_found(all_tasks, all_tasks.tasks[0])
+    L, points = result
 
-    # finally, analyze each element of the search space
-    sp = tuple(rta_for_offset(A) for A in sp)
+    # then, invert the supply at each point of the search space
+    def rta_for_offset(
+        A: Duration, all_work: Work
+    ) -> tuple[Duration, Duration | None, Duration | None]:
+        F = max(EPSILON_TIME, supply.supply_inverse(all_work))
+        if horizon is not None and F > horizon:
+            return (A, None, None)
+        return (A, F, F - A)
 
+    sp = tuple(rta_for_offset(A, all_work) for A, all_work in points)
     return Solution.from_search_space(all_tasks, all_tasks.tasks[0], L, sp)
+
+
+def rta_all(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    budget: Budget | None = None,
+) -> tuple[Solution, ...]:
+    """Response-time analysis for uniprocessor first-in-first-out (FIFO) scheduling
+    of all tasks in the task set, returned in the order of the task set.
+
+    The bound does not depend on the task under analysis, so it is obtained from a
+    single run of rta(), which needs only one streaming_pass() over the steps of
+    the total RBF. At each point A of the search space, the supply is inverted
+    directly to find the least F with all_tasks.rbf(A + 1) <= supply(F).
+    """
+
+    assert not all_tasks.is_empty()
+
+    solution = rta(all_tasks, supply, horizon, budget)
+    return tuple(replace(solution, task_under_analysis=t) for t in all_tasks)
@@ -1,29 +1,46 @@
 # pyright: reportConstantRedefinition=false
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from dataclasses import replace
+from fractions import Fraction
 
 from response_time_analysis.model import (
     EPSILON_TIME,
     ArrivalCurvePrefix,
+    CompiledTotal,
     Duration,
+    Periodic,
+    PeriodicWithJitter,
+    Priority,
+    RequestBoundFunction,
+    Sporadic,
     SupplyModel,
     Task,
     TaskSet,
     Work,
+    prio_of,
+    total,
 )
 
-from . import Solution, solve, sparse_finite_search_space
+from . import (
+    Budget,
+    BudgetExhausted,
+    Solution,
+    rate_based_horizon,
+    solve,
+    solve_in_chunks,
+    solve_search_space,
+    sparse_finite_search_space,
+)
 
 
 def blocking_bound(all_tasks: TaskSet, task_under_analysis: Task) -> Work:
     "The maximum priority-inversion incurred by a job of the task under analysis."
-    return max(
-        (
-            t.execution.max_non_preemptive_segment - EPSILON_TIME
-            for t in all_tasks.with_priority_lower_than_iter(task_under_analysis)
-        ),
-        default=0,
+    nps = all_tasks.max_non_preemptive_segment_with_priority_lower_than(
+        task_under_analysis
     )
+    return nps - EPSILON_TIME if nps is not None else 0
 
 
 def busy_window_bound(
@@ -32,15 +49,51 @@ def busy_window_bound(
     supply: SupplyModel,
     horizon: Duration | None = None,
     pi_blocking_bound: Work | None = None,
+    budget: Budget | None = None,
 ) -> Duration | None:
     "A bound on the length of the busy window of any job of the task under analysis."
     if pi_blocking_bound is None:
         pi_blocking_bound = blocking_bound(all_tasks, task_under_analysis)
-    hep_trbf = all_tasks.with_priority_higher_than_or_equal_to(task_under_analysis).rbf
-    return solve.inequality(
+    hep_trbf = all_tasks.with_priority_higher_than_or_equal_to(
+        task_under_analysis
+    ).rbf.compile()
+    return _busy_window_bound(
+        hep_trbf, supply, horizon, pi_blocking_bound, budget=budget
+    )
+
+
+def _busy_window_bound(
+    hep_trbf: CompiledTotal,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    pi_blocking_bound: Work,
+    start: Duration = 1,
+    rate_and_burst: tuple[Fraction, Fraction] | None = None,
+    budget: Budget | None = None,
+) -> Duration | None:
+    """The least L >= start such that pi_blocking_bound + hep_trbf(L) <= supply(L),
+    if any. The start must not exceed the least solution. The long-term rate and
+    burst of hep_trbf are computed unless given, and its deficit if the rate
+    reaches the supply rate."""
+    if rate_and_burst is None:
+        try:
+            rate_and_burst = (hep_trbf.long_term_rate(), hep_trbf.burst())
+        except OverflowError:
+            # The demand admits unboundedly many arrivals.
+            return None
+    rate, burst = rate_and_burst
+    deficit = hep_trbf.deficit() if rate >= supply.long_term_rate() else None
+    horizon = rate_based_horizon(
+        rate, burst, supply, horizon, pi_blocking_bound, deficit
+    )
+    return solve.stepped_inequality(
         lhs=lambda L: pi_blocking_bound + hep_trbf(L),
         rhs=supply,
+        rhs_inverse=supply.supply_inverse,
+        lhs_steps=hep_trbf.steps(),
         horizon=horizon,
+        start=start,
+        budget=budget,
     )
 
 
@@ -91,8 +144,17 @@ def rta(
     horizon: Duration | None = None,
     # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
     use_poet_search_space: bool = False,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    budget: Budget | None = None,
 ) -> Solution:
-    "Response-time analysis for uniprocessor fixed-priority (FP) scheduling."
+    """Response-time analysis for uniprocessor fixed-priority (FP) scheduling.
+
+    If an executor is given, the search space is split into contiguous chunks of
+    chunk_size offsets that are solved on it (see solve_in_chunks()), which
+    yields the same solution. If the budget is exhausted, the analysis stops and
+    returns a solution marked as budget_exhausted.
+    """
 
     assert not all_tasks.is_empty()
 
@@ -104,10 +166,129 @@ def rta(
     # second, compute the blocking bound
     bb = blocking_bound(all_tasks, task_under_analysis)
 
-    # third, define the RTA inequalities to be solved for a given offset
+    # third, bound the busy window, up to which the interference is tabulated
+    try:
+        L = busy_window_bound(
+            all_tasks,
+            task_under_analysis,
+            supply,
+            horizon,
+            pi_blocking_bound=bb,
+            budget=budget,
+        )
+    except BudgetExhausted:
+        return Solution.exhausted(all_tasks, task_under_analysis)
+    if L is None:
+        return Solution.no_search_space_found(all_tasks, task_under_analysis)
+    ohep_rbf = ohep_tasks.rbf.compile(L)
+
+    return _rta_within_busy_window(
+        all_tasks,
+        task_under_analysis,
+        supply,
+        horizon,
+        use_poet_search_space,
+        bb,
+        L,
+        ohep_rbf,
+        executor,
+        chunk_size,
+        budget,
+    )
+
+
+def _rta_within_busy_window(
+    all_tasks: TaskSet,
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    bb: Work,
+    L: Duration,
+    ohep_rbf: CompiledTotal,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    budget: Budget | None = None,
+) -> Solution:
+    """The per-offset part of the FP RTA, given the blocking bound bb, the busy-window
+    bound L, and the total RBF of all other higher-or-equal-priority tasks."""
+
+    # first, obtain the search space of relevant offsets
+    sp_bound = (
+        L if not use_poet_search_space else round_to_horizon(task_under_analysis, L)
+    )
+    sp = search_space(
+        all_tasks,
+        task_under_analysis,
+        supply,
+        horizon,
+        bw_bound=sp_bound,
+    )
+    if sp is None:
+        return Solution.no_search_space_found(all_tasks, task_under_analysis)
+
+    # finally, analyze each element of the search space
+    if executor is None:
+        points = map(
+            _offset_analysis(
+                task_under_analysis,
+                supply,
+                horizon,
+                use_poet_search_space,
+                bb,
+                ohep_rbf,
+                budget,
+            ),
+            sp,
+        )
+    else:
+        points = solve_in_chunks(
+            executor,
+            _solve_offsets,
+            (
+                all_tasks,
+                task_under_analysis,
+                supply,
+                horizon,
+                use_poet_search_space,
+                bb,
+                L,
+            ),
+            tuple(sp),
+            chunk_size,
+            budget,
+        )
+
+    return solve_search_space(all_tasks, task_under_analysis, L, points)
+
+
+def _offset_analysis(
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    bb: Work,
+    ohep_rbf: CompiledTotal,
+    budget: Budget | None = None,
+) -> Callable[[Duration], tuple[Duration, Duration | None, Duration | None]]:
+    """The RTA inequalities to be solved for a given offset, given the blocking bound
+    bb and the total RBF of all other higher-or-equal-priority tasks. The returned
+    function warm-starts from its previous call if the offset did not decrease."""
+
+    # The solution F of the per-offset inequality is monotone in the offset A,
+    # so the solution for the previous (smaller) offset is a safe starting point.
+    last_A: Duration | None = None
+    last_F: Duration | None = None
+
     def rta_for_offset(
         A: Duration,
     ) -> tuple[Duration, Duration | None, Duration | None]:
+        nonlocal last_A, last_F
+
+        start = 1
+        if last_A is not None and last_A <= A and last_F is not None:
+            start = last_F
+
         tua_work = task_under_analysis.rbf(A + EPSILON_TIME) - (
             task_under_analysis.cost.value
             - task_under_analysis.execution.run_to_completion_threshold
@@ -117,17 +298,26 @@ def rta(
             # POET requires A<=F, so force this here. In the longterm, this
             # special case should be eliminated as it matters only for points that
             # are in POET's over-approximated search space, but not in the actual search space.
-            F = solve.inequality(
-                lhs=lambda F: max(bb + tua_work + ohep_tasks.rbf(F), A),
+            F = solve.stepped_inequality(
+                lhs=lambda F: max(bb + tua_work + ohep_rbf(F), A),
                 rhs=supply,
+                rhs_inverse=supply.supply_inverse,
+                lhs_steps=ohep_rbf.steps(),
+                start=start,
                 horizon=horizon,
+                budget=budget,
             )
         else:
-            F = solve.inequality(
-                lhs=lambda F: bb + tua_work + ohep_tasks.rbf(F),
+            F = solve.stepped_inequality(
+                lhs=lambda F: bb + tua_work + ohep_rbf(F),
                 rhs=supply,
+                rhs_inverse=supply.supply_inverse,
+                lhs_steps=ohep_rbf.steps(),
+                start=start,
                 horizon=horizon,
+                budget=budget,
             )
+        last_A, last_F = A, F
         if F is None:
             return (A, None, None)
 
@@ -137,38 +327,248 @@ def rta(
                 - task_under_analysis.execution.run_to_completion_threshold
             )
 
-        AR = solve.inequality(
+        AR = solve.stepped_inequality(
             lhs=needed_supply,
-            rhs=lambda AR: supply(AR),
+            rhs=supply,
+            rhs_inverse=supply.supply_inverse,
+            lhs_steps=(),
             start=needed_supply(A + F),
             horizon=horizon,
+            budget=budget,
         )
         return (A, F, max(0, AR - A, F - A)) if AR is not None else (A, F, None)
 
-    # fourth, try to obtain the search space of relevant offsets
-    L = busy_window_bound(
-        all_tasks,
-        task_under_analysis,
-        supply,
-        horizon,
-        pi_blocking_bound=bb,
-    )
-    if L is None:
-        return Solution.no_search_space_found(all_tasks, task_under_analysis)
-    sp_bound = (
-        L if not use_poet_search_space else round_to_horizon(task_under_analysis, L)
+    return rta_for_offset
+
+
+def _solve_offsets(
+    all_tasks: TaskSet,
+    task_under_analysis: Task,
+    supply: SupplyModel,
+    horizon: Duration | None,
+    use_poet_search_space: bool,
+    bb: Work,
+    L: Duration,
+    offsets: tuple[Duration, ...],
+) -> tuple[tuple[Duration, Duration | None, Duration | None], ...]:
+    "Solve a contiguous chunk of the search space, e.g., in a worker process."
+    ohep_rbf = all_tasks.with_priority_higher_than_or_equal_to_excluding(
+        task_under_analysis
+    ).rbf.compile(L)
+    rta_for_offset = _offset_analysis(
+        task_under_analysis, supply, horizon, use_poet_search_space, bb, ohep_rbf
     )
-    sp = search_space(
-        all_tasks,
-        task_under_analysis,
-        supply,
-        horizon,
-        bw_bound=sp_bound,
+    return tuple(rta_for_offset(A) for A in offsets)
+
+
+def rta_all(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    horizon: Duration | None = None,
+    # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+    use_poet_search_space: bool = False,
+    budget: Budget | None = None,
+) -> tuple[Solution, ...]:
+    """Response-time analysis for uniprocessor fixed-priority (FP) scheduling of all
+    tasks in the task set, returned in the order of the task set.
+
+    The results are the same as those of rta() for each task, but the task set is
+    sorted by priority only once. Going from the highest to the lowest priority
+    level, the total RBF of all higher-or-equal-priority tasks is built up level
+    by level, and each level's busy-window search resumes from the bound of the
+    level above it whenever the blocking bound permits. If the budget is
+    exhausted, the tasks not yet analyzed are marked as budget_exhausted.
+    """
+
+    assert not all_tasks.is_empty()
+
+    levels: dict[Priority, list[tuple[int, Task]]] = {}
+    for idx, t in enumerate(all_tasks):
+        levels.setdefault(prio_of(t), []).append((idx, t))
+    prios = sorted(levels, reverse=True)
+
+    # The blocking bound of each level is the maximum over all lower levels.
+    blocking: list[Work] = [0] * len(prios)
+    lower_max: Work | None = None
+    for i in reversed(range(len(prios) - 1)):
+        level_max = max(
+            t.execution.max_non_preemptive_segment - EPSILON_TIME
+            for _, t in levels[prios[i + 1]]
+        )
+        lower_max = level_max if lower_max is None else max(lower_max, level_max)
+        blocking[i] = lower_max
+
+    solutions: list[Solution | None] = [None] * len(all_tasks)
+    hep_rbfs: tuple[RequestBoundFunction, ...] = ()
+    hep_trbf: CompiledTotal | None = None
+    # the long-term rate and burst of hep_trbf (None = unbounded)
+    rate_and_burst: tuple[Fraction, Fraction] | None = (Fraction(0), Fraction(0))
+    L: Duration | None = None
+    last_bb: Work | None = None
+    for prio, bb in zip(prios, blocking):
+        level = levels[prio]
+        level_rbfs = tuple(t.rbf for _, t in level)
+        above_rbfs, above_trbf = hep_rbfs, hep_trbf
+        hep_rbfs = above_rbfs + level_rbfs
+        hep_trbf = total(hep_rbfs).compile()
+        if rate_and_burst is not None:
+            try:
+                rate, burst = rate_and_burst
+                for rbf in level_rbfs:
+                    rate += rbf.long_term_rate()
+                    burst += rbf.burst()
+                rate_and_burst = (rate, burst)
+            except OverflowError:
+                rate_and_burst = None
+
+        if rate_and_burst is None:
+            L = None
+        else:
+            # Going down one level only adds interference, so unless the blocking
+            # bound drops, the busy window cannot become shorter.
+            start = L if L is not None and bb == last_bb else 1
+            try:
+                L = _busy_window_bound(
+                    hep_trbf, supply, horizon, bb, start, rate_and_burst, budget
+                )
+            except BudgetExhausted:
+                break
+        last_bb = bb
+
+        for idx, tua in level:
+            if L is None:
+                solutions[idx] = Solution.no_search_space_found(all_tasks, tua)
+                continue
+            same_level_rbfs = tuple(t.rbf for j, t in level if j != idx)
+            if not same_level_rbfs and above_trbf is not None:
+                # the other higher-or-equal-priority tasks are exactly those above
+                ohep_rbf = above_trbf
+            else:
+                ohep_rbf = total(above_rbfs + same_level_rbfs).compile(L)
+            solutions[idx] = _rta_within_busy_window(
+                all_tasks,
+                tua,
+                supply,
+                horizon,
+                use_poet_search_space,
+                bb,
+                L,
+                ohep_rbf,
+                budget=budget,
+            )
+
+    return tuple(
+        s if s is not None else Solution.exhausted(all_tasks, t)
+        for s, t in zip(solutions, all_tasks)
     )
-    if sp is None:
-        return Solution.no_search_space_found(all_tasks, task_under_analysis)
 
-    # finally, analyze each element of the search space
-    sp = tuple(rta_for_offset(A) for A in sp)
 
-    return Solution.from_search_space(all_tasks, task_under_analysis, L, sp)
+def _dominates(new: Task, old: Task) -> bool:
+    """Whether the RBF of the new task is known to be at least that of the old
+    task everywhere, i.e., whether the new task adds interference only."""
+    if new.cost.value < old.cost.value:
+        return False
+    na, oa = new.arrivals, old.arrivals
+    if na == oa:
+        return True
+    if isinstance(na, Periodic) and isinstance(oa, Periodic):
+        return na.period <= oa.period
+    if isinstance(na, Sporadic) and isinstance(oa, Sporadic):
+        return na.mit <= oa.mit
+    if isinstance(na, PeriodicWithJitter) and isinstance(oa, PeriodicWithJitter):
+        return na.period <= oa.period and na.jitter >= oa.jitter
+    return False
+
+
+class IncrementalSession:
+    """An FP analysis of a task set that is kept up to date as tasks are replaced
+    one at a time, e.g., in a what-if exploration.
+
+    The solution of a task depends only on the RBFs of the other tasks with higher
+    or equal priority and on its blocking bound. When a task is replaced, only the
+    tasks for which either of these changes are re-analyzed. Their busy-window
+    searches resume from the previous bound if the update can only have added
+    interference and blocking. The solutions are the same as those of rta_all().
+    """
+
+    def __init__(
+        self,
+        all_tasks: TaskSet,
+        supply: SupplyModel,
+        horizon: Duration | None = None,
+        # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+        use_poet_search_space: bool = False,
+    ):
+        self.taskset: TaskSet = all_tasks
+        self.supply: SupplyModel = supply
+        self.horizon: Duration | None = horizon
+        self.use_poet_search_space: bool = use_poet_search_space
+        self._solutions: list[Solution] = list(
+            rta_all(all_tasks, supply, horizon, use_poet_search_space)
+        )
+        self._blocking: list[Work] = [blocking_bound(all_tasks, t) for t in all_tasks]
+
+    @property
+    def solutions(self) -> tuple[Solution, ...]:
+        "The current solutions, in the order of the task set."
+        return tuple(self._solutions)
+
+    def update(self, index: int, task: Task) -> tuple[int, ...]:
+        """Replace the task at the given index of the task set and re-analyze all
+        affected tasks. Returns the indices of the re-analyzed tasks."""
+
+        old = self.taskset.tasks[index]
+        tasks = list(self.taskset.tasks)
+        tasks[index] = task
+        all_tasks = TaskSet(tuple(tasks))
+        self.taskset = all_tasks
+
+        old_prio, new_prio = prio_of(old).value, prio_of(task).value
+        same_rbf = old.arrivals == task.arrivals and old.cost == task.cost
+        adds_demand = _dominates(task, old)
+
+        affected: list[int] = []
+        for j, tua in enumerate(all_tasks):
+            bb = blocking_bound(all_tasks, tua)
+            old_bb, self._blocking[j] = self._blocking[j], bb
+            prio = prio_of(tua).value
+            if j == index:
+                # The solution also depends on the task's own parameters. The task
+                # is one of its own higher-or-equal-priority tasks.
+                same_hep = task == old
+                grows = adds_demand and old_prio == new_prio
+            else:
+                was_hep, is_hep = old_prio >= prio, new_prio >= prio
+                same_hep = was_hep == is_hep and (same_rbf or not is_hep)
+                grows = is_hep and (not was_hep or adds_demand)
+            if same_hep and bb == old_bb:
+                self._solutions[j] = replace(self._solutions[j], taskset=all_tasks)
+                continue
+
+            # Unless the update may have removed interference or blocking, the
+            # busy window cannot have become shorter.
+            old_L = self._solutions[j].busy_window_bound
+            start = old_L if old_L is not None and grows and bb >= old_bb else 1
+            self._solutions[j] = self._analyze(tua, bb, start)
+            affected.append(j)
+        return tuple(affected)
+
+    def _analyze(self, tua: Task, bb: Work, start: Duration) -> Solution:
+        all_tasks = self.taskset
+        hep_trbf = all_tasks.with_priority_higher_than_or_equal_to(tua).rbf.compile()
+        L = _busy_window_bound(hep_trbf, self.supply, self.horizon, bb, start)
+        if L is None:
+            return Solution.no_search_space_found(all_tasks, tua)
+        ohep_rbf = all_tasks.with_priority_higher_than_or_equal_to_excluding(
+            tua
+        ).rbf.compile(L)
+        return _rta_within_busy_window(
+            all_tasks,
+            tua,
+            self.supply,
+            self.horizon,
+            self.use_poet_search_space,
+            bb,
+            L,
+            ohep_rbf,
+        )
@@ -0,0 +1,73 @@
+"""Whole-task-set analyses that analyze the tasks of a task set concurrently in a
+thread pool.
+
+All lazily extended parts of the model (the extensions of delta-min vectors,
+compiled totals, and the cached EDF blocking tables) are safe to share among
+threads, so all workers share the same task set. Under the global interpreter
+lock, the workers take turns; on free-threaded builds of CPython, they run in
+parallel.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, TypeAlias
+
+from ..model import Duration, SupplyModel, Task, TaskSet
+from . import Budget, Solution, edf, fifo, fp
+
+Policy: TypeAlias = Literal["fp", "edf", "fifo"]
+
+
+def per_task_analysis(
+    policy: Policy,
+) -> Callable[..., Solution]:
+    """The rta() function that analyzes a single task under the given policy.
+    FIFO has none, as its bound does not depend on the task under analysis."""
+    if policy == "fp":
+        return fp.rta
+    if policy == "edf":
+        return edf.rta
+    raise ValueError(f"unknown scheduling policy: {policy!r}")
+
+
+def rta_all(
+    all_tasks: TaskSet,
+    supply: SupplyModel,
+    policy: Policy,
+    horizon: Duration | None = None,
+    # special case for POET's over-approximated search spaces -- works only for ArrivalCurvePrefix
+    use_poet_search_space: bool = False,
+    max_workers: int | None = None,
+    budget: Budget | None = None,
+) -> tuple[Solution, ...]:
+    """Response-time analysis of all tasks in the task set under the given
+    scheduling policy, returned in the order of the task set.
+
+    The results are the same as those of the policy's rta() for each task, which
+    is run once per task in a pool of at most max_workers threads (by default,
+    as many as ThreadPoolExecutor chooses). All analyses share the budget (if
+    any); once it is exhausted, the remaining ones are marked as budget_exhausted.
+    """
+
+    assert not all_tasks.is_empty()
+
+    if policy == "fifo":
+        if use_poet_search_space:
+            raise ValueError("POET search spaces are not supported for FIFO")
+        # The FIFO bound does not depend on the task under analysis.
+        return fifo.rta_all(all_tasks, supply, horizon, budget)
+
+    analysis = per_task_analysis(policy)
+
+    def analyze(task_under_analysis: Task) -> Solution:
+        return analysis(
+            all_tasks,
+            task_under_analysis,
+            supply,
+            horizon,
+            use_poet_search_space,
+            budget=budget,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return tuple(pool.map(analyze, all_tasks))
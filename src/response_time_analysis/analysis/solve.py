@@ -1,4 +1,6 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+
+from .budget import Budget
 
 
 def inequality(
@@ -7,12 +9,17 @@ def inequality(
     horizon: int | None = None,
     start: int = 1,
     step: Callable[[int, int, int], int] = lambda x, lh, rh: max(lh, x + (lh - rh)),
+    budget: Budget | None = None,
 ) -> int | None:
-    "Iteratively try to find a solution solving lhs(x) <= rhs(x)."
+    """Iteratively try to find a solution solving lhs(x) <= rhs(x).
+
+    The optional budget is checked in every iteration (see Budget.check())."""
 
     x = start
     lh, rh = 0, 0
     while True:
+        if budget is not None:
+            budget.check()
         last_lh, last_rh = lh, rh
         try:
             lh = lhs(x)
@@ -29,3 +36,65 @@ def inequality(
             return None
         else:
             x = step(x, lh, rh)
+
+
+# How many entries of the step stream of the lhs stepped_inequality() may skip
+# per iteration before it stops consulting the stream for that iteration.
+MAX_SKIPPED_STEPS = 64
+
+
+def stepped_inequality(
+    lhs: Callable[[int], int],
+    rhs: Callable[[int], int],
+    rhs_inverse: Callable[[int], int],
+    lhs_steps: Iterable[int] | None = None,
+    horizon: int | None = None,
+    start: int = 1,
+    budget: Budget | None = None,
+) -> int | None:
+    """Find the least x >= start solving lhs(x) <= rhs(x).
+
+    Both sides must be monotonically increasing, and rhs_inverse(y) must be the
+    least x such that rhs(x) >= y (e.g., the supply_inverse() of a supply model).
+    If lhs(x) > rhs(x), then no solution exists below rhs_inverse(lhs(x)), so the
+    solver jumps straight there. If the optional lhs_steps stream (the points at
+    which lhs changes, as yielded by steps()) shows that lhs does not change on
+    the way, the jump target is the solution and lhs need not be re-evaluated.
+
+    Unlike inequality(), the solver gives up as soon as the solution is known to
+    lie beyond the horizon. The optional budget is checked in every iteration (see
+    Budget.check()).
+    """
+
+    steps = iter(lhs_steps) if lhs_steps is not None else None
+    # the next step of lhs not yet known to lie below x (None = no further steps)
+    pending = next(steps, None) if steps is not None else None
+
+    x = start
+    try:
+        lh = lhs(x)
+        while True:
+            if budget is not None:
+                budget.check()
+            rh = rhs(x)
+            if lh <= rh:
+                return x
+            x_next = rhs_inverse(lh)
+            assert x_next > x  # rhs must be monotonically increasing
+            if horizon is not None and x_next > horizon:
+                # The solution lies beyond the horizon, so we give up.
+                return None
+            if steps is not None:
+                for _ in range(MAX_SKIPPED_STEPS):
+                    if pending is None or pending >= x:
+                        break
+                    pending = next(steps, None)
+                if pending is None or (x <= pending and x_next <= pending):
+                    # lhs does not change in [x, x_next), so x_next is the solution.
+                    return x_next
+            x = x_next
+            last_lh, lh = lh, lhs(x)
+            assert lh >= last_lh  # lhs must be monotonically increasing
+    except OverflowError:
+        # If we manage to overflow, then we certainly didn't converge.
+        return None
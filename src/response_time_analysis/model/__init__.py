@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from . import packed, vectorized
 from .arrival import (
     ArrivalCurvePrefix,
     ArrivalModel,
@@ -20,6 +21,7 @@ from .execution import (
     LimitedPreemptive,
     PreemptionModel,
 )
+from .fingerprint import fingerprint
 from .policy import (
     Deadline,
     Priority,
@@ -39,10 +41,12 @@ from .time import (
     Work,
 )
 from .workload import (
+    CompiledTotal,
     DemandBoundFunction,
     RequestBoundFunction,
     StepBound,
     Total,
+    evaluate_many,
     total,
 )
 
@@ -72,7 +76,9 @@ __all__ = [
     "RequestBoundFunction",
     "DemandBoundFunction",
     "Total",
+    "CompiledTotal",
     "total",
+    "evaluate_many",
     "StepBound",
     "Task",
     "TaskSet",
@@ -82,4 +88,7 @@ __all__ = [
     "IdealProcessor",
     "RateDelayModel",
     "SupplyModel",
+    "vectorized",
+    "packed",
+    "fingerprint",
 ]
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from dataclasses import dataclass
-from itertools import chain, count, dropwhile, takewhile
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from fractions import Fraction
+from itertools import chain, count, dropwhile, pairwise, takewhile
 from math import ceil, inf
-from typing import TypeAlias
+from operator import add
+from threading import Lock
+from typing import TYPE_CHECKING, TypeAlias, final
 
 from .time import EPSILON_TIME, Duration
+from .vectorized import (
+    Array,
+    Batch,
+    as_array,
+    as_batch,
+    have_numpy,
+    np,
+    zeros_like,
+)
+
+if TYPE_CHECKING:
+    from typing import override
+else:
+    try:
+        from typing import override
+    except ImportError:  # Python < 3.12
+
+        def override(method):
+            return method
+
 
 JobCount: TypeAlias = int
 
@@ -34,12 +58,31 @@ class Periodic:
         else:
             return ceil(delta / self.period)
 
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        d = as_array(deltas)
+        return np.where(d <= 0, 0, -(-d // self.period))
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         max_arrivals(delta) != max_arrivals(delta + 1)"""
 
         return count(0, self.period)
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return Fraction(1, self.period)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return Fraction(self.period - 1, self.period)
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
     def as_arrival_curve_prefix(
         self, _horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -71,6 +114,13 @@ class PeriodicWithJitter:
         else:
             return ceil((delta + self.jitter) / self.period)
 
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        d = as_array(deltas)
+        return np.where(d <= 0, 0, -(-(d + self.jitter) // self.period))
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         max_arrivals(delta) != max_arrivals(delta + 1)"""
@@ -79,6 +129,18 @@ class PeriodicWithJitter:
         filtered = dropwhile(lambda delta: delta <= 0, raw_steps)
         return chain([0], filtered)
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return Fraction(1, self.period)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return Fraction(self.jitter + self.period - 1, self.period)
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
     def as_arrival_curve_prefix(
         self, horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -115,12 +177,31 @@ class Sporadic:
         else:
             return int(ceil(delta / self.mit))
 
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        d = as_array(deltas)
+        return np.where(d <= 0, 0, -(-d // self.mit))
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         max_arrivals(delta) != max_arrivals(delta + 1)"""
 
         return count(0, self.mit)
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return Fraction(1, self.mit)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return Fraction(self.mit - 1, self.mit)
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
     def as_arrival_curve_prefix(
         self, _horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -128,6 +209,190 @@ class Sporadic:
         return ArrivalCurvePrefix(horizon=self.mit, ac_steps=[(1, 1)])
 
 
+@final
+class _SuperAdditiveExtension:
+    """Lazily computed super-additive extension of a delta-min vector.
+
+    Any n + m - 1 consecutive jobs consist of n consecutive jobs followed by
+    m consecutive jobs that share one job, so the gaps of the delta-min vector
+    satisfy dmin(n + m - 1) >= dmin(n) + dmin(m). The given prefix of K gaps is
+    first closed under this rule, which can only raise its gaps. Beyond the
+    prefix, the vector is then extended with the tightest such bound,
+
+        dmin(n) = max { dmin(k) + dmin(n + 1 - k) | 2 <= k <= K + 1 },
+
+    which is a max-plus linear recurrence over the last K gaps. (Splits at
+    k > K + 1 cannot yield more, as the closed prefix is super-additive.) Such a
+    recurrence eventually becomes periodic: once the last K - 1 increments of
+    the vector repeat, all following increments repeat, too. The extension
+    detects this with a rolling hash over the increments and answers all
+    queries beyond that point in closed form.
+
+    The extension may be shared by several threads. Extending it is serialized
+    by a lock, whereas queries need none: the gaps are only ever appended to,
+    and the period is set only once the gaps that it refers to exist.
+    """
+
+    # Parameters of the rolling hash over the increments of the vector.
+    HASH_BASE: int = 1_000_003
+    HASH_MODULUS: int = (1 << 61) - 1
+
+    def __init__(self, prefix: tuple[Duration, ...]) -> None:
+        # gaps[i] is the minimum separation of i + 2 jobs; extended in place
+        self.gaps: list[Duration] = self.closure(prefix)
+        self.prefix: tuple[Duration, ...] = tuple(self.gaps)
+        gaps = self.gaps
+        self.window: int = len(self.prefix) - 1
+        self.increments: list[Duration] = [b - a for a, b in pairwise(gaps)]
+        # Once detected, (first, length, growth) such that for any i >= first,
+        # gaps[i + length] == gaps[i] + growth.
+        self.period: tuple[int, int, Duration] | None = None
+        self.window_hash: int = 0
+        for inc in self.increments[len(self.increments) - self.window :]:
+            self.window_hash = self.rolling_hash_step(self.window_hash, inc, 0)
+        self.seen_windows: dict[int, int] = {self.window_hash: len(gaps) - 1}
+        self.lock: Lock = Lock()
+
+    @override
+    def __getstate__(self) -> dict[str, object]:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self.lock = Lock()
+
+    @staticmethod
+    def closure(prefix: tuple[Duration, ...]) -> list[Duration]:
+        """The least super-additive gaps above the given ones, i.e., such that
+        gaps[i + j + 1] >= gaps[i] + gaps[j]."""
+        gaps = list(prefix)
+        for m in range(1, len(gaps)):
+            gaps[m] = max(gaps[m], max(map(add, gaps[:m], reversed(gaps[:m]))))
+        return gaps
+
+    def rolling_hash_step(self, h: int, incoming: Duration, outgoing: Duration) -> int:
+        drop = outgoing * pow(self.HASH_BASE, self.window, self.HASH_MODULUS)
+        return (h * self.HASH_BASE + incoming - drop) % self.HASH_MODULUS
+
+    def append_next(self) -> None:
+        "Compute the next gap from the recurrence and check for periodicity."
+        gaps, increments = self.gaps, self.increments
+        nxt = max(map(add, self.prefix, reversed(gaps)))
+        increments.append(nxt - gaps[-1])
+        gaps.append(nxt)
+
+        outgoing = increments[-1 - self.window] if self.window > 0 else 0
+        incoming = increments[-1] if self.window > 0 else 0
+        self.window_hash = self.rolling_hash_step(self.window_hash, incoming, outgoing)
+
+        pos = len(gaps) - 1
+        earlier = self.seen_windows.get(self.window_hash)
+        if earlier is not None and self.same_window(earlier, pos):
+            self.period = (earlier, pos - earlier, gaps[pos] - gaps[earlier])
+        else:
+            self.seen_windows[self.window_hash] = pos
+
+    def same_window(self, i: int, j: int) -> bool:
+        "Check whether the increments leading up to gaps[i] and gaps[j] agree."
+        w, increments = self.window, self.increments
+        return increments[i - w : i] == increments[j - w : j]
+
+    def extend_to_index(self, idx: int) -> None:
+        if len(self.gaps) <= idx and self.period is None:
+            with self.lock:
+                while len(self.gaps) <= idx and self.period is None:
+                    self.append_next()
+
+    def extend_to_delta(self, delta: Duration) -> None:
+        if self.gaps[-1] < delta and self.period is None:
+            with self.lock:
+                while self.gaps[-1] < delta and self.period is None:
+                    self.append_next()
+
+    def extend_to_period(self) -> None:
+        if self.period is None:
+            with self.lock:
+                while self.period is None:
+                    self.append_next()
+
+    def gap(self, idx: int) -> Duration:
+        "The minimum separation of idx + 2 jobs."
+        self.extend_to_index(idx)
+        if idx < len(self.gaps):
+            return self.gaps[idx]
+        assert self.period is not None
+        first, length, growth = self.period
+        q, r = divmod(idx - first, length)
+        return self.gaps[first + r] + q * growth
+
+    def first_index_covering(self, delta: Duration) -> int:
+        "The least idx such that gap(idx) >= delta."
+        self.extend_to_delta(delta)
+        gaps = self.gaps
+        if delta <= gaps[-1]:
+            return bisect_left(gaps, delta)
+        assert self.period is not None
+        first, length, growth = self.period
+        if growth == 0:
+            raise OverflowError("delta-min vector admits unboundedly many arrivals")
+        last = first + length - 1
+        q = -((gaps[last] - delta) // growth)  # ceil((delta - gaps[last]) / growth)
+        return bisect_left(gaps, delta - q * growth, first, last + 1) + q * length
+
+    def rate_and_burst(self) -> tuple[Fraction, Fraction]:
+        """The long-term rate of the arrival curve and the least b such that the
+        arrival curve lies below the line rate * delta + b."""
+        self.extend_to_period()
+        assert self.period is not None
+        _first, length, growth = self.period
+        if growth == 0:
+            raise OverflowError("delta-min vector admits unboundedly many arrivals")
+        rate = Fraction(length, growth)
+        # If m jobs fit into delta, then gaps[m - 2] < delta, i.e.,
+        # m <= rate * delta + (m - rate * (gaps[m - 2] + 1)). The right-hand term is
+        # periodic in the tail, so it suffices to consider the known gaps.
+        burst = max(
+            Fraction(0),  # no jobs in empty intervals
+            1 - rate,  # a single job
+            max(idx + 2 - rate * (gap + 1) for idx, gap in enumerate(self.gaps[:])),
+        )
+        return rate, burst
+
+    def deficit(self) -> Fraction:
+        """The least s such that the arrival curve lies above the line
+        rate * delta - s, where rate is the long-term rate."""
+        rate, _burst = self.rate_and_burst()
+        # On (gaps[idx - 1], gaps[idx]], the arrival curve counts idx + 1 jobs and is
+        # farthest below the rate line at gaps[idx]. The distance is periodic in the
+        # tail, so it suffices to consider the known gaps.
+        return max(
+            Fraction(0),
+            max(rate * gap - (idx + 1) for idx, gap in enumerate(self.gaps[:])),
+        )
+
+    def first_indices_covering(self, deltas: Array) -> Array:
+        "Vectorized first_index_covering() for a non-empty NumPy array of deltas."
+        assert np is not None
+        self.extend_to_delta(int(np.max(deltas)))
+        gaps = np.asarray(self.gaps, dtype=np.int64)
+        result = np.searchsorted(gaps, deltas, side="left")
+        beyond = deltas > self.gaps[-1]
+        if np.any(beyond):
+            assert self.period is not None
+            first, length, growth = self.period
+            if growth == 0:
+                raise OverflowError("delta-min vector admits unboundedly many arrivals")
+            last = first + length - 1
+            tail = deltas[beyond]
+            q = -((self.gaps[last] - tail) // growth)
+            window = gaps[first : last + 1]
+            pos = np.searchsorted(window, tail - q * growth, side="left")
+            result[beyond] = first + pos + q * length
+        return result
+
+
 @dataclass(frozen=True)
 class MinimumSeparationVector:
     """Sporadic arrivals charaterized by an arbitrary arrival-curve prefix,
@@ -136,16 +401,23 @@ class MinimumSeparationVector:
     # delta-min vector:
     # dmin[0] is the minimum separation of two jobs,
     # dmin[1] is the minimum separation of three jobs,
-    # and so on.
-    dmin: list[Duration]
+    # and so on. Stored as a tuple.
+    dmin: Sequence[Duration]
+    # Super-additive closure of dmin and its extension beyond the given prefix,
+    # which is computed lazily and kept separately from dmin.
+    _extension: _SuperAdditiveExtension = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        # The dataclass is frozen, so derived fields must be set via object.__setattr__.
+        dmin = tuple(self.dmin)
+        object.__setattr__(self, "dmin", dmin)
         if len(self.dmin) == 0:
             raise ValueError("dmin must not be empty")
         if any(gap < 0 for gap in self.dmin):
             raise ValueError("dmin gaps must be non-negative")
         if any(b < a for a, b in zip(self.dmin, self.dmin[1:])):
             raise ValueError("dmin must be non-decreasing")
+        object.__setattr__(self, "_extension", _SuperAdditiveExtension(dmin))
 
     def __call__(self, delta: Duration) -> JobCount:
         r"Upper arrival curve $\alpha^+(\delta)$"
@@ -159,39 +431,35 @@ class MinimumSeparationVector:
     def max_covered_njobs(self) -> int:
         return len(self.dmin) + 1
 
-    def extrapolate(self):
-        n = self.max_covered_njobs + 1
-        dmin_for_n = max(
-            (
-                self.min_gap_between(i) + self.min_gap_between(n - i + 1)
-                for i in range(2, self.max_covered_njobs // 2)
-            ),
-            default=self.dmin[0] * (n - 1),
-        )
-        self.dmin.append(dmin_for_n)
+    def extrapolate(self) -> MinimumSeparationVector:
+        """Return a copy of the vector with the next entry of the super-additive
+        extension appended to dmin."""
+        next_gap = self.min_gap_between(self.max_covered_njobs + 1)
+        return MinimumSeparationVector((*self.dmin, next_gap))
 
     def min_gap_between(self, n: int) -> Duration:
         if n <= 1:
             return 0
 
-        while self.max_covered_njobs < n:
-            self.extrapolate()
-
-        return self.dmin[n - 2]
+        return self._extension.gap(n - 2)
 
     def max_arrivals(self, delta: Duration) -> JobCount:
         r"Upper arrival curve $\alpha^+(\delta)$"
         if delta <= 0:
             return 0
 
-        while self.max_covered_delta < delta:
-            self.extrapolate()
-
-        for n in range(2, self.max_covered_njobs + 1):
-            if delta <= self.min_gap_between(n):
-                return n - 1
+        # The least n such that delta <= min_gap_between(n) is n = idx + 2,
+        # and then at most n - 1 jobs fit into delta.
+        return self._extension.first_index_covering(delta) + 1
 
-        assert False  # not reachable
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        d = as_array(deltas)
+        if len(d) == 0:
+            return d
+        return np.where(d <= 0, 0, self._extension.first_indices_covering(d) + 1)
 
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
@@ -204,6 +472,18 @@ class MinimumSeparationVector:
                 yield gap
                 last_yielded = gap
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return self._extension.rate_and_burst()[0]
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return self._extension.rate_and_burst()[1]
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return self._extension.deficit()
+
     def as_arrival_curve_prefix(
         self, horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -229,10 +509,17 @@ class ArrivalCurvePrefix:
     # The steps of the eta-max curve up to the horizon.
     # A tuple (δ, c) ∈ ac_steps means
     # α(δ) = c and ∀ δ' < δ,  α(δ) < c.
-    # The first step must be for δ=EPSILON_TIME.
-    ac_steps: list[tuple[Duration, JobCount]]
+    # The first step must be for δ=EPSILON_TIME. Stored as a tuple.
+    ac_steps: Sequence[tuple[Duration, JobCount]]
+    # Index for logarithmic lookups: the deltas and job counts of `ac_steps`,
+    # split into two parallel tuples. Derived from `ac_steps` at construction time.
+    _step_deltas: tuple[Duration, ...] = field(init=False, repr=False, compare=False)
+    _step_jobs: tuple[JobCount, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        # The dataclass is frozen, so derived fields must be set via object.__setattr__.
+        steps = tuple((delta, jobs) for delta, jobs in self.ac_steps)
+        object.__setattr__(self, "ac_steps", steps)
         if self.horizon <= 0:
             raise ValueError("horizon must be positive")
         if isinstance(self.horizon, float) and self.horizon is not INFINITY:
@@ -254,6 +541,8 @@ class ArrivalCurvePrefix:
                     raise ValueError("ac_steps must be increasing in job count")
             last_delta = delta
             last_jobs = jobs
+        object.__setattr__(self, "_step_deltas", tuple(d for d, _ in self.ac_steps))
+        object.__setattr__(self, "_step_jobs", tuple(j for _, j in self.ac_steps))
 
     def __call__(self, delta: Duration) -> JobCount:
         r"Upper arrival curve $\alpha^+(\delta)$"
@@ -265,11 +554,8 @@ class ArrivalCurvePrefix:
 
         assert delta < self.horizon
 
-        for i in range(1, len(self.ac_steps)):
-            if self.ac_steps[i][0] > delta:
-                return self.ac_steps[i - 1][1]
-
-        return self.ac_steps[-1][1]
+        # The first step is at EPSILON_TIME <= delta, so the index is never zero.
+        return self._step_jobs[bisect_right(self._step_deltas, delta) - 1]
 
     def max_arrivals(self, delta: Duration) -> JobCount:
         r"Upper arrival curve $\alpha^+(\delta)$"
@@ -288,7 +574,23 @@ class ArrivalCurvePrefix:
             full_windows = 0
             jobs_in_last_window = self.max_arrivals_within_horizon(delta)
 
-        return full_windows * self.ac_steps[-1][1] + jobs_in_last_window
+        return full_windows * self._step_jobs[-1] + jobs_in_last_window
+
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        d = as_array(deltas)
+        if isinstance(self.horizon, Duration):
+            full_windows, offset = np.divmod(d, self.horizon)
+        else:
+            full_windows, offset = np.zeros_like(d), d
+        # prepend a zero so that offsets below EPSILON_TIME map to zero jobs
+        step_deltas = np.asarray(self._step_deltas, dtype=np.int64)
+        step_jobs = np.asarray((0,) + self._step_jobs, dtype=np.int64)
+        in_last_window = step_jobs[np.searchsorted(step_deltas, offset, side="right")]
+        jobs = full_windows * self._step_jobs[-1] + in_last_window
+        return np.where(d <= 0, 0, jobs)
 
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
@@ -303,6 +605,37 @@ class ArrivalCurvePrefix:
             for delta, _job_count in self.ac_steps:
                 yield delta
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        if isinstance(self.horizon, Duration):
+            return Fraction(self._step_jobs[-1], self.horizon)
+        else:
+            return Fraction(0)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        # Within each window, the distance to the rate line is largest at the
+        # beginning of a step.
+        rate = self.long_term_rate()
+        return max(
+            Fraction(0),
+            max(jobs - rate * delta for delta, jobs in self.ac_steps),
+        )
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        # Within each window, the distance to the rate line is largest at the
+        # end of a step, just before the next one (or the end of the window).
+        if not isinstance(self.horizon, Duration):
+            # special case for "infinity": the rate is zero
+            return Fraction(0)
+        rate = self.long_term_rate()
+        ends = (*self._step_deltas[1:], self.horizon)
+        return max(
+            Fraction(0),
+            max(rate * (end - 1) - jobs for end, jobs in zip(ends, self._step_jobs)),
+        )
+
     def as_arrival_curve_prefix(
         self, _horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -322,11 +655,29 @@ class Once:
         r"Upper arrival curve $\alpha^+(\delta)$"
         return 0 if delta <= 0 else 1
 
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        if np is None or not have_numpy():
+            return [self.max_arrivals(delta) for delta in deltas]
+        return (as_array(deltas) > 0).astype(np.int64)
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         max_arrivals(delta) != max_arrivals(delta + 1)"""
         yield 0
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return Fraction(0)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return Fraction(1)
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
     def as_arrival_curve_prefix(
         self, _horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -346,11 +697,27 @@ class Never:
         r"Upper arrival curve $\alpha^+(\delta)$"
         return 0
 
+    def max_arrivals_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate max_arrivals() for each of the given deltas."
+        return zeros_like(as_batch(deltas))
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         max_arrivals(delta) != max_arrivals(delta + 1)"""
         return iter([])
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term arrival rate: jobs per time unit in the limit of large deltas."
+        return Fraction(0)
+
+    def burst(self) -> Fraction:
+        "The least b such that max_arrivals(delta) <= long_term_rate() * delta + b."
+        return Fraction(0)
+
+    def deficit(self) -> Fraction:
+        "The least s such that max_arrivals(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
     def as_arrival_curve_prefix(
         self, _horizon: Duration | None = None
     ) -> ArrivalCurvePrefix:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from fractions import Fraction
 from typing import TypeAlias
 
 from .arrival import JobCount
 from .time import EPSILON_TIME, Work
+from .vectorized import Batch, as_array, have_numpy, np
 
 
 @dataclass(frozen=True, eq=True, order=True)
@@ -27,11 +30,22 @@ class WCET:
         else:
             return njobs * self.value
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term cost per job: the slope of max_cost()."
+        return Fraction(self.value)
+
+    def max_cost_many(self, njobs: Iterable[JobCount]) -> Batch:
+        "Evaluate max_cost() for each of the given job counts."
+        if np is None or not have_numpy():
+            return [self.max_cost(n) for n in njobs]
+        n = as_array(njobs)
+        return np.where(n <= 0, 0, n * self.value)
+
 
 CostModel: TypeAlias = WCET
 
 
-@dataclass
+@dataclass(frozen=True)
 class FullyPreemptive:
     "The classic preemption model in which a task's jobs can be preempted at any time"
 
@@ -48,7 +62,7 @@ class FullyPreemptive:
         return self.wcet.value
 
 
-@dataclass
+@dataclass(frozen=True)
 class FullyNonPreemptive:
     "A preemption model with run-to-completion semantics: once started, a job cannot be preempted."
 
@@ -65,7 +79,7 @@ class FullyNonPreemptive:
         return EPSILON_TIME
 
 
-@dataclass
+@dataclass(frozen=True)
 class FloatingNonPreemptive:
     "A preemption model in which a task's jobs can contain non-preemptive segments at unknown times"
 
@@ -89,7 +103,7 @@ class FloatingNonPreemptive:
         return self.wcet.value
 
 
-@dataclass
+@dataclass(frozen=True)
 class LimitedPreemptive:
     """A preemption model in which a task's jobs consist of a sequence of non-preemptive
     segments with known preemption points."""
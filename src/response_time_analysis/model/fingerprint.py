@@ -0,0 +1,11 @@
+from hashlib import sha256
+
+
+def fingerprint(obj: object) -> str:
+    """A canonical fingerprint of the content of a model object, which is stable
+    across processes and sessions (unlike hash()) and hence suitable as a cache key.
+
+    The fingerprint is the SHA-256 digest of the object's repr(), which, for the
+    frozen model dataclasses, lists exactly the fields that define them.
+    """
+    return sha256(repr(obj).encode()).hexdigest()
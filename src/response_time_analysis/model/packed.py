@@ -0,0 +1,254 @@
+"""A packed, array-backed serialization of task sets.
+
+A task set is packed into a flat buffer of native 64-bit integers: a header, one
+fixed-size record per task, and a pool that holds the delta-min vectors and
+arrival-curve steps. Unpacking decodes the parameters from the buffer (e.g., a
+memoryview of shared memory) without an intermediate pickle, copying each record
+and each vector out of the buffer with a single slice.
+
+SharedTaskSet places a packed task set in multiprocessing.shared_memory. Worker
+processes receive only its small, picklable SharedTaskSetHandle, which they
+attach to; each process unpacks a shared task set only once.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from .arrival import (
+    INFINITY,
+    ArrivalCurvePrefix,
+    ArrivalModel,
+    MinimumSeparationVector,
+    Never,
+    Once,
+    Periodic,
+    PeriodicWithJitter,
+    Sporadic,
+)
+from .execution import (
+    WCET,
+    FloatingNonPreemptive,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    LimitedPreemptive,
+    PreemptionModel,
+)
+from .policy import Deadline, Priority
+from .task import Task, TaskSet
+
+if TYPE_CHECKING:
+    from typing import Self
+
+FORMAT_VERSION = 1
+
+# header: format version, number of tasks
+HEADER_WORDS = 2
+# per task: arrival kind and three arrival parameters, preemption kind, wcet,
+# max_nps, last_nps, deadline, priority
+RECORD_WORDS = 10
+
+# Marks absent deadlines and priorities, and infinite arrival-curve horizons.
+NONE = -1
+
+# arrival kinds
+_PERIODIC = 0
+_PERIODIC_WITH_JITTER = 1
+_SPORADIC = 2
+_MSV = 3
+_ACP = 4
+_ONCE = 5
+_NEVER = 6
+
+# preemption kinds
+_FULLY_PREEMPTIVE = 0
+_FULLY_NON_PREEMPTIVE = 1
+_FLOATING_NON_PREEMPTIVE = 2
+_LIMITED_PREEMPTIVE = 3
+
+
+def _pack_arrivals(am: ArrivalModel, pool: array[int]) -> tuple[int, int, int, int]:
+    # pool offsets are relative to the start of the pool
+    match am:
+        case Periodic(period):
+            return _PERIODIC, period, 0, 0
+        case PeriodicWithJitter(period, jitter):
+            return _PERIODIC_WITH_JITTER, period, jitter, 0
+        case Sporadic(mit):
+            return _SPORADIC, mit, 0, 0
+        case MinimumSeparationVector(dmin):
+            offset = len(pool)
+            pool.extend(dmin)
+            return _MSV, offset, len(dmin), 0
+        case ArrivalCurvePrefix(horizon, ac_steps):
+            offset = len(pool)
+            for delta, jobs in ac_steps:
+                pool.append(delta)
+                pool.append(jobs)
+            packed_horizon = NONE if horizon is INFINITY else int(horizon)
+            return _ACP, packed_horizon, offset, len(ac_steps)
+        case Once():
+            return _ONCE, 0, 0, 0
+        case Never():
+            return _NEVER, 0, 0, 0
+
+
+def _pack_execution(pm: PreemptionModel) -> tuple[int, int, int, int]:
+    match pm:
+        case FullyPreemptive(wcet):
+            return _FULLY_PREEMPTIVE, wcet.value, 0, 0
+        case FullyNonPreemptive(wcet):
+            return _FULLY_NON_PREEMPTIVE, wcet.value, 0, 0
+        case FloatingNonPreemptive(wcet, max_nps):
+            return _FLOATING_NON_PREEMPTIVE, wcet.value, max_nps, 0
+        case LimitedPreemptive(wcet, max_nps, last_nps):
+            return _LIMITED_PREEMPTIVE, wcet.value, max_nps, last_nps
+
+
+def pack(ts: TaskSet) -> bytes:
+    "Pack the task set into a flat buffer of native 64-bit integers."
+    records = array("q", (FORMAT_VERSION, len(ts)))
+    pool = array("q")
+    for t in ts:
+        records.extend(_pack_arrivals(t.arrivals, pool))
+        records.extend(_pack_execution(t.execution))
+        records.append(NONE if t.deadline is None else t.deadline.value)
+        records.append(NONE if t.priority is None else t.priority.value)
+    return records.tobytes() + pool.tobytes()
+
+
+def _unpack_arrivals(
+    kind: int, a0: int, a1: int, a2: int, pool: memoryview
+) -> ArrivalModel:
+    if kind == _PERIODIC:
+        return Periodic(a0)
+    if kind == _PERIODIC_WITH_JITTER:
+        return PeriodicWithJitter(a0, a1)
+    if kind == _SPORADIC:
+        return Sporadic(a0)
+    if kind == _MSV:
+        return MinimumSeparationVector(pool[a0 : a0 + a1].tolist())
+    if kind == _ACP:
+        words = pool[a1 : a1 + 2 * a2].tolist()
+        horizon = INFINITY if a0 == NONE else a0
+        return ArrivalCurvePrefix(horizon, tuple(zip(words[::2], words[1::2])))
+    if kind == _ONCE:
+        return Once()
+    if kind == _NEVER:
+        return Never()
+    raise ValueError(f"unknown packed arrival model kind {kind}")
+
+
+def _unpack_execution(
+    kind: int, wcet: int, max_nps: int, last_nps: int
+) -> PreemptionModel:
+    if kind == _FULLY_PREEMPTIVE:
+        return FullyPreemptive(WCET(wcet))
+    if kind == _FULLY_NON_PREEMPTIVE:
+        return FullyNonPreemptive(WCET(wcet))
+    if kind == _FLOATING_NON_PREEMPTIVE:
+        return FloatingNonPreemptive(WCET(wcet), max_nps)
+    if kind == _LIMITED_PREEMPTIVE:
+        return LimitedPreemptive(WCET(wcet), max_nps, last_nps)
+    raise ValueError(f"unknown packed preemption model kind {kind}")
+
+
+def unpack(buffer: bytes | memoryview) -> TaskSet:
+    """Reconstruct a task set from a buffer produced by pack().
+
+    The buffer may extend beyond the packed task set, as shared-memory segments
+    can be rounded up to whole pages.
+    """
+    words = memoryview(buffer).cast("B").cast("q")
+    try:
+        version, n = words[0], words[1]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported packed task set format {version}")
+        pool = words[HEADER_WORDS + n * RECORD_WORDS :]
+        tasks: list[Task] = []
+        for i in range(n):
+            start = HEADER_WORDS + i * RECORD_WORDS
+            ak, a0, a1, a2, ek, wcet, max_nps, last_nps, dl, prio = words[
+                start : start + RECORD_WORDS
+            ].tolist()
+            tasks.append(
+                Task(
+                    _unpack_arrivals(ak, a0, a1, a2, pool),
+                    _unpack_execution(ek, wcet, max_nps, last_nps),
+                    None if dl == NONE else Deadline(dl),
+                    None if prio == NONE else Priority(prio),
+                )
+            )
+        return TaskSet(tuple(tasks))
+    finally:
+        words.release()
+
+
+@dataclass(frozen=True)
+class SharedTaskSetHandle:
+    "A picklable reference to a task set packed in shared memory."
+
+    name: str
+
+    def attach(self) -> TaskSet:
+        """The task set in the referenced shared-memory segment. The segment is
+        unpacked once per process; ATTACH_CACHE_SIZE task sets are retained."""
+        with _attached_lock:
+            ts = _attached.get(self.name)
+            if ts is not None:
+                _attached.move_to_end(self.name)
+                return ts
+        shm = SharedMemory(self.name)
+        try:
+            assert shm.buf is not None
+            ts = unpack(shm.buf)
+        finally:
+            shm.close()
+        with _attached_lock:
+            _attached[self.name] = ts
+            while len(_attached) > ATTACH_CACHE_SIZE:
+                _ = _attached.popitem(last=False)
+        return ts
+
+
+ATTACH_CACHE_SIZE = 8
+
+# The task sets attached in this process, by segment name, in LRU order.
+_attached: OrderedDict[str, TaskSet] = OrderedDict()
+_attached_lock = Lock()
+
+
+class SharedTaskSet:
+    """A task set packed into a new shared-memory segment, which is released
+    (closed and unlinked) by close() or on leaving a with block.
+
+    The segment must outlive all uses of its handle in other processes."""
+
+    def __init__(self, ts: TaskSet):
+        data = pack(ts)
+        self.taskset: TaskSet = ts
+        self._shm: SharedMemory = SharedMemory(create=True, size=len(data))
+        assert self._shm.buf is not None
+        self._shm.buf[: len(data)] = data
+        self.handle: SharedTaskSetHandle = SharedTaskSetHandle(self._shm.name)
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
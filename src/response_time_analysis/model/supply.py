@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from fractions import Fraction
 from typing import TypeAlias
 
+from .fingerprint import fingerprint
 from .time import Duration, Work
 
 
@@ -23,6 +25,29 @@ class IdealProcessor:
     def __call__(self, delta: Duration) -> Work:
         return self.supply_bound(delta)
 
+    def supply_inverse(self, work: Work) -> Duration:
+        "The least delta such that supply_bound(delta) >= work."
+        if work > 0:
+            return -(-work // self.speed)
+        else:
+            return 0
+
+    def long_term_rate(self) -> Fraction:
+        "The long-term supply rate: work per time unit in the limit of large deltas."
+        return Fraction(self.speed)
+
+    def fingerprint(self) -> str:
+        "A canonical content fingerprint of the supply model (see model.fingerprint())."
+        return fingerprint(self)
+
+    def supply_deficit(self) -> Fraction:
+        "The least s such that supply_bound(delta) >= long_term_rate() * delta - s."
+        return Fraction(0)
+
+    def supply_surplus(self) -> Fraction:
+        "The least e such that supply_bound(delta) <= long_term_rate() * delta + e."
+        return Fraction(0)
+
 
 @dataclass(frozen=True)
 class RateDelayModel:
@@ -48,5 +73,32 @@ class RateDelayModel:
     def __call__(self, delta: Duration) -> Work:
         return self.supply_bound(delta)
 
+    def supply_inverse(self, work: Work) -> Duration:
+        "The least delta such that supply_bound(delta) >= work."
+        if work > 0:
+            return self.delay + -(-(work * self.period) // self.allocation)
+        else:
+            return 0
+
+    def long_term_rate(self) -> Fraction:
+        "The long-term supply rate: work per time unit in the limit of large deltas."
+        return Fraction(self.allocation, self.period)
+
+    def fingerprint(self) -> str:
+        "A canonical content fingerprint of the supply model (see model.fingerprint())."
+        return fingerprint(self)
+
+    def supply_deficit(self) -> Fraction:
+        "The least s such that supply_bound(delta) >= long_term_rate() * delta - s."
+        # the delay plus the rounding loss of at most (period - 1) / period
+        return self.long_term_rate() * self.delay + Fraction(
+            self.period - 1, self.period
+        )
+
+    def supply_surplus(self) -> Fraction:
+        "The least e such that supply_bound(delta) <= long_term_rate() * delta + e."
+        # the supply starts only after the delay and is rounded down
+        return Fraction(0)
+
 
 SupplyModel: TypeAlias = IdealProcessor | RateDelayModel
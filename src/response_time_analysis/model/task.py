@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, replace
+from functools import cached_property
+from itertools import accumulate
+from threading import Lock
 from typing import overload
 
-from response_time_analysis.model.time import Duration
+from response_time_analysis.model.time import EPSILON_TIME, Duration, Work
 
 from .arrival import ArrivalModel
 from .execution import CostModel, PreemptionModel
+from .fingerprint import fingerprint
 from .policy import (
     Deadline,
     Priority,
@@ -26,17 +32,28 @@ class Task:
     def cost(self) -> CostModel:
         return self.execution.wcet
 
-    @property
+    # The derived workload bounds are cached in the instance's __dict__, which
+    # bypasses the frozen __setattr__ and is ignored by the generated __eq__,
+    # __hash__, and __repr__.
+    @cached_property
     def rbf(self) -> RequestBoundFunction:
         return RequestBoundFunction(self.cost, self.arrivals)
 
-    @property
+    @cached_property
     def dbf(self) -> DemandBoundFunction | None:
         if self.deadline is not None:
             return DemandBoundFunction(self.rbf, self.deadline)
         else:
             return None
 
+    def fingerprint(self) -> str:
+        "A canonical content fingerprint of the task (see model.fingerprint())."
+        return self._fingerprint
+
+    @cached_property
+    def _fingerprint(self) -> str:
+        return fingerprint(self)
+
     def with_arrival_curve_prefix(self, horizon: Duration | None = None) -> Task:
         "Return a copy of the task with the arrival model replaced by an arrival-curve prefix."
         return replace(self, arrivals=self.arrivals.as_arrival_curve_prefix(horizon))
@@ -58,25 +75,41 @@ def prio_of(t: Task) -> Priority:
     return t.priority if t.priority is not None else priority_parameter_missing()
 
 
+# the number of filtered task sets that each task set retains (see TaskSet._subset())
+SUBSET_CACHE_SIZE = 64
+
+_subsets_lock = Lock()
+
+
 @dataclass(frozen=True)
 class TaskSet:
     tasks: tuple[Task, ...]
 
-    @property
+    # cached like Task.rbf and Task.dbf
+    @cached_property
     def rbf(self) -> Total:
         return total(t.rbf for t in self.tasks)
 
-    @property
+    @cached_property
     def max_arrivals(self) -> Total:
         return total(t.arrivals for t in self.tasks)
 
-    @property
+    @cached_property
     def dbf(self) -> Total:
         return total(
             t.dbf if t.dbf is not None else deadline_parameter_missing()
             for t in self.tasks
         )
 
+    def fingerprint(self) -> str:
+        """A canonical content fingerprint of the task set, derived from the
+        fingerprints of its tasks in order (see model.fingerprint())."""
+        return self._fingerprint
+
+    @cached_property
+    def _fingerprint(self) -> str:
+        return fingerprint(tuple(t.fingerprint() for t in self.tasks))
+
     def is_empty(self) -> bool:
         return len(self.tasks) == 0
 
@@ -89,17 +122,73 @@ class TaskSet:
     def such_that(self, pred: Callable[[Task], bool]) -> TaskSet:
         return TaskSet(tuple(t for t in self.tasks if pred(t)))
 
+    # The priority and deadline filters are served from indexes that are built
+    # on first use. They return the tasks in order of increasing priority or
+    # deadline, respectively, rather than in the order of the task set. The
+    # resulting task sets are cached per cut point of the index (see _subset()), so
+    # that repeated calls with the same threshold share one TaskSet and thus its
+    # cached RBF and DBF.
+    @cached_property
+    def _priority_index(self) -> tuple[list[Priority], tuple[Task, ...], list[Work]]:
+        """The tasks in order of increasing priority, their priorities, and the
+        running maximum of their non-preemptive segments."""
+        ordered = tuple(sorted(self.tasks, key=prio_of))
+        nps = (t.execution.max_non_preemptive_segment for t in ordered)
+        return [prio_of(t) for t in ordered], ordered, list(accumulate(nps, max))
+
+    @cached_property
+    def _deadline_index(self) -> tuple[list[Deadline], tuple[Task, ...], list[Work]]:
+        """The tasks in order of increasing deadline, their deadlines, and the
+        maximum non-preemptive segment of each suffix."""
+        ordered = tuple(sorted(self.tasks, key=deadline_of))
+        nps = (t.execution.max_non_preemptive_segment for t in reversed(ordered))
+        suffix_max = list(accumulate(nps, max))
+        suffix_max.reverse()
+        return [deadline_of(t) for t in ordered], ordered, suffix_max
+
+    @cached_property
+    def _subsets(self) -> OrderedDict[tuple[str, int, int], TaskSet]:
+        return OrderedDict()
+
+    def _subset(
+        self, key: tuple[str, int, int], tasks: Callable[[], tuple[Task, ...]]
+    ) -> TaskSet:
+        """The task set of the given tasks, retained under the key for the
+        SUBSET_CACHE_SIZE most recently used keys."""
+        subsets = self._subsets
+        with _subsets_lock:
+            subset = subsets.get(key)
+            if subset is not None:
+                subsets.move_to_end(key)
+                return subset
+        # Concurrent misses may build the same task set twice, which is harmless.
+        subset = TaskSet(tasks())
+        with _subsets_lock:
+            subset = subsets.setdefault(key, subset)
+            if len(subsets) > SUBSET_CACHE_SIZE:
+                _ = subsets.popitem(last=False)
+        return subset
+
+    @cached_property
+    def with_workload(self) -> TaskSet:
+        "The tasks that can release any workload, i.e., whose rbf(EPSILON_TIME) > 0."
+        return self.such_that(lambda t: t.rbf(EPSILON_TIME) > 0)
+
     def with_priority_higher_than(self, prio_level: Priority | Task) -> TaskSet:
         if isinstance(prio_level, Task):
             prio_level = prio_of(prio_level)
-        return self.such_that(lambda t: prio_of(t) > prio_level)
+        prios, ordered, _ = self._priority_index
+        cut = bisect_right(prios, prio_level)
+        return self._subset(("prio>", cut, -1), lambda: ordered[cut:])
 
     def with_priority_higher_than_or_equal_to(
         self, prio_level: Priority | Task
     ) -> TaskSet:
         if isinstance(prio_level, Task):
             prio_level = prio_of(prio_level)
-        return self.such_that(lambda t: prio_of(t) >= prio_level)
+        prios, ordered, _ = self._priority_index
+        cut = bisect_left(prios, prio_level)
+        return self._subset(("prio>", cut, -1), lambda: ordered[cut:])
 
     def with_priority_higher_than_or_equal_to_excluding(
         self,
@@ -108,47 +197,133 @@ class TaskSet:
     ) -> TaskSet:
         if prio_level is None:
             prio_level = prio_of(excluded)
-        return self.such_that(lambda t: prio_of(t) >= prio_level and t != excluded)
+        prios, ordered, _ = self._priority_index
+        cut = bisect_left(prios, prio_level)
+        idx = self._position(excluded)
+        if idx is None:
+            return self._subset(("prio>", cut, -1), lambda: ordered[cut:])
+
+        def hep_excluding() -> tuple[Task, ...]:
+            hep = ordered[cut:]
+            member = self.tasks[idx]
+            # remove one occurrence of the member (which may be listed more than once)
+            for i, t in enumerate(hep):
+                if t is member:
+                    return hep[:i] + hep[i + 1 :]
+            return hep
+
+        return self._subset(("prio>", cut, idx), hep_excluding)
 
     def with_priority_lower_than(self, prio_level: Priority | Task) -> TaskSet:
         if isinstance(prio_level, Task):
             prio_level = prio_of(prio_level)
-        return self.such_that(lambda t: prio_of(t) < prio_level)
+        prios, ordered, _ = self._priority_index
+        cut = bisect_left(prios, prio_level)
+        return self._subset(("prio<", cut, -1), lambda: ordered[:cut])
 
     def with_priority_lower_than_iter(
         self, prio_level: Priority | Task
     ) -> Iterator[Task]:
+        return iter(self._with_priority_lower_than(prio_level))
+
+    def _with_priority_lower_than(
+        self, prio_level: Priority | Task
+    ) -> tuple[Task, ...]:
+        if isinstance(prio_level, Task):
+            prio_level = prio_of(prio_level)
+        prios, ordered, _ = self._priority_index
+        return ordered[: bisect_left(prios, prio_level)]
+
+    def max_non_preemptive_segment_with_priority_lower_than(
+        self, prio_level: Priority | Task
+    ) -> Work | None:
+        "The maximum non-preemptive segment of any lower-priority task (None if none)."
         if isinstance(prio_level, Task):
             prio_level = prio_of(prio_level)
-        return (t for t in self.tasks if prio_of(t) < prio_level)
+        prios, _, prefix_max = self._priority_index
+        idx = bisect_left(prios, prio_level)
+        return prefix_max[idx - 1] if idx > 0 else None
 
     def with_deadline_at_most(self, reference: Deadline | Task) -> TaskSet:
         if isinstance(reference, Task):
             reference = deadline_of(reference)
-        return self.such_that(lambda t: deadline_of(t) <= reference)
+        deadlines, ordered, _ = self._deadline_index
+        cut = bisect_right(deadlines, reference)
+        return self._subset(("dl<=", cut, -1), lambda: ordered[:cut])
 
     def with_deadline_at_most_iter(self, reference: Deadline | Task) -> Iterator[Task]:
+        return iter(self._with_deadline_at_most(reference))
+
+    def _with_deadline_at_most(self, reference: Deadline | Task) -> tuple[Task, ...]:
         if isinstance(reference, Task):
             reference = deadline_of(reference)
-        return (t for t in self.tasks if deadline_of(t) <= reference)
+        deadlines, ordered, _ = self._deadline_index
+        return ordered[: bisect_right(deadlines, reference)]
 
     def with_deadline_greater_than(self, reference: Deadline | Task) -> TaskSet:
         if isinstance(reference, Task):
             reference = deadline_of(reference)
-        return self.such_that(lambda t: deadline_of(t) > reference)
+        deadlines, ordered, _ = self._deadline_index
+        cut = bisect_right(deadlines, reference)
+        return self._subset(("dl>", cut, -1), lambda: ordered[cut:])
 
     def with_deadline_greater_than_iter(
         self, reference: Deadline | Task
     ) -> Iterator[Task]:
+        return iter(self._with_deadline_greater_than(reference))
+
+    def _with_deadline_greater_than(
+        self, reference: Deadline | Task
+    ) -> tuple[Task, ...]:
         if isinstance(reference, Task):
             reference = deadline_of(reference)
-        return (t for t in self.tasks if deadline_of(t) > reference)
+        deadlines, ordered, _ = self._deadline_index
+        return ordered[bisect_right(deadlines, reference) :]
+
+    def max_non_preemptive_segment_with_deadline_greater_than(
+        self, reference: Deadline | Task
+    ) -> Work | None:
+        """The maximum non-preemptive segment of any task with a deadline greater
+        than the reference (None if none)."""
+        if isinstance(reference, Task):
+            reference = deadline_of(reference)
+        deadlines, _, suffix_max = self._deadline_index
+        idx = bisect_right(deadlines, reference)
+        return suffix_max[idx] if idx < len(suffix_max) else None
+
+    def _position(self, task: Task) -> int | None:
+        # Members are found by identity, which is preserved when the task set is
+        # pickled or copied as a whole (unlike their id()).
+        for idx, t in enumerate(self.tasks):
+            if t is task:
+                return idx
+        # not a member of the task set, but possibly equal to one
+        try:
+            return self.tasks.index(task)
+        except ValueError:
+            return None
+
+    def index_of(self, task: Task) -> int:
+        """The position of the given task in the task set. Tasks are identified by
+        identity, or by equality if the given task is not itself a member.
+
+        Raises ValueError if the task is not in the task set."""
+        idx = self._position(task)
+        if idx is None:
+            raise ValueError("task not in task set")
+        return idx
 
+    # The exclusion filters remove exactly one task, namely the one at
+    # index_of(excluded), so that equal copies of a task in the same task set
+    # are still accounted for as separate tasks.
     def excluding(self, excluded: Task) -> TaskSet:
-        return self.such_that(lambda t: t != excluded)
+        idx = self._position(excluded)
+        if idx is None:
+            return self
+        return TaskSet(self.tasks[:idx] + self.tasks[idx + 1 :])
 
     def excluding_iter(self, excluded: Task) -> Iterator[Task]:
-        return (t for t in self.tasks if t != excluded)
+        return iter(self.excluding(excluded).tasks)
 
     def with_arrival_curves(self, horizon: Duration | None = None) -> TaskSet:
         """Return a copy of the task set with all arrival models replaced by equivalent
@@ -0,0 +1,76 @@
+"""Support for evaluating step bounds for many values of delta at once.
+
+NumPy is an optional dependency. If it is available, the batch evaluation
+methods (e.g., `max_arrivals_many()`) accept and return NumPy arrays and use
+closed forms or `searchsorted()`; otherwise, they fall back to evaluating each
+delta individually and return lists. They check have_numpy() on every call, so
+that setting `np` to None here (e.g., in tests) selects the fallback.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, TypeAlias
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover -- depends on the environment
+    np = None
+
+__all__ = [
+    "Array",
+    "Batch",
+    "add",
+    "as_array",
+    "as_batch",
+    "have_numpy",
+    "np",
+    "zeros_like",
+]
+
+# A NumPy array of int64.
+Array: TypeAlias = "npt.NDArray[numpy.int64]"
+
+# A batch of values: a NumPy array if NumPy is available, a list otherwise.
+Batch: TypeAlias = "Sequence[int] | Array"
+
+
+def have_numpy() -> bool:
+    "Whether batch evaluation is backed by NumPy."
+    return np is not None
+
+
+def as_array(values: Iterable[int]) -> Array:
+    "Convert the given values to a NumPy array. Requires NumPy."
+    assert np is not None
+    if not isinstance(values, (np.ndarray, list, tuple)):
+        values = list(values)
+    return np.asarray(values, dtype=np.int64)
+
+
+def as_batch(values: Iterable[int]) -> Batch:
+    "Convert the given values to the batch representation in use."
+    if np is not None:
+        return as_array(values)
+    else:
+        return list(values)
+
+
+def add(a: Batch, b: Batch) -> Batch:
+    "Element-wise sum of two batches."
+    if np is not None:
+        return as_array(a) + as_array(b)
+    else:
+        return [x + y for x, y in zip(a, b)]
+
+
+def zeros_like(deltas: Batch) -> Batch:
+    "A batch of zeros with the same length as the given batch."
+    if np is not None:
+        return np.zeros(len(deltas), dtype=np.int64)
+    else:
+        return [0] * len(deltas)
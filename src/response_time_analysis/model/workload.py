@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_right
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from fractions import Fraction
+from threading import Lock
 from typing import TypeAlias, overload
 
 from response_time_analysis.iter import merge_sorted_unique
@@ -17,6 +21,7 @@ from .time import (
     Duration,
     Work,
 )
+from .vectorized import Batch, add, as_array, as_batch, have_numpy, zeros_like
 
 
 @dataclass(frozen=True)
@@ -37,6 +42,22 @@ class RequestBoundFunction:
         r"$RBF(\delta)$"
         return self.rbf(delta)
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term rate of requested work: work per time unit for large deltas."
+        return self.am.long_term_rate() * self.cm.long_term_rate()
+
+    def burst(self) -> Fraction:
+        "The least b such that rbf(delta) <= long_term_rate() * delta + b."
+        return self.am.burst() * self.cm.long_term_rate()
+
+    def deficit(self) -> Fraction:
+        "The least s such that rbf(delta) >= long_term_rate() * delta - s."
+        return self.am.deficit() * self.cm.long_term_rate()
+
+    def rbf_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate rbf() for each of the given deltas."
+        return self.cm.max_cost_many(self.am.max_arrivals_many(deltas))
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         rbf(delta) != rbf(delta + 1)"""
@@ -59,6 +80,27 @@ class DemandBoundFunction:
         r"$DBF(\delta)$"
         return self.dbf(delta)
 
+    def long_term_rate(self) -> Fraction:
+        "The long-term rate of demand: work per time unit for large deltas."
+        return self.rbf.long_term_rate()
+
+    def burst(self) -> Fraction:
+        "A bound b such that dbf(delta) <= long_term_rate() * delta + b."
+        # The DBF is the RBF shifted to the right by at least zero.
+        return self.rbf.burst()
+
+    def deficit(self) -> Fraction:
+        "A bound s such that dbf(delta) >= long_term_rate() * delta - s."
+        # The DBF is the RBF shifted to the right by deadline - 1.
+        return self.rbf.deficit() + self.long_term_rate() * (self.deadline.value - 1)
+
+    def dbf_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate dbf() for each of the given deltas."
+        shift = self.deadline.value - 1
+        if not have_numpy():
+            return self.rbf.rbf_many([delta - shift for delta in deltas])
+        return self.rbf.rbf_many(as_array(deltas) - shift)
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         dbf(delta) != dbf(delta + 1)."""
@@ -78,11 +120,192 @@ class Total:
     def __call__(self, delta: Duration) -> Demand | Work | JobCount:
         return self.cumulative_bound(delta)
 
+    def long_term_rate(self) -> Fraction:
+        "The sum of the long-term rates of all parts."
+        return sum((p.long_term_rate() for p in self.parts), Fraction(0))
+
+    def burst(self) -> Fraction:
+        "The sum of the bursts of all parts."
+        return sum((p.burst() for p in self.parts), Fraction(0))
+
+    def deficit(self) -> Fraction:
+        "The sum of the deficits of all parts."
+        return sum((p.deficit() for p in self.parts), Fraction(0))
+
+    def cumulative_bound_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate cumulative_bound() for each of the given deltas."
+        d = as_batch(deltas)
+        result = zeros_like(d)
+        for p in self.parts:
+            result = add(result, evaluate_many(p, d))
+        return result
+
     def steps(self) -> Iterator[Duration]:
         """Iterator yielding values of delta such that
         cumulative_bound(delta) != cumulative_bound(delta + 1)."""
         return merge_sorted_unique(p.steps() for p in self.parts)
 
+    def steps_with_values(self) -> Iterator[tuple[Duration, Demand | Work | JobCount]]:
+        """Iterator yielding pairs (delta, cumulative_bound(delta + 1)) for each value
+        of delta yielded by steps().
+
+        The cumulative value is maintained incrementally: at each step, only the
+        parts that change their value at that step are re-evaluated.
+        """
+        # Each part is constant up to and including its first step.
+        heap: list[tuple[Duration, int, Iterator[Duration]]] = []
+        last_values: list[Demand | Work | JobCount] = []
+        for idx, p in enumerate(self.parts):
+            it = p.steps()
+            first = next(it, None)
+            if first is None:
+                last_values.append(p(0))
+            else:
+                last_values.append(p(first))
+                heap.append((first, idx, it))
+        heapq.heapify(heap)
+        current = sum(last_values)
+
+        while heap:
+            delta = heap[0][0]
+            while heap and heap[0][0] == delta:
+                _, idx, it = heap[0]
+                value = self.parts[idx](delta + EPSILON_TIME)
+                current += value - last_values[idx]
+                last_values[idx] = value
+                nxt = next(it, None)
+                if nxt is None:
+                    _ = heapq.heappop(heap)
+                else:
+                    _ = heapq.heapreplace(heap, (nxt, idx, it))
+            yield delta, current
+
+    def compile(self, bound: Duration | None = None) -> CompiledTotal:
+        """Compile the total into a step table covering all deltas up to the given
+        bound, which is extended lazily beyond the bound as needed."""
+        return CompiledTotal(self, bound)
+
+
+class CompiledTotal:
+    """A `Total` compiled into a merged table of breakpoints and cumulative values.
+
+    Evaluating the compiled total takes a single bisection. Queries beyond the
+    compiled range extend the table lazily by consuming the total's step stream.
+    To avoid materializing huge tables when queries jump far ahead (e.g., when a
+    fixed-point iteration diverges), each such query may add only a bounded number
+    of entries to the table; if that does not suffice, the query is answered by
+    evaluating the total directly.
+
+    A compiled total may be shared by several threads. Extending the table is
+    serialized by a lock, whereas lookups need none: the table is only ever
+    appended to, and each value is appended before its breakpoint.
+    """
+
+    # Number of table entries that a query beyond the compiled range may add,
+    # per part of the total.
+    EXTENSION_BUDGET_PER_PART: int = 4
+
+    def __init__(self, total: Total, bound: Duration | None = None) -> None:
+        self.total: Total = total
+        self._stream: Iterator[tuple[Duration, Demand | Work | JobCount]] = (
+            total.steps_with_values()
+        )
+        self._pending: tuple[Duration, Demand | Work | JobCount] | None = next(
+            self._stream, None
+        )
+        # self._values[i] is the value for all deltas d with
+        # self._points[i] <= d < self._points[i + 1].
+        self._points: list[Duration] = []
+        self._values: list[Demand | Work | JobCount] = []
+        self._initial_value: Demand | Work | JobCount = (
+            total(self._pending[0]) if self._pending else total(0)
+        )
+        self._budget_per_miss: int = self.EXTENSION_BUDGET_PER_PART * max(
+            1, len(total.parts)
+        )
+        self._lock: Lock = Lock()
+        if bound is not None:
+            _ = self._extend(bound, budget=None)
+
+    @property
+    def parts(self) -> tuple[StepBound, ...]:
+        return self.total.parts
+
+    @property
+    def compiled_up_to(self) -> Duration | None:
+        "All deltas up to the returned value are covered by the table (None = all)."
+        return self._pending[0] if self._pending is not None else None
+
+    def _extend(self, delta: Duration, budget: int | None) -> bool:
+        "Extend the table to cover delta; returns whether it does."
+        pending = self._pending
+        if pending is None or pending[0] >= delta:
+            return True
+        with self._lock:
+            while self._pending is not None and self._pending[0] < delta:
+                if budget is not None:
+                    if budget <= 0:
+                        return False
+                    budget -= 1
+                step, value = self._pending
+                self._values.append(value)
+                self._points.append(step + EPSILON_TIME)
+                self._pending = next(self._stream, None)
+        return True
+
+    def cumulative_bound(self, delta: Duration) -> Demand | Work | JobCount:
+        if not self._extend(delta, self._budget_per_miss):
+            return self.total(delta)
+        idx = bisect_right(self._points, delta)
+        return self._values[idx - 1] if idx > 0 else self._initial_value
+
+    def __call__(self, delta: Duration) -> Demand | Work | JobCount:
+        return self.cumulative_bound(delta)
+
+    def cumulative_bound_many(self, deltas: Iterable[Duration]) -> Batch:
+        "Evaluate cumulative_bound() for each of the given deltas."
+        return self.total.cumulative_bound_many(deltas)
+
+    def long_term_rate(self) -> Fraction:
+        "The sum of the long-term rates of all parts."
+        return self.total.long_term_rate()
+
+    def burst(self) -> Fraction:
+        "The sum of the bursts of all parts."
+        return self.total.burst()
+
+    def deficit(self) -> Fraction:
+        "The sum of the deficits of all parts."
+        return self.total.deficit()
+
+    def steps(self) -> Iterator[Duration]:
+        """Iterator yielding values of delta such that
+        cumulative_bound(delta) != cumulative_bound(delta + 1).
+
+        The steps are served from the table, which is extended as needed."""
+        idx = 0
+        while True:
+            if idx < len(self._points):
+                yield self._points[idx] - EPSILON_TIME
+                idx += 1
+            elif self._pending is not None:
+                _ = self._extend(self._pending[0] + EPSILON_TIME, budget=None)
+            else:
+                return
+
+    def steps_with_values(self) -> Iterator[tuple[Duration, Demand | Work | JobCount]]:
+        """Iterator yielding pairs (delta, cumulative_bound(delta + 1)) for each value
+        of delta yielded by steps(), served from the table like steps()."""
+        idx = 0
+        while True:
+            if idx < len(self._points):
+                yield self._points[idx] - EPSILON_TIME, self._values[idx]
+                idx += 1
+            elif self._pending is not None:
+                _ = self._extend(self._pending[0] + EPSILON_TIME, budget=None)
+            else:
+                return
+
 
 @overload
 def total(*bounds: StepBound) -> Total: ...
@@ -101,4 +324,18 @@ def total(*args: object) -> Total:  # pyright: ignore[reportInconsistentOverload
         return Total(args)  # pyright: ignore[reportArgumentType]
 
 
-StepBound: TypeAlias = ArrivalModel | RequestBoundFunction | DemandBoundFunction | Total
+def evaluate_many(bound: StepBound, deltas: Iterable[Duration]) -> Batch:
+    "Evaluate the given step bound for each of the given deltas."
+    if isinstance(bound, RequestBoundFunction):
+        return bound.rbf_many(deltas)
+    elif isinstance(bound, DemandBoundFunction):
+        return bound.dbf_many(deltas)
+    elif isinstance(bound, (Total, CompiledTotal)):
+        return bound.cumulative_bound_many(deltas)
+    else:
+        return bound.max_arrivals_many(deltas)
+
+
+StepBound: TypeAlias = (
+    ArrivalModel | RequestBoundFunction | DemandBoundFunction | Total | CompiledTotal
+)
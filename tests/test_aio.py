@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from response_time_analysis.analysis import edf, fifo, fp
+from response_time_analysis.analysis.aio import AsyncAnalyzer
+from response_time_analysis.model import (
+    WCET,
+    Deadline,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    MinimumSeparationVector,
+    Periodic,
+    Priority,
+    RateDelayModel,
+    Task,
+    taskset,
+)
+
+TS = taskset(
+    Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(35), Priority(1)),
+    Task(
+        MinimumSeparationVector([20, 45, 70]),
+        FullyPreemptive(WCET(4)),
+        Deadline(20),
+        Priority(3),
+    ),
+    Task(Periodic(30), FullyPreemptive(WCET(5)), Deadline(30), Priority(2)),
+)
+SUPPLY = RateDelayModel(period=10, allocation=8, delay=3)
+
+# The demand rate equals the supply rate, but the supply is delayed, so the busy
+# window is unbounded and, without a horizon, the analysis does not terminate.
+ENDLESS = taskset(
+    Task(Periodic(10), FullyPreemptive(WCET(8)), Deadline(10), Priority(1))
+)
+
+
+def test_async_analyses_match_sync_analyses() -> None:
+    async def main() -> None:
+        async with AsyncAnalyzer(max_workers=2) as analyzer:
+            assert await analyzer.rta_all(TS, SUPPLY, "fp") == fp.rta_all(TS, SUPPLY)
+            assert await analyzer.rta_all(TS, SUPPLY, "edf") == edf.rta_all(TS, SUPPLY)
+            assert await analyzer.rta_all(TS, SUPPLY, "fifo", 1_000) == fifo.rta_all(
+                TS, SUPPLY, 1_000
+            )
+            for tua, expected in zip(TS, fifo.rta_all(TS, SUPPLY)):
+                assert await analyzer.rta(TS, tua, SUPPLY, "fp") == fp.rta(
+                    TS, tua, SUPPLY
+                )
+                assert await analyzer.rta(TS, tua, SUPPLY, "edf") == edf.rta(
+                    TS, tua, SUPPLY
+                )
+                assert await analyzer.rta(TS, tua, SUPPLY, "fifo") == expected
+            with pytest.raises(ValueError, match="unknown scheduling policy"):
+                _ = await analyzer.rta_all(TS, SUPPLY, "rm")  # pyright: ignore[reportArgumentType]
+
+    asyncio.run(main())
+
+
+def test_identical_requests_are_coalesced() -> None:
+    async def main() -> None:
+        copy = taskset(list(TS))
+        async with AsyncAnalyzer() as analyzer:
+            a, b, c = await asyncio.gather(
+                analyzer.rta_all(TS, SUPPLY, "edf"),
+                analyzer.rta_all(copy, SUPPLY, "edf"),
+                analyzer.rta_all(TS, SUPPLY, "edf", horizon=1_000),
+            )
+            # equal task sets share the computation, other horizons do not
+            assert a is b
+            assert a is not c and a == c
+
+    asyncio.run(main())
+
+
+def test_timeouts_cancel_the_solvers() -> None:
+    async def main() -> None:
+        async with AsyncAnalyzer(max_workers=1) as analyzer:
+            with pytest.raises(TimeoutError):
+                _ = await analyzer.rta(
+                    ENDLESS, ENDLESS.tasks[0], SUPPLY, "fp", timeout=0.05
+                )
+            # The only worker thread becomes available again.
+            sol = await analyzer.rta(TS, TS.tasks[0], SUPPLY, "fp", timeout=10)
+            assert sol == fp.rta(TS, TS.tasks[0], SUPPLY)
+
+    asyncio.run(main())
+
+
+def test_cancelled_requests_cancel_the_solvers() -> None:
+    async def main() -> None:
+        async with AsyncAnalyzer(max_workers=1) as analyzer:
+            first = asyncio.create_task(analyzer.rta_all(ENDLESS, SUPPLY, "edf"))
+            second = asyncio.create_task(analyzer.rta_all(ENDLESS, SUPPLY, "edf"))
+            await asyncio.sleep(0.05)
+            _ = first.cancel()
+            await asyncio.sleep(0.05)
+            # still awaited by the second request
+            assert not second.done()
+            _ = second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                _ = await second
+            sol = await analyzer.rta_all(TS, SUPPLY, "edf", timeout=10)
+            assert sol == edf.rta_all(TS, SUPPLY)
+
+    asyncio.run(main())
@@ -1,17 +1,25 @@
-from collections.abc import Iterable
+import pickle
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from dataclasses import replace
 from itertools import takewhile
 from math import ceil
+from typing import cast
+
+import pytest
 
 from response_time_analysis.analysis import (
     Solution,
+    busy_window_horizon,
     edf,
     fifo,
     fp,
     sparse_finite_search_space,
 )
-from response_time_analysis.analysis.solve import inequality
+from response_time_analysis.analysis.solve import inequality, stepped_inequality
 from response_time_analysis.model import (
     WCET,
+    ArrivalCurvePrefix,
     Deadline,
     Duration,
     FullyNonPreemptive,
@@ -20,7 +28,10 @@ from response_time_analysis.model import (
     Periodic,
     Priority,
     RateDelayModel,
+    Sporadic,
+    SupplyModel,
     Task,
+    TaskSet,
     taskset,
 )
 
@@ -75,6 +86,32 @@ def test_inequality_converges_and_respects_horizon() -> None:
     )
 
 
+def test_stepped_inequality_finds_least_solution() -> None:
+    supply = RateDelayModel(period=10, allocation=7, delay=3)
+    rbf = taskset(
+        Task(arrivals=Periodic(40), execution=FullyPreemptive(WCET(9))),
+        Task(arrivals=Periodic(65), execution=FullyPreemptive(WCET(4))),
+    ).rbf
+
+    def lhs(x: Duration) -> int:
+        return 5 + rbf(x)
+
+    least = next(x for x in range(1, 10_000) if lhs(x) <= supply(x))
+
+    with_steps = stepped_inequality(
+        lhs=lhs, rhs=supply, rhs_inverse=supply.supply_inverse, lhs_steps=rbf.steps()
+    )
+    without_steps = stepped_inequality(
+        lhs=lhs, rhs=supply, rhs_inverse=supply.supply_inverse
+    )
+    assert with_steps == without_steps == least
+
+    beyond_horizon = stepped_inequality(
+        lhs=lhs, rhs=supply, rhs_inverse=supply.supply_inverse, horizon=least - 1
+    )
+    assert beyond_horizon is None
+
+
 def test_fifo_analysis_simple() -> None:
     supply = IdealProcessor()
     task = Task(arrivals=Periodic(3), execution=FullyPreemptive(WCET(1)))
@@ -151,3 +188,368 @@ def test_fifo_analysis_rate_delay() -> None:
     solution = fifo.rta(ts, supply)
     assert solution.bound_found()
     assert solution.response_time_bound == 27
+
+
+def test_fp_warm_started_offsets_match_least_solutions() -> None:
+    supply = RateDelayModel(period=10, allocation=8, delay=3)
+    tua = Task(
+        arrivals=Periodic(11),
+        execution=FullyPreemptive(WCET(4)),
+        priority=Priority(1),
+    )
+    hp = Task(
+        arrivals=Periodic(17),
+        execution=FullyPreemptive(WCET(5)),
+        priority=Priority(2),
+    )
+    ts = taskset(tua, hp)
+
+    solution = fp.rta(ts, tua, supply)
+    assert solution.bound_found()
+    assert solution.search_space is not None and len(solution.search_space) > 1
+
+    for A, F, _R in solution.search_space:
+        work = tua.rbf(A + 1)
+        assert F == next(x for x in range(1, 10_000) if work + hp.rbf(x) <= supply(x))
+
+
+@pytest.mark.parametrize("horizon", [1000, None])
+def test_overloaded_task_sets_have_no_bound(horizon: int | None) -> None:
+    supply = RateDelayModel(period=10, allocation=7, delay=2)
+    tasks = [
+        Task(Periodic(5), FullyPreemptive(WCET(2)), Deadline(5), Priority(2)),
+        Task(Periodic(9), FullyPreemptive(WCET(3)), Deadline(9), Priority(1)),
+    ]
+    ts = taskset(tasks)
+
+    assert fp.busy_window_bound(ts, tasks[1], supply, horizon) is None
+    assert edf.busy_window_bound(ts, supply, horizon) is None
+    assert fifo.busy_window_bound(ts, supply, horizon) is None
+    assert not fp.rta(ts, tasks[1], supply, horizon).bound_found()
+    assert not edf.rta(ts, tasks[1], supply, horizon).bound_found()
+    assert not fifo.rta(ts, supply, horizon).bound_found()
+
+
+def test_busy_window_is_bounded_despite_excess_long_term_rate() -> None:
+    # Three jobs per 166 time units exceed the supply rate in the long run, but the
+    # third job arrives only after the first busy window has closed.
+    task = Task(
+        ArrivalCurvePrefix(166, [(1, 2), (152, 3)]),
+        FullyPreemptive(WCET(57)),
+        Deadline(166),
+        Priority(1),
+    )
+    ts = taskset(task)
+    supply = IdealProcessor()
+
+    assert fp.busy_window_bound(ts, task, supply) == 114
+    assert edf.busy_window_bound(ts, supply) == 114
+    assert fifo.busy_window_bound(ts, supply) == 114
+    assert fp.rta(ts, task, supply).response_time_bound == 114
+    assert edf.rta(ts, task, supply).response_time_bound == 114
+    assert fifo.rta(ts, supply).response_time_bound == 114
+
+
+def test_busy_window_horizon_bounds_busy_window() -> None:
+    supply = RateDelayModel(period=100, allocation=90, delay=25)
+    ts = taskset(
+        Task(Periodic(50), FullyPreemptive(WCET(13)), Deadline(50), Priority(2)),
+        Task(Periodic(70), FullyNonPreemptive(WCET(21)), Deadline(70), Priority(1)),
+    )
+    auto = busy_window_horizon(ts.rbf, supply, blocking=7)
+    assert auto is not None
+    L = next(x for x in range(1, 10_000) if 7 + ts.rbf(x) <= supply(x))
+
+    assert L <= auto
+    assert busy_window_horizon(ts.rbf, supply, horizon=L, blocking=7) == L
+    assert busy_window_horizon(ts.rbf, IdealProcessor(speed=1), horizon=5) == 5
+
+    # if the demand outpaces the supply, there is no solution beyond the horizon
+    ideal = IdealProcessor()
+    excess = taskset(
+        Task(ArrivalCurvePrefix(166, [(1, 2), (152, 3)]), FullyPreemptive(WCET(57)))
+    )
+    beyond = busy_window_horizon(excess.rbf, ideal)
+    assert beyond is not None
+    assert excess.rbf(114) <= ideal(114)
+    assert 114 <= beyond
+    assert all(excess.rbf(x) > ideal(x) for x in range(beyond + 1, 10 * beyond))
+
+    # if the rates are equal, there is a bound only if no solution exists at all
+    full = taskset(Task(Periodic(10), FullyPreemptive(WCET(10))))
+    assert busy_window_horizon(full.rbf, ideal) is None
+    assert busy_window_horizon(full.rbf, ideal, horizon=50) == 50
+    assert busy_window_horizon(full.rbf, ideal, blocking=1) == 0
+
+
+def test_fp_rta_all_matches_per_task_rta() -> None:
+    tasks = [
+        Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(40), Priority(1)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(25), Priority(3)),
+        Task(Periodic(30), FullyNonPreemptive(WCET(5)), Deadline(30), Priority(2)),
+        Task(Periodic(30), FullyPreemptive(WCET(2)), Deadline(30), Priority(3)),
+        Task(Periodic(60), FullyNonPreemptive(WCET(7)), Deadline(60), Priority(0)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(25), Priority(3)),
+    ]
+    ts = taskset(tasks)
+
+    for supply in (IdealProcessor(), RateDelayModel(period=10, allocation=8, delay=3)):
+        solutions = fp.rta_all(ts, supply)
+        assert solutions == tuple(fp.rta(ts, t, supply) for t in tasks)
+        assert all(s.bound_found() for s in solutions)
+
+    overloaded = RateDelayModel(period=10, allocation=5, delay=3)
+    assert fp.rta_all(ts, overloaded, horizon=1000) == tuple(
+        fp.rta(ts, t, overloaded, horizon=1000) for t in tasks
+    )
+
+
+def test_fp_incremental_session_reanalyzes_only_affected_tasks() -> None:
+    tasks = [
+        Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(40), Priority(1)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(25), Priority(3)),
+        Task(Periodic(30), FullyNonPreemptive(WCET(5)), Deadline(30), Priority(2)),
+        Task(Periodic(30), FullyPreemptive(WCET(2)), Deadline(30), Priority(3)),
+        Task(Periodic(60), FullyNonPreemptive(WCET(7)), Deadline(60), Priority(0)),
+    ]
+    supply = RateDelayModel(period=10, allocation=8, delay=3)
+    session = fp.IncrementalSession(taskset(tasks), supply)
+    assert session.solutions == fp.rta_all(taskset(tasks), supply)
+
+    def update(index: int, task: Task) -> tuple[int, ...]:
+        affected = session.update(index, task)
+        tasks[index] = task
+        assert session.taskset == taskset(tasks)
+        assert session.solutions == fp.rta_all(taskset(tasks), supply)
+        return affected
+
+    # The lowest-priority task interferes with no other task.
+    assert update(4, replace(tasks[4], arrivals=Periodic(70))) == (4,)
+    # More frequent jobs interfere with all tasks of lower or equal priority.
+    assert update(0, replace(tasks[0], arrivals=Periodic(35))) == (0, 4)
+    # A longer non-preemptive segment blocks all tasks of higher priority.
+    assert update(4, replace(tasks[4], execution=FullyNonPreemptive(WCET(9)))) == (
+        0,
+        1,
+        2,
+        3,
+        4,
+    )
+    # The same interference and blocking bounds affect only the task itself.
+    assert update(0, replace(tasks[0], execution=FullyPreemptive(WCET(3)))) == (0,)
+    # Raising the priority removes interference from the tasks it overtakes.
+    assert update(2, replace(tasks[2], priority=Priority(4))) == (1, 2, 3)
+    assert update(2, tasks[2]) == ()
+
+
+def test_edf_rta_all_matches_per_task_rta() -> None:
+    tasks = [
+        Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(35)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(20)),
+        Task(Periodic(30), FullyNonPreemptive(WCET(5)), Deadline(30)),
+        Task(Periodic(30), FullyPreemptive(WCET(2)), Deadline(20)),
+        Task(Periodic(60), FullyNonPreemptive(WCET(7)), Deadline(60)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(20)),
+    ]
+    ts = taskset(tasks)
+
+    for supply in (IdealProcessor(), RateDelayModel(period=10, allocation=8, delay=3)):
+        solutions = edf.rta_all(ts, supply)
+        assert solutions == tuple(edf.rta(ts, t, supply) for t in tasks)
+        assert all(s.bound_found() for s in solutions)
+
+    poet_ts = ts.with_arrival_curves(horizon=120)
+    assert edf.rta_all(poet_ts, IdealProcessor(), use_poet_search_space=True) == tuple(
+        edf.rta(poet_ts, t, IdealProcessor(), use_poet_search_space=True)
+        for t in poet_ts
+    )
+
+    overloaded = RateDelayModel(period=10, allocation=5, delay=3)
+    assert not any(s.bound_found() for s in edf.rta_all(ts, overloaded, horizon=1000))
+
+
+def meets_deadlines(ts: TaskSet, supply: SupplyModel) -> bool:
+    for s in edf.rta_all(ts, supply):
+        deadline = s.task_under_analysis.deadline
+        assert deadline is not None
+        if s.response_time_bound is None or s.response_time_bound > deadline.value:
+            return False
+    return True
+
+
+def test_edf_admission_controller_tracks_schedulable_task_sets() -> None:
+    tasks = [
+        Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(35)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(20)),
+        Task(Periodic(30), FullyNonPreemptive(WCET(5)), Deadline(30)),
+        Task(Periodic(30), FullyPreemptive(WCET(2)), Deadline(6)),
+        Task(Periodic(60), FullyNonPreemptive(WCET(7)), Deadline(60)),
+        Task(Periodic(25), FullyPreemptive(WCET(4)), Deadline(20)),
+        Task(Periodic(10), FullyPreemptive(WCET(3)), Deadline(10)),
+    ]
+
+    for supply in (IdealProcessor(), RateDelayModel(period=10, allocation=8, delay=3)):
+        controller = edf.AdmissionController(supply)
+        rejected = 0
+        for i, task in enumerate(tasks):
+            if i == 4:
+                controller.remove(controller.taskset.tasks[1])
+            candidate = TaskSet(controller.taskset.tasks + (task,))
+            admitted = controller.admit(task)
+            assert admitted == meets_deadlines(candidate, supply)
+            rejected += not admitted
+            assert controller.busy_window_bound == edf.busy_window_bound(
+                controller.taskset, supply
+            )
+            assert controller.solutions() == edf.rta_all(controller.taskset, supply)
+        assert 0 < rejected < len(tasks)
+
+    with pytest.raises(ValueError):
+        controller.remove(Task(Periodic(7), FullyPreemptive(WCET(1)), Deadline(7)))
+
+
+def test_edf_admission_controller_survives_many_updates() -> None:
+    supply = RateDelayModel(period=10, allocation=9, delay=2)
+    controller = edf.AdmissionController(supply)
+    for i in range(60):
+        if i % 3 == 2 and controller.taskset.tasks:
+            controller.remove(controller.taskset.tasks[i % len(controller.taskset)])
+        execution = FullyNonPreemptive if i % 4 == 0 else FullyPreemptive
+        task = Task(
+            Periodic(40 + 7 * (i % 9)),
+            execution(WCET(1 + i % 5)),
+            Deadline(10 + 11 * (i % 7)),
+        )
+        candidate = TaskSet(controller.taskset.tasks + (task,))
+        assert controller.admit(task) == edf.qpa(candidate, supply).schedulable
+        assert controller.busy_window_bound == edf.busy_window_bound(
+            controller.taskset, supply
+        )
+
+
+def test_edf_qpa_reports_witness_of_excess_demand() -> None:
+    tasks = [
+        Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(3)),
+        Task(Periodic(15), FullyPreemptive(WCET(2)), Deadline(4)),
+        Task(Periodic(20), FullyNonPreemptive(WCET(4)), Deadline(20)),
+    ]
+    ideal = IdealProcessor()
+
+    result = edf.qpa(taskset(tasks[:2]), ideal)
+    assert result.schedulable
+    assert result.witness is None
+    assert result.busy_window_bound == edf.busy_window_bound(taskset(tasks[:2]), ideal)
+
+    # The non-preemptive task blocks for up to 3 time units: dbf(6) + 3 > 6.
+    result = edf.qpa(taskset(tasks), ideal)
+    assert not result.schedulable
+    assert result.witness == 6
+
+    for supply in (ideal, RateDelayModel(period=10, allocation=8, delay=3)):
+        for ts in (taskset(tasks[:2]), taskset(tasks), taskset(tasks[1:])):
+            result = edf.qpa(ts, supply)
+            assert result.schedulable == meets_deadlines(ts, supply)
+            if result.witness is not None:
+                blocking = max(
+                    (
+                        t.execution.max_non_preemptive_segment - 1
+                        for t in ts
+                        if t.deadline is not None and t.deadline.value > result.witness
+                    ),
+                    default=0,
+                )
+                assert ts.dbf(result.witness) + blocking > supply(result.witness)
+
+    overloaded = RateDelayModel(period=10, allocation=3, delay=3)
+    result = edf.qpa(taskset(tasks), overloaded)
+    assert result == edf.DemandTestResult(False, None, None)
+
+
+def test_fifo_streaming_pass_matches_busy_window_and_search_space() -> None:
+    supply = RateDelayModel(period=10, allocation=8, delay=3)
+    tasks = [
+        Task(Periodic(20), FullyPreemptive(WCET(3))),
+        Task(Periodic(35), FullyNonPreemptive(WCET(5))),
+        Task(Periodic(50), FullyPreemptive(WCET(4))),
+    ]
+    ts = taskset(tasks)
+
+    result = fifo.streaming_pass(ts, supply)
+    assert result is not None
+    L, points = result
+    assert L == fifo.busy_window_bound(ts, supply)
+    assert [A for A, _ in points] == list(fifo.search_space(ts, supply) or [])
+    assert all(work == ts.rbf(A + 1) for A, work in points)
+
+    solutions = fifo.rta_all(ts, supply)
+    assert [s.task_under_analysis for s in solutions] == tasks
+    assert {s.response_time_bound for s in solutions} == {
+        fifo.rta(ts, supply).response_time_bound
+    }
+    for A, F, _R in solutions[0].search_space or ():
+        assert F == next(x for x in range(1, 1_000) if ts.rbf(A + 1) <= supply(x))
+
+    assert fifo.streaming_pass(ts, supply, horizon=L - 1) is None
+
+
+def test_fifo_streaming_pass_gives_up_on_overload_without_horizon() -> None:
+    supply = IdealProcessor()
+    overload = taskset(
+        Task(Periodic(5), FullyPreemptive(WCET(1))),
+        Task(Periodic(10), FullyPreemptive(WCET(6))),
+        Task(Periodic(9), FullyPreemptive(WCET(3))),
+    )
+    assert fifo.streaming_pass(overload, supply) is None
+    assert not fifo.rta(overload, supply).bound_found()
+
+    # a long busy window, with the workload at each point of its search space
+    slow = RateDelayModel(period=1000, allocation=999, delay=50)
+    busy = taskset(Task(Sporadic(7), FullyPreemptive(WCET(6))))
+    result = fifo.streaming_pass(busy, slow)
+    assert result is not None
+    L, points = result
+    assert L == next(x for x in range(1, 10**6) if busy.rbf(x) <= slow(x))
+    assert points == [(A, busy.rbf(A + 1)) for A in range(0, L, 7)]
+
+
+def test_equal_tasks_interfere_with_each_other() -> None:
+    supply = IdealProcessor()
+    task = Task(Periodic(10), FullyPreemptive(WCET(3)), Deadline(10), Priority(1))
+    twin = Task(Periodic(10), FullyPreemptive(WCET(3)), Deadline(10), Priority(1))
+    ts = taskset(task, twin)
+
+    alone = fp.rta(taskset(task), task, supply).response_time_bound
+    assert alone == 3
+    assert fp.rta(ts, task, supply).response_time_bound == 6
+    assert edf.rta(ts, twin, supply).response_time_bound == 6
+    assert fp.rta_all(ts, supply) == (
+        fp.rta(ts, task, supply),
+        fp.rta(ts, twin, supply),
+    )
+    assert edf.rta_all(ts, supply) == (
+        edf.rta(ts, task, supply),
+        edf.rta(ts, twin, supply),
+    )
+
+
+def pickled(ts: TaskSet) -> TaskSet:
+    return cast(TaskSet, pickle.loads(pickle.dumps(ts)))
+
+
+@pytest.mark.parametrize("round_trip", [deepcopy, pickled])
+def test_copied_task_sets_analyze_like_the_original(
+    round_trip: Callable[[TaskSet], TaskSet],
+) -> None:
+    supply = RateDelayModel(period=10, allocation=8, delay=3)
+    task = Task(Periodic(20), FullyPreemptive(WCET(3)), Deadline(20), Priority(1))
+    twin = Task(Periodic(20), FullyPreemptive(WCET(3)), Deadline(20), Priority(1))
+    other = Task(Periodic(35), FullyNonPreemptive(WCET(5)), Deadline(30), Priority(2))
+    ts = taskset(task, other, twin)
+    fp_solutions = fp.rta_all(ts, supply)
+    edf_solutions = edf.rta_all(ts, supply)
+
+    copy = round_trip(ts)
+    assert [copy.index_of(t) for t in copy] == [0, 1, 2]
+    assert copy.excluding(copy.tasks[2]).tasks == (task, other)
+    assert fp.rta_all(copy, supply) == fp_solutions
+    assert edf.rta_all(copy, supply) == edf_solutions
@@ -1,5 +1,9 @@
 import math
-from itertools import islice
+import random
+from fractions import Fraction
+from itertools import accumulate, islice
+
+import pytest
 
 from response_time_analysis.model import (
     ArrivalCurvePrefix,
@@ -124,7 +128,7 @@ def test_periodic_as_arrival_curve_prefix_equivalence() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon == 5
-    assert prefix.ac_steps == [(1, 1)]
+    assert prefix.ac_steps == ((1, 1),)
     for delta in range(26):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -147,7 +151,7 @@ def test_sporadic_as_arrival_curve_prefix_equivalence() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon == 4
-    assert prefix.ac_steps == [(1, 1)]
+    assert prefix.ac_steps == ((1, 1),)
     for delta in range(26):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -158,7 +162,7 @@ def test_once_as_arrival_curve_prefix_equivalence() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon is math.inf
-    assert prefix.ac_steps == [(1, 1)]
+    assert prefix.ac_steps == ((1, 1),)
     for delta in range(128):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -169,7 +173,7 @@ def test_never_as_arrival_curve_prefix_equivalence() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon is math.inf
-    assert prefix.ac_steps == [(1, 0)]
+    assert prefix.ac_steps == ((1, 0),)
     for delta in range(128):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -180,7 +184,7 @@ def test_periodic_with_jitter_as_arrival_curve_prefix_default_horizon() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon == 50
-    assert prefix.ac_steps == [
+    assert prefix.ac_steps == (
         (1, 1),
         (4, 2),
         (9, 3),
@@ -192,7 +196,7 @@ def test_periodic_with_jitter_as_arrival_curve_prefix_default_horizon() -> None:
         (39, 9),
         (44, 10),
         (49, 11),
-    ]
+    )
     for delta in range(51):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -203,14 +207,14 @@ def test_minimum_separation_vector_as_arrival_curve_prefix() -> None:
     prefix = am.as_arrival_curve_prefix()
 
     assert prefix.horizon == 26
-    assert prefix.ac_steps == [
+    assert prefix.ac_steps == (
         (1, 1),
         (3, 2),
         (6, 3),
         (10, 4),
         (15, 5),
         (21, 6),
-    ]
+    )
     for delta in range(26):
         assert prefix.max_arrivals(delta) == am.max_arrivals(delta)
 
@@ -219,3 +223,117 @@ def test_arrival_curve_prefix_as_arrival_curve_prefix_noop() -> None:
     ac = ArrivalCurvePrefix(horizon=100, ac_steps=[(1, 1)])
 
     assert ac.as_arrival_curve_prefix(50) is ac
+
+
+def test_arrival_curve_prefix_indexed_lookup_matches_linear_scan() -> None:
+    ac_steps = [(1, 1)] + [(1 + 7 * i + i * i, 2 + 3 * i) for i in range(1, 60)]
+    am = ArrivalCurvePrefix(horizon=ac_steps[-1][0] + 13, ac_steps=ac_steps)
+
+    def linear_scan(delta: int) -> int:
+        jobs = 0
+        for step_delta, step_jobs in ac_steps:
+            if step_delta > delta:
+                break
+            jobs = step_jobs
+        return jobs
+
+    for delta in range(1, int(am.horizon)):
+        assert am.max_arrivals_within_horizon(delta) == linear_scan(delta)
+
+
+def test_arrival_curve_prefix_index_is_not_part_of_equality() -> None:
+    ac1 = ArrivalCurvePrefix(horizon=100, ac_steps=[(1, 1), (21, 2)])
+    ac2 = ArrivalCurvePrefix(horizon=100, ac_steps=[(1, 1), (21, 2)])
+
+    assert ac1 == ac2
+    assert "_step_deltas" not in repr(ac1)
+
+
+def test_minimum_separation_vector_extrapolates_super_additive_closure() -> None:
+    prefix = [2, 5, 9, 14, 20, 26]
+    am = MinimumSeparationVector(dmin=list(prefix))
+
+    # reference: dmin(n) = max { dmin(k) + dmin(n + 1 - k) } over the given prefix
+    d = [0, 0] + prefix
+    while len(d) <= 200:
+        n = len(d)
+        d.append(max(d[k] + d[n + 1 - k] for k in range(2, len(prefix) + 2)))
+
+    for n in range(2, 201):
+        assert am.min_gap_between(n) == d[n]
+    for delta in range(1, d[200]):
+        assert am.max_arrivals(delta) == next(
+            n - 1 for n in range(2, 201) if delta <= d[n]
+        )
+
+
+def test_minimum_separation_vector_is_never_looser_than_plain_extrapolation() -> None:
+    def extrapolated(dmin: list[int], n_max: int) -> list[int]:
+        # the extrapolation of pyRTA 0.1.1, with d[n] the separation of n jobs
+        d = [0, 0, *dmin]
+        while len(d) <= n_max:
+            n, covered = len(d), len(d) - 1
+            splits = (d[i] + d[n - i + 1] for i in range(2, covered // 2))
+            d.append(max(splits, default=dmin[0] * (n - 1)))
+        return d
+
+    rng = random.Random(7)
+    prefixes = [[6, 7, 9], [20, 24, 37], [2, 5, 9, 14, 20, 26]]
+    for _ in range(200):
+        gaps = sorted(rng.randrange(30) for _ in range(rng.randrange(1, 8)))
+        prefixes.append(list(accumulate(gaps)))
+    for prefix in prefixes:
+        am = MinimumSeparationVector(dmin=prefix)
+        d = extrapolated(prefix, 60)
+        assert all(am.min_gap_between(n) >= d[n] for n in range(2, 61))
+
+    # consecutive jobs are at least 6 apart, so five jobs span at least 24
+    assert MinimumSeparationVector(dmin=[6, 7, 9]).min_gap_between(5) == 24
+    assert MinimumSeparationVector(dmin=[20, 24, 37]).min_gap_between(39) == 760
+
+
+def test_minimum_separation_vector_answers_periodic_tail_in_closed_form() -> None:
+    am = MinimumSeparationVector(dmin=[3, 11, 19, 25, 40, 41, 60])
+
+    assert am.max_arrivals(10**12) == 116_666_666_667
+
+    longer = am.extrapolate()
+    assert longer.dmin[:-1] == am.dmin
+    assert longer.dmin[-1] == am.min_gap_between(longer.max_covered_njobs)
+
+
+def test_minimum_separation_vector_without_separation_is_unbounded() -> None:
+    am = MinimumSeparationVector(dmin=[0])
+
+    with pytest.raises(OverflowError):
+        _ = am.max_arrivals(1)
+
+
+def test_long_term_rates_and_bursts_bound_arrival_curves() -> None:
+    models = [
+        Periodic(period=5),
+        PeriodicWithJitter(period=5, jitter=12),
+        Sporadic(mit=4),
+        MinimumSeparationVector(dmin=[2, 5, 9, 14, 20, 26]),
+        MinimumSeparationVector(dmin=[0, 1, 7]),
+        ArrivalCurvePrefix(horizon=100, ac_steps=[(1, 1), (21, 2), (51, 3), (91, 4)]),
+        ArrivalCurvePrefix(horizon=math.inf, ac_steps=[(1, 2), (10, 3)]),
+        Once(),
+        Never(),
+    ]
+    for am in models:
+        rate, burst, deficit = am.long_term_rate(), am.burst(), am.deficit()
+        assert burst >= 0
+        assert deficit >= 0
+        for delta in range(1000):
+            assert rate * delta - deficit <= am(delta) <= rate * delta + burst
+        # the deficit is attained
+        assert deficit == 0 or min(am(d) - rate * d for d in range(1000)) == -deficit
+        # the rate is attained in the long run
+        assert am(10**6) >= rate * 10**6 - burst - 1
+
+    assert Periodic(period=5).long_term_rate() == Fraction(1, 5)
+    assert ArrivalCurvePrefix(100, [(1, 1), (21, 2)]).long_term_rate() == Fraction(
+        1, 50
+    )
+    assert MinimumSeparationVector(dmin=[3, 11]).long_term_rate() == Fraction(2, 11)
@@ -0,0 +1,107 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+
+import pytest
+
+from response_time_analysis.analysis import edf, fifo, fp
+from response_time_analysis.analysis.batch import (
+    Job,
+    JobLike,
+    rta_all_shared,
+    rta_batch,
+)
+from response_time_analysis.analysis.parallel import Policy
+from response_time_analysis.model import (
+    WCET,
+    Deadline,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    IdealProcessor,
+    MinimumSeparationVector,
+    Periodic,
+    Priority,
+    RateDelayModel,
+    Task,
+    TaskSet,
+    taskset,
+)
+
+
+def candidate(i: int) -> TaskSet:
+    return taskset(
+        Task(Periodic(40 + i), FullyNonPreemptive(WCET(3)), Deadline(35), Priority(1)),
+        Task(
+            MinimumSeparationVector([20, 45 + i % 7, 70]),
+            FullyPreemptive(WCET(4 + i % 3)),
+            Deadline(20),
+            Priority(2),
+        ),
+        Task(Periodic(30), FullyPreemptive(WCET(5)), Deadline(30 + i), Priority(0)),
+    )
+
+
+def test_batch_matches_sequential_analyses() -> None:
+    supply = RateDelayModel(period=10, allocation=8, delay=2)
+    jobs: list[JobLike] = [
+        Job(candidate(0), "fp", IdealProcessor()),
+        (candidate(1), "edf", supply),
+        (candidate(2), "fifo", supply, 1_000),
+        Job(candidate(3), "fp", supply, horizon=10),
+    ] * 5
+
+    reported: list[int] = []
+    results = list(
+        rta_batch(jobs, max_workers=2, chunk_size=3, progress=reported.append)
+    )
+
+    assert len(results) == len(jobs)
+    for i in range(0, len(jobs), 4):
+        assert results[i] == fp.rta_all(candidate(0), IdealProcessor())
+        assert results[i + 1] == edf.rta_all(candidate(1), supply)
+        assert results[i + 2] == fifo.rta_all(candidate(2), supply, 1_000)
+        assert results[i + 3] == fp.rta_all(candidate(3), supply, 10)
+    assert reported == [3, 6, 9, 12, 15, 18, 20]
+
+
+def test_batch_keeps_a_bounded_window_on_unbounded_jobs() -> None:
+    drawn = 0
+
+    def jobs() -> Iterator[Job]:
+        nonlocal drawn
+        for i in count():
+            drawn += 1
+            yield Job(candidate(i % 10), "edf", IdealProcessor())
+
+    with ThreadPoolExecutor(2) as pool:
+        results = rta_batch(jobs(), chunk_size=4, max_chunks_in_flight=3, executor=pool)
+        first = list(islice(results, 10))
+        results.close()
+
+    assert first == [edf.rta_all(candidate(i), IdealProcessor()) for i in range(10)]
+    # the three chunks yielded so far plus three chunks in flight
+    assert drawn == (3 + 3) * 4
+
+
+def test_batch_rejects_unknown_policies() -> None:
+    jobs = [(candidate(0), "rm", IdealProcessor())]
+    with (
+        ThreadPoolExecutor(1) as pool,
+        pytest.raises(ValueError, match="unknown scheduling policy"),
+    ):
+        _ = list(rta_batch(jobs, executor=pool))  # pyright: ignore[reportArgumentType]
+
+
+@pytest.mark.parametrize("policy", ["fp", "edf", "fifo"])
+def test_shared_analysis_matches_per_task_rta(policy: Policy) -> None:
+    ts = candidate(4)
+    supply = RateDelayModel(period=10, allocation=8, delay=2)
+
+    solutions = rta_all_shared(ts, supply, policy, max_workers=2)
+
+    if policy == "fifo":
+        assert solutions == fifo.rta_all(ts, supply)
+    else:
+        analysis = fp.rta if policy == "fp" else edf.rta
+        assert solutions == tuple(analysis(ts, t, supply) for t in ts)
+    assert all(s.taskset is ts for s in solutions)
@@ -0,0 +1,70 @@
+import math
+from collections.abc import Iterator
+from typing import cast
+
+import pytest
+
+from response_time_analysis.model import (
+    WCET,
+    ArrivalCurvePrefix,
+    Deadline,
+    DemandBoundFunction,
+    MinimumSeparationVector,
+    Never,
+    Once,
+    Periodic,
+    PeriodicWithJitter,
+    RequestBoundFunction,
+    Sporadic,
+    StepBound,
+    evaluate_many,
+    total,
+    vectorized,
+)
+
+DELTAS = list(range(-3, 400)) + [10**6 + 7, 10**9]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    name = cast(str, request.param)
+    if name == "numpy":
+        if not vectorized.have_numpy():
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(vectorized, "np", None)
+    return name
+
+
+def step_bounds() -> Iterator[StepBound]:
+    yield Periodic(period=7)
+    yield PeriodicWithJitter(period=10, jitter=13)
+    yield Sporadic(mit=4)
+    yield MinimumSeparationVector(dmin=[2, 5, 9, 14, 20, 26])
+    yield ArrivalCurvePrefix(horizon=100, ac_steps=[(1, 1), (21, 2), (51, 3), (91, 4)])
+    yield ArrivalCurvePrefix(horizon=math.inf, ac_steps=[(1, 2), (30, 3)])
+    yield Once()
+    yield Never()
+    yield RequestBoundFunction(WCET(3), PeriodicWithJitter(period=25, jitter=4))
+    yield DemandBoundFunction(
+        RequestBoundFunction(WCET(2), Sporadic(mit=6)), Deadline(5)
+    )
+    yield total(Periodic(period=5), MinimumSeparationVector(dmin=[3, 8]))
+
+
+@pytest.mark.parametrize("bound", list(step_bounds()), ids=repr)
+def test_batch_evaluation_matches_pointwise_evaluation(
+    backend: str, bound: StepBound
+) -> None:
+    assert backend == ("numpy" if vectorized.have_numpy() else "python")
+
+    expected = [bound(delta) for delta in DELTAS]
+
+    assert list(evaluate_many(bound, DELTAS)) == expected
+
+
+def test_batch_evaluation_accepts_empty_input(backend: str) -> None:
+    assert backend in ("numpy", "python")
+
+    for bound in step_bounds():
+        assert len(evaluate_many(bound, [])) == 0
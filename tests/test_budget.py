@@ -0,0 +1,186 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Timer
+from time import sleep
+from typing import TYPE_CHECKING, final
+
+import pytest
+
+from response_time_analysis.analysis import (
+    BUDGET_POLL_INTERVAL,
+    Budget,
+    BudgetExhausted,
+    Solution,
+    edf,
+    fifo,
+    fp,
+    parallel,
+    solve,
+    solve_in_chunks,
+)
+from response_time_analysis.model import (
+    WCET,
+    Deadline,
+    Duration,
+    FullyPreemptive,
+    MinimumSeparationVector,
+    Periodic,
+    Priority,
+    RateDelayModel,
+    Task,
+    taskset,
+)
+
+if TYPE_CHECKING:
+    from typing import override
+else:
+    try:
+        from typing import override
+    except ImportError:  # Python < 3.12
+
+        def override(method):
+            return method
+
+
+@final
+class CheckLimit(Budget):
+    "A budget that is exhausted after a fixed number of checks."
+
+    def __init__(self, checks: int):
+        super().__init__()
+        self.checks_left: int = checks
+
+    @override
+    def check(self) -> None:
+        self.checks_left -= 1
+        if self.checks_left < 0:
+            raise BudgetExhausted()
+
+
+TS = taskset(
+    Task(Periodic(40), FullyPreemptive(WCET(3)), Deadline(35), Priority(1)),
+    Task(
+        MinimumSeparationVector([20, 45, 70]),
+        FullyPreemptive(WCET(4)),
+        Deadline(20),
+        Priority(3),
+    ),
+    Task(Periodic(30), FullyPreemptive(WCET(5)), Deadline(30), Priority(2)),
+    Task(Periodic(50), FullyPreemptive(WCET(14)), Deadline(50), Priority(0)),
+)
+SUPPLY = RateDelayModel(period=10, allocation=8, delay=3)
+
+
+def test_budget() -> None:
+    assert Budget().remaining() is None
+    assert not Budget(60).exhausted()
+    assert Budget(0).exhausted()
+
+    budget = Budget()
+    budget.check()
+    budget.cancel()
+    assert budget.remaining() == 0.0
+    with pytest.raises(BudgetExhausted):
+        budget.check()
+
+
+def test_solver_checks_budget() -> None:
+    with pytest.raises(BudgetExhausted):
+        _ = solve.stepped_inequality(
+            lhs=lambda x: 100,
+            rhs=lambda x: x,
+            rhs_inverse=lambda y: y,
+            budget=Budget(0),
+        )
+    with pytest.raises(BudgetExhausted):
+        _ = solve.inequality(lhs=lambda x: 100, budget=Budget(0))
+    assert (
+        solve.stepped_inequality(
+            lhs=lambda x: 100, rhs=lambda x: x, rhs_inverse=lambda y: y, budget=Budget()
+        )
+        == 100
+    )
+
+
+def test_expired_budget() -> None:
+    tua = TS.tasks[3]
+    for sol in (
+        fp.rta(TS, tua, SUPPLY, budget=Budget(0)),
+        edf.rta(TS, tua, SUPPLY, budget=Budget(0)),
+        fifo.rta(TS, SUPPLY, budget=Budget(0)),
+    ):
+        assert sol.budget_exhausted
+        assert not sol.bound_found()
+        assert sol.busy_window_bound is None
+
+    assert all(s.budget_exhausted for s in fp.rta_all(TS, SUPPLY, budget=Budget(0)))
+    assert all(s.budget_exhausted for s in edf.rta_all(TS, SUPPLY, budget=Budget(0)))
+    assert all(s.budget_exhausted for s in fifo.rta_all(TS, SUPPLY, budget=Budget(0)))
+
+
+@pytest.mark.parametrize("analysis", [fp.rta, edf.rta])
+def test_partial_progress(analysis: Callable[..., Solution]) -> None:
+    tua = TS.tasks[3]
+    full = analysis(TS, tua, SUPPLY, budget=Budget())
+    assert not full.budget_exhausted
+    assert full.search_space is not None and len(full.search_space) > 1
+
+    seen_partial = False
+    for checks in range(200):
+        sol = analysis(TS, tua, SUPPLY, budget=CheckLimit(checks))
+        if not sol.budget_exhausted:
+            assert sol == full
+            break
+        assert sol.response_time_bound is None
+        if sol.search_space is not None:
+            # the offsets solved so far, in order
+            assert sol.busy_window_bound == full.busy_window_bound
+            assert sol.search_space == full.search_space[: len(sol.search_space)]
+            seen_partial = seen_partial or len(sol.search_space) > 0
+    else:
+        pytest.fail("analysis did not complete within the budget")
+    assert seen_partial
+
+
+def test_cancellation_from_another_thread() -> None:
+    # The demand rate equals the supply rate, but the supply is delayed, so the
+    # busy window is unbounded and, without a horizon, the analysis runs until it
+    # is cancelled.
+    ts = taskset(
+        Task(Periodic(10), FullyPreemptive(WCET(8)), Deadline(10), Priority(1))
+    )
+    budget = Budget()
+    timer = Timer(0.05, budget.cancel)
+    timer.start()
+    try:
+        sol = fp.rta(ts, ts.tasks[0], SUPPLY, budget=budget)
+    finally:
+        timer.cancel()
+    assert sol.budget_exhausted
+
+
+def test_chunked_and_threaded_analyses_share_the_budget() -> None:
+    budget = Budget()
+    budget.cancel()
+    with ThreadPoolExecutor(2) as pool:
+        sol = edf.rta(
+            TS, TS.tasks[3], SUPPLY, executor=pool, chunk_size=1, budget=budget
+        )
+    assert sol.budget_exhausted
+
+    solutions = parallel.rta_all(TS, SUPPLY, "fp", budget=budget)
+    assert all(s.budget_exhausted for s in solutions)
+
+
+def test_chunked_solve_outlasts_budget_polls() -> None:
+    def slow_square(
+        offsets: tuple[Duration, ...],
+    ) -> tuple[tuple[Duration, Duration | None, Duration | None], ...]:
+        sleep(3 * BUDGET_POLL_INTERVAL)
+        return tuple((A, A * A, None) for A in offsets)
+
+    with ThreadPoolExecutor(1) as pool:
+        solved = list(
+            solve_in_chunks(pool, slow_square, (), (1, 2, 3), 2, budget=Budget(60))
+        )
+    assert solved == [(1, 1, None), (2, 4, None), (3, 9, None)]
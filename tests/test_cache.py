@@ -0,0 +1,155 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from response_time_analysis.analysis import Budget, edf, fifo, fp
+from response_time_analysis.analysis.cache import SolutionCache
+from response_time_analysis.analysis.parallel import Policy
+from response_time_analysis.model import (
+    WCET,
+    ArrivalCurvePrefix,
+    Deadline,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    MinimumSeparationVector,
+    Periodic,
+    Priority,
+    RateDelayModel,
+    Task,
+    TaskSet,
+    taskset,
+)
+
+SUPPLY = RateDelayModel(period=10, allocation=8, delay=3)
+
+
+def candidate(i: int) -> TaskSet:
+    return taskset(
+        Task(Periodic(40 + i), FullyNonPreemptive(WCET(3)), Deadline(35), Priority(1)),
+        Task(
+            MinimumSeparationVector([20, 45, 70]),
+            FullyPreemptive(WCET(4)),
+            Deadline(20),
+            Priority(3),
+        ),
+        Task(
+            ArrivalCurvePrefix(100, [(1, 1), (30, 2)]),
+            FullyPreemptive(WCET(5)),
+            Deadline(30),
+            Priority(2),
+        ),
+    )
+
+
+def fail(*_args: object, **_kwargs: object) -> None:
+    raise AssertionError("the solver must not be called on a cache hit")
+
+
+def test_hits_do_not_touch_the_solver(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ts = candidate(0)
+    with SolutionCache(tmp_path / "rta.db") as cache:
+        expected = {
+            "fp": fp.rta_all(ts, SUPPLY),
+            "edf": edf.rta_all(ts, SUPPLY),
+            "fifo": fifo.rta_all(ts, SUPPLY),
+        }
+        assert cache.rta_all(ts, SUPPLY, "fp") == expected["fp"]
+        assert cache.rta_all(ts, SUPPLY, "edf") == expected["edf"]
+        for tua, solution in zip(ts, expected["fifo"]):
+            assert cache.rta(ts, tua, SUPPLY, "fifo") == solution
+        assert len(cache) == 9
+
+    for name in ("rta", "rta_all"):
+        for module in (fp, edf, fifo):
+            monkeypatch.setattr(module, name, fail)
+
+    # an equal copy of the task set hits as well
+    copy = taskset(list(ts))
+    with SolutionCache(tmp_path / "rta.db") as cache:
+        policies: list[Policy] = ["fp", "edf", "fifo"]
+        for policy in policies:
+            hits = cache.rta_all(copy, SUPPLY, policy)
+            assert hits == expected[policy]
+            assert all(s.taskset is copy for s in hits)
+            assert cache.rta(copy, copy.tasks[1], SUPPLY, policy) == hits[1]
+
+
+def test_keys_distinguish_analyses(tmp_path: Path) -> None:
+    ts = candidate(0)
+    with SolutionCache(tmp_path / "rta.db", version="1") as cache:
+        keys = {
+            cache.key(ts, ts.tasks[0], SUPPLY, "fp"),
+            cache.key(ts, ts.tasks[1], SUPPLY, "fp"),
+            cache.key(ts, ts.tasks[0], SUPPLY, "edf"),
+            cache.key(ts, ts.tasks[0], SUPPLY, "fp", horizon=1_000),
+            cache.key(ts, ts.tasks[0], SUPPLY, "fp", use_poet_search_space=True),
+            cache.key(candidate(1), candidate(1).tasks[0], SUPPLY, "fp"),
+            cache.key(ts, ts.tasks[0], RateDelayModel(10, 8, 2), "fp"),
+        }
+        assert len(keys) == 7
+        key = cache.key(ts, ts.tasks[0], SUPPLY, "fp")
+    with SolutionCache(tmp_path / "rta.db", version="2") as cache:
+        assert cache.key(ts, ts.tasks[0], SUPPLY, "fp") != key
+
+
+def test_least_recently_used_results_are_evicted(tmp_path: Path) -> None:
+    with SolutionCache(tmp_path / "rta.db", max_entries=2) as cache:
+        sets = [candidate(i) for i in range(3)]
+        keys = [cache.key(ts, ts.tasks[0], SUPPLY, "fp") for ts in sets]
+        _ = cache.rta(sets[0], sets[0].tasks[0], SUPPLY, "fp")
+        _ = cache.rta(sets[1], sets[1].tasks[0], SUPPLY, "fp")
+        # touch the first result, so that the second one is evicted next
+        assert cache.get(keys[0], sets[0], sets[0].tasks[0]) is not None
+        _ = cache.rta(sets[2], sets[2].tasks[0], SUPPLY, "fp")
+        assert len(cache) == 2
+        assert cache.get(keys[0], sets[0], sets[0].tasks[0]) is not None
+        assert cache.get(keys[1], sets[1], sets[1].tasks[0]) is None
+        assert cache.get(keys[2], sets[2], sets[2].tasks[0]) is not None
+
+
+def test_the_running_count_tracks_the_stored_results(tmp_path: Path) -> None:
+    ts = candidate(0)
+    with SolutionCache(tmp_path / "rta.db", max_entries=2) as cache:
+        key = cache.key(ts, ts.tasks[0], SUPPLY, "fp")
+        solution = fp.rta(ts, ts.tasks[0], SUPPLY)
+        cache.put(key, solution)
+        # replacing a result neither counts nor evicts anything
+        cache.put(key, solution)
+        assert len(cache) == 1
+        _ = cache.rta_all(ts, SUPPLY, "fp")
+        assert len(cache) == 2
+    with SolutionCache(tmp_path / "rta.db", max_entries=2) as cache:
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get(key, ts, ts.tasks[0]) is None
+
+
+def test_exhausted_solutions_are_not_stored(tmp_path: Path) -> None:
+    ts = candidate(0)
+    with SolutionCache(tmp_path / "rta.db") as cache:
+        key = cache.key(ts, ts.tasks[0], SUPPLY, "fp")
+        cache.put(key, fp.rta(ts, ts.tasks[0], SUPPLY, budget=Budget(0)))
+        assert len(cache) == 0
+
+
+def analyze_with_cache(path: Path, i: int) -> int:
+    with SolutionCache(path) as cache:
+        ts = candidate(i % 5)
+        return sum(s.response_time_bound or 0 for s in cache.rta_all(ts, SUPPLY, "edf"))
+
+
+def test_concurrent_processes_share_the_cache(tmp_path: Path) -> None:
+    path = tmp_path / "rta.db"
+    with ProcessPoolExecutor(4) as pool:
+        results = list(pool.map(analyze_with_cache, [path] * 40, range(40)))
+    expected = [
+        sum(s.response_time_bound or 0 for s in edf.rta_all(candidate(i % 5), SUPPLY))
+        for i in range(40)
+    ]
+    assert results == expected
+    with SolutionCache(path) as cache:
+        assert len(cache) == 5 * 3
@@ -0,0 +1,79 @@
+import pickle
+from math import inf
+from typing import cast
+
+import pytest
+
+from response_time_analysis.model import (
+    WCET,
+    ArrivalCurvePrefix,
+    Deadline,
+    FloatingNonPreemptive,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    LimitedPreemptive,
+    MinimumSeparationVector,
+    Never,
+    Once,
+    Periodic,
+    PeriodicWithJitter,
+    Priority,
+    Sporadic,
+    Task,
+    taskset,
+)
+from response_time_analysis.model.packed import (
+    SharedTaskSet,
+    SharedTaskSetHandle,
+    pack,
+    unpack,
+)
+
+TS = taskset(
+    Task(
+        ArrivalCurvePrefix(inf, [(1, 1), (10, 2), (30, 3)]),
+        LimitedPreemptive(WCET(5), 3, 2),
+        Deadline(50),
+        Priority(2),
+    ),
+    Task(ArrivalCurvePrefix(100, [(1, 2), (50, 3)]), FullyPreemptive(WCET(1))),
+    Task(
+        MinimumSeparationVector([5, 12, 30]),
+        FloatingNonPreemptive(WCET(3), 2),
+        None,
+        Priority(1),
+    ),
+    Task(PeriodicWithJitter(40, 3), FullyNonPreemptive(WCET(2)), Deadline(40)),
+    Task(Sporadic(60), FullyPreemptive(WCET(2)), Deadline(60), Priority(0)),
+    Task(Periodic(100), FullyPreemptive(WCET(1)), Deadline(60), Priority(3)),
+    Task(Once(), FullyPreemptive(WCET(1))),
+    Task(Never(), FullyPreemptive(WCET(1))),
+)
+
+
+def test_pack_round_trip() -> None:
+    assert unpack(pack(TS)) == TS
+    assert unpack(memoryview(pack(TS))) == TS
+    assert unpack(pack(taskset())) == taskset()
+
+
+def test_unpack_ignores_trailing_bytes() -> None:
+    assert unpack(pack(TS) + bytes(4096)) == TS
+
+
+def test_unpack_rejects_other_formats() -> None:
+    data = bytearray(pack(TS))
+    data[0] = 99
+    with pytest.raises(ValueError, match="unsupported packed task set format"):
+        _ = unpack(bytes(data))
+
+
+def test_shared_task_set() -> None:
+    with SharedTaskSet(TS) as shared:
+        handle = cast(SharedTaskSetHandle, pickle.loads(pickle.dumps(shared.handle)))
+        assert isinstance(handle, SharedTaskSetHandle)
+        assert len(pickle.dumps(handle)) < 200
+        attached = handle.attach()
+        assert attached == TS
+        # attached once per process
+        assert handle.attach() is attached
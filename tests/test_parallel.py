@@ -0,0 +1,158 @@
+import pickle
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Barrier
+from typing import TypeVar, cast
+
+import pytest
+
+from response_time_analysis.analysis import edf, fifo, fp, parallel
+from response_time_analysis.model import (
+    WCET,
+    ArrivalCurvePrefix,
+    Deadline,
+    FullyNonPreemptive,
+    FullyPreemptive,
+    IdealProcessor,
+    MinimumSeparationVector,
+    Periodic,
+    Priority,
+    RateDelayModel,
+    Task,
+    taskset,
+    total,
+)
+
+THREADS = 8
+
+A = TypeVar("A", bound=Hashable)
+R = TypeVar("R")
+
+
+def run_concurrently(fn: Callable[[A], R], args: Sequence[A]) -> dict[A, R]:
+    "Run fn on all args in THREADS threads that start at the same time."
+    barrier = Barrier(THREADS)
+
+    def worker(chunk: Sequence[A]) -> list[R]:
+        _ = barrier.wait()
+        return [fn(a) for a in chunk]
+
+    chunks = [args[i::THREADS] for i in range(THREADS)]
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(worker, chunks))
+    return {a: r for chunk, res in zip(chunks, results) for a, r in zip(chunk, res)}
+
+
+def test_delta_min_extension_is_thread_safe() -> None:
+    dmin = [3, 11, 19, 25, 40, 41, 60, 61, 95, 100]
+    shared = MinimumSeparationVector(dmin)
+    deltas = list(range(0, 20_000, 7))
+
+    results = run_concurrently(shared.max_arrivals, deltas)
+    reference = MinimumSeparationVector(dmin)
+    assert results == {d: reference.max_arrivals(d) for d in deltas}
+
+    gaps = run_concurrently(shared.min_gap_between, list(range(500)))
+    assert gaps == {n: reference.min_gap_between(n) for n in range(500)}
+
+
+def test_compiled_total_is_thread_safe() -> None:
+    parts = [
+        Task(MinimumSeparationVector([5, 13, 17]), FullyPreemptive(WCET(2))).rbf,
+        Task(Periodic(7), FullyPreemptive(WCET(1))).rbf,
+        Task(ArrivalCurvePrefix(40, [(1, 1), (9, 2)]), FullyPreemptive(WCET(3))).rbf,
+    ]
+    shared = total(parts).compile()
+    deltas = list(range(0, 5_000, 3))
+
+    results = run_concurrently(shared, deltas)
+    assert results == {d: total(parts)(d) for d in deltas}
+
+
+def test_extended_delta_min_vectors_can_be_pickled() -> None:
+    am = MinimumSeparationVector([3, 11, 19, 25, 40, 41, 60])
+    assert am.max_arrivals(10_000) > 0
+
+    copy = cast(MinimumSeparationVector, pickle.loads(pickle.dumps(am)))
+    assert copy == am
+    assert copy.max_arrivals(10**9) == am.max_arrivals(10**9)
+
+
+@pytest.mark.parametrize(
+    "supply", [IdealProcessor(), RateDelayModel(period=10, allocation=8, delay=3)]
+)
+def test_parallel_rta_all_matches_per_task_rta(
+    supply: IdealProcessor | RateDelayModel,
+) -> None:
+    ts = taskset(
+        Task(Periodic(40), FullyNonPreemptive(WCET(3)), Deadline(35), Priority(1)),
+        Task(
+            MinimumSeparationVector([20, 45, 70]),
+            FullyPreemptive(WCET(4)),
+            Deadline(20),
+            Priority(3),
+        ),
+        Task(Periodic(30), FullyNonPreemptive(WCET(5)), Deadline(30), Priority(2)),
+        Task(Periodic(60), FullyPreemptive(WCET(2)), Deadline(50), Priority(0)),
+    )
+
+    assert parallel.rta_all(ts, supply, "fp", max_workers=4) == tuple(
+        fp.rta(ts, t, supply) for t in ts
+    )
+    assert parallel.rta_all(ts, supply, "edf", max_workers=4) == tuple(
+        edf.rta(ts, t, supply) for t in ts
+    )
+    assert parallel.rta_all(ts, supply, "fifo") == fifo.rta_all(ts, supply)
+
+    with pytest.raises(ValueError, match="unknown scheduling policy"):
+        _ = parallel.rta_all(ts, supply, "rm")  # pyright: ignore[reportArgumentType]
+
+
+@pytest.mark.parametrize(
+    "supply,use_poet_search_space",
+    [
+        (RateDelayModel(period=10, allocation=9, delay=4), False),
+        (IdealProcessor(), False),
+        # POET search spaces are supported only on ideal processors
+        (IdealProcessor(), True),
+    ],
+)
+def test_chunked_search_space_matches_serial_rta(
+    supply: IdealProcessor | RateDelayModel, use_poet_search_space: bool
+) -> None:
+    ts = taskset(
+        Task(
+            ArrivalCurvePrefix(200, [(1, 1), (30, 2), (70, 4)]),
+            FullyNonPreemptive(WCET(3)),
+            Deadline(90),
+            Priority(1),
+        ),
+        Task(
+            ArrivalCurvePrefix(100, [(1, 1), (45, 2)]),
+            FullyPreemptive(WCET(9)),
+            Deadline(60),
+            Priority(2),
+        ),
+        Task(
+            ArrivalCurvePrefix(300, [(1, 2), (150, 3)]),
+            FullyPreemptive(WCET(20)),
+            Deadline(250),
+            Priority(0),
+        ),
+    )
+
+    with ProcessPoolExecutor(2) as processes, ThreadPoolExecutor(3) as threads:
+        for analysis in (fp.rta, edf.rta):
+            for tua in ts:
+                serial = analysis(ts, tua, supply, None, use_poet_search_space)
+                for executor, chunk_size in ((processes, 2), (threads, None)):
+                    chunked = analysis(
+                        ts,
+                        tua,
+                        supply,
+                        None,
+                        use_poet_search_space,
+                        executor=executor,
+                        chunk_size=chunk_size,
+                    )
+                    assert chunked == serial
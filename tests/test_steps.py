@@ -11,12 +11,14 @@ from response_time_analysis.model import (
     Duration,
     FullyNonPreemptive,
     MinimumSeparationVector,
+    Never,
     Periodic,
     PeriodicWithJitter,
     RequestBoundFunction,
     Sporadic,
     StepBound,
     Task,
+    deadline_of,
     taskset,
     total,
 )
@@ -126,3 +128,81 @@ def test_edf_blocking_bound_steps_match_bruteforce() -> None:
                 yield_succ=True,
             )
         )
+
+
+def test_total_steps_with_values_track_cumulative_bound() -> None:
+    combined = total(
+        RequestBoundFunction(WCET(2), Periodic(period=5)),
+        RequestBoundFunction(WCET(3), PeriodicWithJitter(period=7, jitter=2)),
+        DemandBoundFunction(
+            RequestBoundFunction(WCET(1), Sporadic(mit=4)), Deadline(6)
+        ),
+        MinimumSeparationVector(dmin=[2, 5, 9]),
+    )
+    limit = 120
+
+    pairs = list(takewhile(lambda sv: sv[0] <= limit, combined.steps_with_values()))
+
+    assert [delta for delta, _ in pairs] == steps_up_to(combined, limit=limit)
+    for delta, value in pairs:
+        assert value == combined(delta + 1)
+
+
+def test_compiled_total_matches_total() -> None:
+    combined = total(
+        RequestBoundFunction(WCET(2), Periodic(period=5)),
+        RequestBoundFunction(WCET(3), ArrivalCurvePrefix(100, [(1, 2), (31, 3)])),
+        RequestBoundFunction(WCET(1), Sporadic(mit=40)),
+    )
+
+    eager = combined.compile(200)
+    assert eager.compiled_up_to is not None and eager.compiled_up_to >= 200
+    lazy = combined.compile()
+
+    for delta in list(range(-2, 450)) + [10**9, 10**12]:
+        assert eager(delta) == combined(delta)
+        assert lazy(delta) == combined(delta)
+    # far-away queries are answered directly rather than tabulated
+    assert lazy.compiled_up_to is not None and lazy.compiled_up_to < 10**6
+
+
+def test_edf_blocking_bound_function_matches_scan_and_is_cached() -> None:
+    tasks = taskset(
+        Task(Periodic(100), FullyNonPreemptive(WCET(7)), Deadline(50)),
+        Task(Periodic(100), FullyNonPreemptive(WCET(4)), Deadline(80)),
+        Task(Periodic(100), FullyNonPreemptive(WCET(9)), Deadline(80)),
+        Task(Never(), FullyNonPreemptive(WCET(30)), Deadline(200)),
+        Task(Periodic(100), FullyNonPreemptive(WCET(2)), Deadline(120)),
+    )
+
+    for t in tasks:
+        bb = edf.blocking_bound_function(tasks, t)
+        for offset in range(200):
+            reference = deadline_of(t).value + offset
+            expected = max(
+                (
+                    o.execution.max_non_preemptive_segment - 1
+                    for o in tasks
+                    if deadline_of(o).value > reference and o.rbf(1) > 0
+                ),
+                default=0,
+            )
+            assert bb(offset) == expected == edf.blocking_bound(tasks, t, offset)
+
+    # the table is shared by all tasks under analysis of the same task set
+    first = edf.blocking_bound_function(tasks, tasks.tasks[0])
+    second = edf.blocking_bound_function(tasks, tasks.tasks[1])
+    assert first.deadlines is second.deadlines
+    assert list(second.steps()) == [40]
+
+    # equal, but distinct, task sets get their own tables, which evict the
+    # least recently used ones
+    others = [taskset(tasks.tasks) for _ in range(edf.BLOCKING_CACHE_SIZE)]
+    for ts in others:
+        assert edf.blocking_bound_function(ts, ts.tasks[0]) == first
+    assert edf.blocking_bound_function(others[-1], tasks.tasks[0]).deadlines is (
+        edf.blocking_bound_function(others[-1], tasks.tasks[1]).deadlines
+    )
+    assert edf.blocking_bound_function(tasks, tasks.tasks[0]).deadlines is not (
+        first.deadlines
+    )
@@ -41,3 +41,28 @@ def test_rate_delay_model_validates_parameters() -> None:
 
     with pytest.raises(ValueError):
         _ = RateDelayModel(period=1, allocation=1, delay=-1)
+
+
+def test_supply_inverse_is_least_delta_providing_work() -> None:
+    for supply in (
+        IdealProcessor(),
+        IdealProcessor(speed=3),
+        RateDelayModel(period=10, allocation=7, delay=2),
+        RateDelayModel(period=100, allocation=90, delay=25),
+    ):
+        for work in range(-2, 200):
+            delta = supply.supply_inverse(work)
+            assert supply(delta) >= work
+            assert delta == 0 or supply(delta - 1) < work
+
+
+def test_supply_rate_deficit_and_surplus_bound_supply() -> None:
+    for supply in (
+        IdealProcessor(speed=2),
+        RateDelayModel(period=10, allocation=7, delay=2),
+        RateDelayModel(period=100, allocation=90, delay=25),
+    ):
+        rate = supply.long_term_rate()
+        deficit, surplus = supply.supply_deficit(), supply.supply_surplus()
+        for delta in range(1000):
+            assert rate * delta - deficit <= supply(delta) <= rate * delta + surplus
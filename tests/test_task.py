@@ -1,12 +1,27 @@
+import subprocess
+import sys
+from dataclasses import replace
+from functools import lru_cache
+
 import pytest
 
 from response_time_analysis.model import (
     WCET,
+    ArrivalCurvePrefix,
+    Deadline,
+    FullyNonPreemptive,
     FullyPreemptive,
+    IdealProcessor,
+    MinimumSeparationVector,
+    Never,
     Periodic,
+    Priority,
+    RateDelayModel,
     Task,
+    TaskSet,
     deadline_of,
     prio_of,
+    taskset,
 )
 
 
@@ -22,3 +37,150 @@ def test_priority_missing_raises_value_error() -> None:
 
     with pytest.raises(ValueError, match="priority parameter missing"):
         _ = prio_of(task)
+
+
+def test_derived_bounds_are_cached_per_instance() -> None:
+    task = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(8))
+    twin = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(8))
+    ts = taskset(task, twin)
+
+    assert task.rbf is task.rbf
+    assert task.dbf is task.dbf
+    assert ts.rbf is ts.rbf
+    assert ts.dbf is ts.dbf
+    assert ts.max_arrivals is ts.max_arrivals
+    assert ts.rbf.parts == (task.rbf, twin.rbf)
+
+    # the caches do not affect equality or the representation
+    assert task == twin
+    assert repr(task) == repr(twin)
+    assert ts == taskset(twin, task)
+
+    with pytest.raises(ValueError, match="deadline parameter missing"):
+        _ = taskset(Task(Periodic(10), FullyPreemptive(WCET(1)))).dbf
+
+
+def test_priority_and_deadline_filters_use_sorted_indexes() -> None:
+    a = Task(Periodic(10), FullyNonPreemptive(WCET(4)), Deadline(30), Priority(3))
+    b = Task(Periodic(20), FullyPreemptive(WCET(2)), Deadline(10), Priority(1))
+    c = Task(Periodic(30), FullyNonPreemptive(WCET(6)), Deadline(20), Priority(2))
+    d = Task(Never(), FullyNonPreemptive(WCET(9)), Deadline(40), Priority(1))
+    ts = taskset(a, b, c, d)
+
+    assert ts.with_priority_higher_than(b).tasks == (c, a)
+    assert ts.with_priority_higher_than_or_equal_to(c).tasks == (c, a)
+    assert ts.with_priority_higher_than_or_equal_to_excluding(c).tasks == (a,)
+    assert ts.with_priority_lower_than(Priority(3)).tasks == (b, d, c)
+    assert list(ts.with_priority_lower_than_iter(c)) == [b, d]
+    assert ts.with_deadline_at_most(c).tasks == (b, c)
+    assert list(ts.with_deadline_greater_than_iter(Deadline(20))) == [a, d]
+
+    # the same threshold yields the same task set, so its derived caches are reused
+    hep = ts.with_priority_higher_than_or_equal_to(c)
+    assert ts.with_priority_higher_than(b) is hep
+    assert ts.with_priority_higher_than_or_equal_to(Priority(2)) is hep
+    assert ts.with_priority_higher_than_or_equal_to_excluding(c) is (
+        ts.with_priority_higher_than_or_equal_to_excluding(c)
+    )
+    assert ts.with_priority_lower_than(a) is ts.with_priority_lower_than(a)
+    assert ts.with_deadline_at_most(c) is ts.with_deadline_at_most(Deadline(29))
+    assert ts.with_deadline_greater_than(b) is ts.with_deadline_greater_than(b)
+    assert ts.with_deadline_greater_than(b).tasks == (c, a, d)
+
+    assert ts.max_non_preemptive_segment_with_priority_lower_than(a) == 9
+    assert ts.max_non_preemptive_segment_with_priority_lower_than(b) is None
+    assert ts.max_non_preemptive_segment_with_deadline_greater_than(b) == 9
+    active = ts.with_workload
+    assert active.tasks == (a, b, c)
+    assert active.max_non_preemptive_segment_with_deadline_greater_than(b) == 6
+    assert ts.max_non_preemptive_segment_with_deadline_greater_than(d) is None
+
+
+def test_exclusion_removes_exactly_one_task() -> None:
+    task = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(10), Priority(1))
+    twin = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(10), Priority(1))
+    other = Task(Periodic(5), FullyPreemptive(WCET(1)), Deadline(5), Priority(2))
+    ts = taskset(task, other, twin)
+
+    assert ts.index_of(twin) == 2
+    assert ts.index_of(other) == 1
+    # an equal task that is not a member is found by equality
+    assert ts.index_of(replace(twin)) == 0
+    with pytest.raises(ValueError, match="task not in task set"):
+        _ = ts.index_of(replace(other, priority=Priority(3)))
+
+    assert ts.excluding(twin).tasks == (task, other)
+    assert ts.excluding(twin).tasks[0] is task
+    assert list(ts.excluding_iter(task)) == [other, twin]
+    assert ts.with_priority_higher_than_or_equal_to_excluding(twin).tasks == (
+        task,
+        other,
+    )
+    assert ts.excluding(replace(other, priority=Priority(3))) is ts
+
+    same = taskset(task, task)
+    assert same.excluding(task).tasks == (task,)
+    assert same.with_priority_higher_than_or_equal_to_excluding(task).tasks == (task,)
+
+
+def test_tasks_and_task_sets_are_hashable() -> None:
+    msv = Task(MinimumSeparationVector([3, 8, 15]), FullyNonPreemptive(WCET(2)))
+    acp = Task(ArrivalCurvePrefix(50, [(1, 1), (10, 2)]), FullyPreemptive(WCET(1)))
+    ts = taskset(msv, acp)
+
+    assert msv.arrivals == MinimumSeparationVector((3, 8, 15))
+    assert hash(msv) == hash(replace(msv))
+    assert {ts: 1}[taskset(msv, acp)] == 1
+
+    @lru_cache
+    def job_count(ts: TaskSet) -> int:
+        return len(ts)
+
+    assert job_count(ts) == job_count(taskset(msv, acp)) == 2
+    assert job_count.cache_info().hits == 1
+
+
+FINGERPRINT_SCRIPT = """
+from response_time_analysis.model import *
+msv = MinimumSeparationVector([3, 8, 15])
+acp = ArrivalCurvePrefix(50, [(1, 1), (10, 2)])
+ts = taskset(
+    Task(msv, FullyNonPreemptive(WCET(2)), Deadline(9)),
+    Task(acp, FullyPreemptive(WCET(1))),
+)
+print(ts.fingerprint(), RateDelayModel(10, 7, 2).fingerprint())
+"""
+
+
+def test_fingerprints_are_canonical_and_stable_across_processes() -> None:
+    a = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(8), Priority(1))
+    b = Task(Periodic(10), FullyPreemptive(WCET(2)), Deadline(9), Priority(1))
+
+    assert a.fingerprint() == replace(a).fingerprint()
+    assert a.fingerprint() != b.fingerprint()
+    assert taskset(a, b).fingerprint() == taskset([a, b]).fingerprint()
+    assert taskset(a, b).fingerprint() != taskset(b, a).fingerprint()
+    assert IdealProcessor().fingerprint() == IdealProcessor(speed=1).fingerprint()
+    assert IdealProcessor().fingerprint() != IdealProcessor(speed=2).fingerprint()
+
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", FINGERPRINT_SCRIPT],
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": ":".join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+    msv = MinimumSeparationVector((3, 8, 15))
+    acp = ArrivalCurvePrefix(50, ((1, 1), (10, 2)))
+    ts = taskset(
+        Task(msv, FullyNonPreemptive(WCET(2)), Deadline(9)),
+        Task(acp, FullyPreemptive(WCET(1))),
+    )
+    assert outputs.pop().split() == [
+        ts.fingerprint(),
+        RateDelayModel(10, 7, 2).fingerprint(),
+    ]